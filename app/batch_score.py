@@ -0,0 +1,167 @@
+"""Score a CSV of student budget profiles with the Calculator logic.
+
+    python app/batch_score.py profiles.csv results.parquet --workers 4
+
+The input is read in chunks, each chunk is scored with NumPy in a worker
+process, and results are written in input order to CSV or Parquet (by the
+output file's extension; Parquet output keeps the input columns as text, so
+every chunk has the same schema). Required columns: wage, rent, utilities, food,
+transport, phone_internet, misc_basic. Optional: weeks_per_month, hours_mon_fri,
+hours_sat, hours_sun, sunday_multiplier, stipend (Calculator defaults apply).
+Rows with a blank or non-numeric required value, or a non-numeric optional one,
+are written with empty results and counted in the summary.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from engine import POINT_COLUMNS, RESULT_COLUMNS, score_profiles
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+class CsvSink:
+    def __init__(self, path: str):
+        self.path = path
+        self.header = True
+
+    def write(self, frame: pd.DataFrame) -> None:
+        frame.to_csv(self.path, mode="w" if self.header else "a", header=self.header, index=False)
+        self.header = False
+
+    def close(self) -> None:
+        if self.header:
+            open(self.path, "w").close()
+
+
+def output_schema(columns, pa):
+    """One Parquet schema for every chunk: input columns as text, results with fixed types.
+
+    Taken from the first chunk's types instead, a later chunk with text in a
+    numeric column, or a first chunk with an all-blank column, would not fit.
+    """
+    def column_type(name):
+        if name in POINT_COLUMNS:
+            return pa.int64()
+        if name == "status":
+            return pa.string()
+        if name in RESULT_COLUMNS:
+            return pa.float64()
+        return pa.string()
+
+    return pa.schema([(name, column_type(name)) for name in columns])
+
+
+class ParquetSink:
+    def __init__(self, path: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.writer = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        pa = self.pa
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, output_schema(frame.columns, pa))
+        schema = self.writer.schema
+        arrays = [pa.array(frame[f.name], from_pandas=True).cast(f.type) for f in schema]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_sink(path: str):
+    if path.lower().endswith(".parquet"):
+        return ParquetSink(path)
+    return CsvSink(path)
+
+
+def run(in_path: str, out_path: str, workers: int, chunksize: int, progress=None) -> tuple[int, int, float]:
+    """Score every row of `in_path` into `out_path`; returns (rows, invalid rows, seconds).
+
+    If scoring or writing fails, the partly written `out_path` is removed.
+    """
+    start = time.perf_counter()
+    rows = invalid = 0
+    sink = open_sink(out_path)
+    reader = pd.read_csv(in_path, chunksize=chunksize)
+    finished = False
+
+    try:
+        if workers <= 1:
+            for chunk in reader:
+                done = score_profiles(chunk)
+                sink.write(done)
+                rows += len(done)
+                invalid += int(done["status"].isna().sum())
+                if progress:
+                    progress(rows, time.perf_counter() - start)
+        else:
+            # at most two chunks per worker in flight, so memory stays bounded on huge inputs
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in reader:
+                    pending.append(pool.submit(score_profiles, chunk))
+                    if len(pending) >= 2 * workers:
+                        done = pending.popleft().result()
+                        sink.write(done)
+                        rows += len(done)
+                        invalid += int(done["status"].isna().sum())
+                        if progress:
+                            progress(rows, time.perf_counter() - start)
+                while pending:
+                    done = pending.popleft().result()
+                    sink.write(done)
+                    rows += len(done)
+                    invalid += int(done["status"].isna().sum())
+                    if progress:
+                        progress(rows, time.perf_counter() - start)
+        finished = True
+    finally:
+        sink.close()
+        if not finished:
+            try:
+                os.remove(out_path)
+            except OSError:
+                pass
+    return rows, invalid, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Score student budget profiles with the Calculator logic.")
+    parser.add_argument("input", help="CSV of profiles")
+    parser.add_argument("output", help="results file (.csv or .parquet)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 = score in this process)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk")
+    parser.add_argument("--quiet", action="store_true", help="only print the final summary")
+    args = parser.parse_args(argv)
+
+    def progress(rows: int, seconds: float) -> None:
+        print(f"\r{rows:,} rows  ({rows / max(seconds, 1e-9):,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+    try:
+        rows, invalid, seconds = run(args.input, args.output, max(args.workers, 1), args.chunksize, None if args.quiet else progress)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Scored {rows:,} profiles in {seconds:.2f}s ({rows / max(seconds, 1e-9):,.0f} rows/s) -> {args.output}")
+    if invalid:
+        print(f"warning: {invalid:,} rows had a missing or non-numeric value and were left unscored", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+from .backends import BACKENDS, CompareQuery, CompareResult, get_backend
+from .compare import compare_tables
+from .columnar import convert_to_parquet, parquet_index, parquet_path_for, read_costs_parquet
+from .loader import (
+    DERIVED_COLUMNS,
+    EXPENSE_COLUMNS,
+    INCOME_COLUMNS,
+    REQUIRED_COLUMNS,
+    CostDataset,
+    DatasetError,
+    Fingerprint,
+    add_derived_columns,
+    clear_cache,
+    file_fingerprint,
+    load_cost_dataset,
+    shared_datasets,
+)
+from .memory import frame_bytes, memory_report, track_slice
+from .partitions import Partition, is_partitioned, list_partitions, partition_index, read_partitions, write_partitions
+from .rollup import (
+    COUNT_COLUMNS,
+    SUM_COLUMNS,
+    RollupState,
+    compare_tables_from_rollup,
+    load_rollup,
+    merge_rollups,
+    refresh_rollup,
+    rollup_frame,
+    rollup_index,
+    rollup_path_for,
+)
+from .source import cost_index, is_parquet, query_costs, resolve_source
+
+__all__ = [
+    "BACKENDS",
+    "COUNT_COLUMNS",
+    "DERIVED_COLUMNS",
+    "EXPENSE_COLUMNS",
+    "INCOME_COLUMNS",
+    "REQUIRED_COLUMNS",
+    "SUM_COLUMNS",
+    "CompareQuery",
+    "CompareResult",
+    "CostDataset",
+    "DatasetError",
+    "Fingerprint",
+    "Partition",
+    "RollupState",
+    "add_derived_columns",
+    "clear_cache",
+    "compare_tables",
+    "compare_tables_from_rollup",
+    "convert_to_parquet",
+    "cost_index",
+    "file_fingerprint",
+    "frame_bytes",
+    "get_backend",
+    "is_parquet",
+    "is_partitioned",
+    "list_partitions",
+    "load_cost_dataset",
+    "load_rollup",
+    "memory_report",
+    "merge_rollups",
+    "parquet_index",
+    "parquet_path_for",
+    "partition_index",
+    "query_costs",
+    "read_costs_parquet",
+    "read_partitions",
+    "refresh_rollup",
+    "resolve_source",
+    "rollup_frame",
+    "rollup_index",
+    "rollup_path_for",
+    "shared_datasets",
+    "track_slice",
+    "write_partitions",
+]
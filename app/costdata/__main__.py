@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from .columnar import DEFAULT_ROW_GROUP_SIZE, convert_to_parquet
+from .partitions import write_partitions
+from .rollup import refresh_rollup, rollup_path_for
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m costdata", description="Maintenance commands for the student cost data.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert a cost CSV into sorted, row-grouped Parquet.")
+    convert.add_argument("csv_path")
+    convert.add_argument("out_path", nargs="?", default=None)
+    convert.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+
+    rollup = commands.add_parser("rollup", help="Build or incrementally update the city x month rollup of a cost CSV.")
+    rollup.add_argument("csv_path")
+
+    partition = commands.add_parser("partition", help="Split a cost CSV into city=.../year=... folders, one file per city and year.")
+    partition.add_argument("csv_path")
+    partition.add_argument("out_dir")
+    partition.add_argument("--format", choices=["csv", "parquet"], default="csv")
+
+    args = parser.parse_args(argv)
+    if args.command == "convert":
+        out = convert_to_parquet(args.csv_path, args.out_path, args.row_group_size)
+        print(f"Wrote {out}")
+    elif args.command == "rollup":
+        state = refresh_rollup(args.csv_path)
+        print(f"Wrote {rollup_path_for(state.fingerprint.path)} ({len(state.cells):,} cells, {state.consumed_bytes:,} bytes covered)")
+    elif args.command == "partition":
+        written, skipped = write_partitions(args.csv_path, args.out_dir, args.format)
+        print(f"Wrote {written:,} files under {args.out_dir}")
+        if skipped:
+            print(f"Skipped {skipped:,} rows with no city or a month that is not YYYY-MM", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
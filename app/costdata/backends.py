@@ -0,0 +1,276 @@
+"""Interchangeable engines for City Compare's filter -> derive -> aggregate pipeline.
+
+Choose one with STUDENT_DASHBOARD_BACKEND=pandas|polars|duckdb (default pandas).
+Polars and DuckDB are optional and imported on first use. They run the whole
+pipeline in their own multithreaded columnar engines, over the Parquet file,
+the shared in-memory snapshot of a CSV or the pruned partitions of a data
+directory, and hand back only the small result tables as pandas. Every backend
+returns the same tables as `compare_tables`.
+"""
+import importlib
+import os
+import threading
+from dataclasses import dataclass
+
+import pandas as pd
+
+from engine import financial_health_score_batch
+
+from .compare import add_city_health, compare_tables
+from .loader import EXPENSE_COLUMNS, INCOME_COLUMNS, DatasetError, Fingerprint, load_cost_dataset
+from .partitions import is_partitioned, read_partitions
+from .source import is_parquet, query_costs
+
+BACKENDS = ("pandas", "polars", "duckdb")
+DEFAULT_BACKEND = os.environ.get("STUDENT_DASHBOARD_BACKEND", "pandas")
+
+RAW_COLUMNS = ["city", "month", *INCOME_COLUMNS, *EXPENSE_COLUMNS]
+SLICE_COLUMNS = ["city", "month", "month_dt", "total_income", "total_expenses", "balance", *EXPENSE_COLUMNS]
+SCORE_INPUTS = ["total_income", "total_expenses", "rent", "balance"]  # financial_health_score_batch's arguments
+SUMMARY_COLUMNS = ["city", "avg_income", "avg_expenses", "avg_balance", "months", "avg_rent", "avg_row_score", "savings_rate", "health_score"]
+
+
+@dataclass(frozen=True)
+class CompareQuery:
+    cities: tuple
+    start_dt: pd.Timestamp
+    end_dt: pd.Timestamp
+
+
+@dataclass(frozen=True)
+class CompareResult:
+    summary: pd.DataFrame
+    trend: pd.DataFrame
+    exp_mix: pd.DataFrame
+    rows: pd.DataFrame | None = None  # the filtered rows, for backends that materialize them in pandas
+
+    @property
+    def empty(self) -> bool:
+        return self.summary.empty
+
+
+def _optional(module: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise DatasetError(f"The {module} data backend needs {module} (pip install {module}).") from exc
+
+
+def _empty_result(rows: pd.DataFrame | None = None) -> CompareResult:
+    return CompareResult(
+        summary=pd.DataFrame(columns=SUMMARY_COLUMNS),
+        trend=pd.DataFrame(columns=["month_dt", "city", "balance"]),
+        exp_mix=pd.DataFrame(columns=["city", *EXPENSE_COLUMNS]),
+        rows=rows,
+    )
+
+
+def _partition_rows(source: str, query: CompareQuery) -> pd.DataFrame:
+    # only the partitions matching the query are opened; the engine filters their rows
+    rows = read_partitions(source, query.cities, query.start_dt.strftime("%Y-%m"), query.end_dt.strftime("%Y-%m"))
+    return rows[RAW_COLUMNS]
+
+
+def _finish(summary: pd.DataFrame, trend: pd.DataFrame, exp_mix: pd.DataFrame) -> CompareResult:
+    if summary.empty:
+        return _empty_result()
+    summary = add_city_health(summary.reset_index(drop=True))
+    trend = trend.reset_index(drop=True)
+    trend["month_dt"] = trend["month_dt"].astype("datetime64[ns]")
+    return CompareResult(summary=summary, trend=trend, exp_mix=exp_mix.reset_index(drop=True))
+
+
+class PandasBackend:
+    name = "pandas"
+
+    def compare(self, source: str, query: CompareQuery) -> CompareResult:
+        filt = query_costs(source, query.cities, query.start_dt, query.end_dt, SLICE_COLUMNS)
+        if filt.empty:
+            return _empty_result(filt)
+        summary, trend, exp_mix = compare_tables(filt)
+        return CompareResult(summary=summary, trend=trend, exp_mix=exp_mix, rows=filt)
+
+
+class PolarsBackend:
+    name = "polars"
+
+    def __init__(self):
+        self.pl = _optional("polars")
+        self._frames: dict[str, tuple[Fingerprint, object]] = {}
+        self._lock = threading.Lock()
+
+    def _scan(self, source: str):
+        pl = self.pl
+        if is_parquet(source):
+            return pl.scan_parquet(source).select(RAW_COLUMNS)
+
+        # one Polars copy of the shared CSV snapshot per file version
+        dataset = load_cost_dataset(source)
+        fp = dataset.fingerprint
+        with self._lock:
+            cached = self._frames.get(fp.path)
+            if cached is None or cached[0] != fp:
+                cached = (fp, pl.from_pandas(dataset.data[RAW_COLUMNS]))
+                self._frames[fp.path] = cached
+        return cached[1].lazy()
+
+    def _row_score(self):
+        # financial_health_score_batch itself over whole columns: re-deriving its rules as Polars
+        # expressions rounds differently at the .5 boundaries. Elementwise, so batching is safe.
+        pl = self.pl
+
+        def score(batch):
+            cols = batch.struct.unnest()
+            return pl.Series(financial_health_score_batch(*(cols[c].to_numpy() for c in SCORE_INPUTS))["score"].to_numpy())
+
+        return pl.struct(SCORE_INPUTS).map_batches(score, return_dtype=pl.Int64, is_elementwise=True)
+
+    def compare(self, source: str, query: CompareQuery) -> CompareResult:
+        pl = self.pl
+        if is_partitioned(source):
+            pruned = _partition_rows(source, query)
+            if pruned.empty:
+                return _empty_result()
+            scan = pl.from_pandas(pruned).lazy()
+        else:
+            try:
+                scan = self._scan(source)
+            except OSError as exc:
+                raise DatasetError(f"Could not read {source}. Make sure the file exists.") from exc
+
+        rows = (
+            scan.filter(pl.col("city").is_in(list(query.cities)))
+            .with_columns(
+                month_dt=pl.col("month").str.strptime(pl.Datetime("ns"), "%Y-%m", strict=False),
+                total_income=pl.col(INCOME_COLUMNS[0]).cast(pl.Float64) + pl.col(INCOME_COLUMNS[1]),
+                total_expenses=pl.sum_horizontal(EXPENSE_COLUMNS).cast(pl.Float64),
+            )
+            .filter(pl.col("month_dt").is_between(query.start_dt, query.end_dt))
+            .with_columns(balance=pl.col("total_income") - pl.col("total_expenses"))
+            .with_columns(row_score=self._row_score())
+        )
+        summary = (
+            rows.group_by("city")
+            .agg(
+                avg_income=pl.col("total_income").mean(),
+                avg_expenses=pl.col("total_expenses").mean(),
+                avg_balance=pl.col("balance").mean(),
+                months=pl.col("month").n_unique(),
+                avg_rent=pl.col("rent").mean(),
+                avg_row_score=pl.col("row_score").mean(),
+            )
+            .with_columns(
+                savings_rate=pl.when(pl.col("avg_income") != 0).then(pl.col("avg_balance") / pl.col("avg_income")).otherwise(0.0)
+            )
+            .sort("city")
+        )
+        trend = rows.group_by(["month_dt", "city"]).agg(balance=pl.col("balance").mean()).sort(["month_dt", "city"])
+        exp_mix = rows.group_by("city").agg(pl.col(EXPENSE_COLUMNS).sum()).sort("city")
+
+        # one plan: the shared scan/filter/derive runs once for all three tables
+        summary, trend, exp_mix = pl.collect_all([summary, trend, exp_mix])
+        return _finish(summary.to_pandas(), trend.to_pandas(), exp_mix.to_pandas())
+
+
+_DUCKDB_ROWS = f"""
+WITH derived AS (
+    SELECT
+        city,
+        month,
+        try_strptime(month, '%Y-%m') AS month_dt,
+        CAST({INCOME_COLUMNS[0]} AS DOUBLE) + {INCOME_COLUMNS[1]} AS total_income,
+        CAST({" + ".join(f"coalesce({c}, 0)" for c in EXPENSE_COLUMNS)} AS DOUBLE) AS total_expenses,
+        {", ".join(EXPENSE_COLUMNS)}
+    FROM costs_raw
+    WHERE city IN (SELECT unnest($cities))
+),
+filt AS (
+    SELECT *, total_income - total_expenses AS balance
+    FROM derived
+    WHERE month_dt BETWEEN $start_dt AND $end_dt
+),
+scored AS (
+    -- financial_health_score_batch, rule for rule (round_even matches np.rint)
+    SELECT *,
+        CASE WHEN total_income > 0 THEN least(greatest(
+            (CASE WHEN balance > 0 THEN 40 ELSE 0 END)
+            + round_even(least(greatest(25 * (0.60::DOUBLE - rent / total_income) / (0.60::DOUBLE - 0.35::DOUBLE), 0), 25), 0)
+            + round_even(least(greatest(20 * ((balance / total_income) / 0.10::DOUBLE), 0), 20), 0)
+            + round_even(least(greatest(15 * (CASE WHEN total_expenses > 0 THEN balance / total_expenses ELSE 0 END), 0), 15), 0),
+        0), 100) ELSE 0 END AS row_score
+    FROM filt
+)
+"""
+
+_DUCKDB_BY_CITY = _DUCKDB_ROWS + f"""
+SELECT
+    city,
+    avg(total_income) AS avg_income,
+    avg(total_expenses) AS avg_expenses,
+    avg(balance) AS avg_balance,
+    count(DISTINCT month) AS months,
+    avg(rent) AS avg_rent,
+    avg(row_score) AS avg_row_score,
+    CASE WHEN avg(total_income) <> 0 THEN avg(balance) / avg(total_income) ELSE 0 END AS savings_rate,
+    {", ".join(f"coalesce(sum({c}), 0) AS {c}" for c in EXPENSE_COLUMNS)}
+FROM scored
+GROUP BY city
+ORDER BY city
+"""
+
+_DUCKDB_TREND = _DUCKDB_ROWS + """
+SELECT month_dt, city, avg(balance) AS balance
+FROM filt
+GROUP BY month_dt, city
+ORDER BY month_dt, city
+"""
+
+
+class DuckDBBackend:
+    name = "duckdb"
+
+    def __init__(self):
+        self.duckdb = _optional("duckdb")
+        self._con = self.duckdb.connect()
+
+    def compare(self, source: str, query: CompareQuery) -> CompareResult:
+        pruned = _partition_rows(source, query) if is_partitioned(source) else None
+        if pruned is not None and pruned.empty:
+            return _empty_result()
+        con = self._con.cursor()  # a connection must not be shared between threads; cursors are cheap
+        try:
+            if pruned is not None:
+                con.register("costs_raw", pruned)
+            elif is_parquet(source):
+                con.register("costs_raw", con.read_parquet(source))
+            else:
+                con.register("costs_raw", load_cost_dataset(source).data)  # scanned in place, no copy
+            params = {"cities": list(query.cities), "start_dt": query.start_dt.to_pydatetime(), "end_dt": query.end_dt.to_pydatetime()}
+            by_city = con.execute(_DUCKDB_BY_CITY, params).df()
+            trend = con.execute(_DUCKDB_TREND, params).df()
+        except self.duckdb.IOException as exc:
+            raise DatasetError(f"Could not read {source}: {exc}") from exc
+        finally:
+            con.close()
+
+        summary = by_city[SUMMARY_COLUMNS[:-1]]
+        exp_mix = by_city[["city", *EXPENSE_COLUMNS]]
+        return _finish(summary, trend, exp_mix)
+
+
+_BACKEND_CLASSES = {"pandas": PandasBackend, "polars": PolarsBackend, "duckdb": DuckDBBackend}
+_backends: dict[str, object] = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name: str | None = None):
+    """The shared backend instance for `name` (default: STUDENT_DASHBOARD_BACKEND, else pandas)."""
+    name = (name or DEFAULT_BACKEND).strip().lower()
+    if name not in _BACKEND_CLASSES:
+        raise DatasetError(f"Unknown data backend {name!r}. Choose one of: {', '.join(BACKENDS)}.")
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            backend = _BACKEND_CLASSES[name]()
+            _backends[name] = backend
+        return backend
@@ -0,0 +1,100 @@
+"""Parquet storage for the cost table.
+
+Convert once with `python -m costdata convert data/student_costs.csv` (run from app/).
+Rows are written sorted by (city, month) so the row-group min/max statistics let
+the reader skip every group outside the selected cities and month range.
+"""
+import os
+import threading
+
+import pandas as pd
+
+from .loader import DERIVED_COLUMNS, REQUIRED_COLUMNS, DatasetError, Fingerprint, add_derived_columns, file_fingerprint
+
+DEFAULT_ROW_GROUP_SIZE = 50_000
+
+_index_cache: dict[str, tuple[Fingerprint, tuple, tuple]] = {}
+_index_lock = threading.Lock()
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise DatasetError("Reading Parquet cost files needs pyarrow (pip install pyarrow).") from exc
+    return pa, pq
+
+
+def parquet_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def convert_to_parquet(csv_path: str, out_path: str | None = None, row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> str:
+    pa, pq = _pyarrow()
+    out_path = out_path or parquet_path_for(csv_path)
+
+    data = pd.read_csv(csv_path)
+    missing = REQUIRED_COLUMNS - set(data.columns)
+    if missing:
+        raise DatasetError(f"Your CSV is missing these columns: {sorted(list(missing))}")
+
+    data["city"] = data["city"].astype("string")
+    data["month"] = data["month"].astype("string")
+    data = data.sort_values(["city", "month"], kind="stable", ignore_index=True)
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    tmp_path = out_path + ".tmp"
+    pq.write_table(table, tmp_path, row_group_size=row_group_size, use_dictionary=["city", "month"], write_statistics=True)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def parquet_index(path: str) -> tuple[tuple, tuple]:
+    """Sorted city and month lists, read from the two key columns only."""
+    _, pq = _pyarrow()
+    fp = file_fingerprint(path)
+    cached = _index_cache.get(fp.path)
+    if cached is not None and cached[0] == fp:
+        return cached[1], cached[2]
+
+    table = pq.read_table(fp.path, columns=["city", "month"], memory_map=True)
+    cities = tuple(sorted(v for v in table.column("city").unique().to_pylist() if v is not None))
+    months_sorted = tuple(sorted(v for v in table.column("month").unique().to_pylist() if v is not None))
+    with _index_lock:
+        _index_cache[fp.path] = (fp, cities, months_sorted)
+    return cities, months_sorted
+
+
+def read_costs_parquet(path: str, cities=None, start_month: str | None = None, end_month: str | None = None, columns=None) -> pd.DataFrame:
+    """Read the cost columns (plus any extra raw `columns`) from the row groups matching the city/month filters.
+
+    Every derived column needs all of the cost columns, so those are always read;
+    other columns in the file are skipped unless asked for. Rows without a city
+    are dropped, as no city filter can match them.
+    """
+    _, pq = _pyarrow()
+    filters = []
+    if cities is not None:
+        filters.append(("city", "in", list(cities)))
+    if start_month is not None:
+        filters.append(("month", ">=", str(start_month)))
+    if end_month is not None:
+        filters.append(("month", "<=", str(end_month)))
+
+    read_columns = sorted(REQUIRED_COLUMNS | set(columns or []))
+    try:
+        table = pq.read_table(path, columns=read_columns, filters=filters or None, memory_map=True)
+    except Exception as exc:
+        raise DatasetError(f"Could not read {path}: {exc}") from exc
+
+    data = table.to_pandas()
+    if data["city"].isna().any():
+        data = data[data["city"].notna()].reset_index(drop=True)
+    # astype(str) alone would turn a null into the text "None" on older pandas
+    data["city"] = data["city"].astype(str)
+    data["month"] = data["month"].astype(str).where(data["month"].notna())
+    if data.empty:
+        return data.reindex(columns=[*data.columns, *DERIVED_COLUMNS])
+    return add_derived_columns(data)
+
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from engine import financial_health_score_batch
+
+from .loader import EXPENSE_COLUMNS
+
+
+def add_city_health(summary: pd.DataFrame) -> pd.DataFrame:
+    """Health score of each city's average month (needs avg_income, avg_expenses, avg_rent, avg_balance)."""
+    health = financial_health_score_batch(summary["avg_income"], summary["avg_expenses"], summary["avg_rent"], summary["avg_balance"])
+    summary["health_score"] = health["score"]
+    return summary
+
+
+def compare_tables(filt: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """City Compare's (summary, trend, exp_mix) tables from filtered rows."""
+    row_scores = financial_health_score_batch(filt["total_income"], filt["total_expenses"], filt["rent"], filt["balance"])["score"]
+    summary = (
+        filt.assign(row_score=row_scores)
+        .groupby("city", as_index=False)
+        .agg(
+            avg_income=("total_income", "mean"),
+            avg_expenses=("total_expenses", "mean"),
+            avg_balance=("balance", "mean"),
+            months=("month", "nunique"),
+            avg_rent=("rent", "mean"),
+            avg_row_score=("row_score", "mean"),
+        )
+    )
+    summary["savings_rate"] = (summary["avg_balance"] / summary["avg_income"]).where(summary["avg_income"] != 0, 0.0)
+    summary = add_city_health(summary)
+
+    trend = filt.groupby(["month_dt", "city"], as_index=False).agg(balance=("balance", "mean")).sort_values(["month_dt", "city"])
+    exp_mix = filt.groupby("city", as_index=False)[EXPENSE_COLUMNS].sum()
+    return summary, trend, exp_mix
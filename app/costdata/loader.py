@@ -0,0 +1,152 @@
+import os
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine import financial_status_batch
+
+INCOME_COLUMNS = ["campus_job_income", "stipend_income"]
+EXPENSE_COLUMNS = ["rent", "utilities", "food", "transport", "phone_internet", "misc_basic"]
+REQUIRED_COLUMNS = {"city", "month", *INCOME_COLUMNS, *EXPENSE_COLUMNS}
+DERIVED_COLUMNS = ["month_dt", "total_income", "total_expenses", "balance", "status"]
+
+
+class DatasetError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    path: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class CostDataset:
+    """A cost table sorted by (city, month), with the row range of every city.
+
+    City i (the i-th of `cities`) owns rows city_bounds[i]:city_bounds[i + 1] of
+    `data`, ordered by month_dt (NaT last); rows without a city come after all
+    of them. `month_keys` is the month_dt column as a NumPy array.
+    """
+    fingerprint: Fingerprint
+    data: pd.DataFrame
+    cities: tuple
+    months_sorted: tuple
+    nbytes: int
+    city_bounds: np.ndarray
+    month_keys: np.ndarray
+
+    @classmethod
+    def from_frame(cls, fingerprint: Fingerprint, data: pd.DataFrame) -> "CostDataset":
+        """Index a frame that already has the derived columns."""
+        cities = tuple(sorted(data["city"].dropna().unique().tolist()))
+        codes = pd.Categorical(data["city"], categories=cities).codes.astype(np.int64)
+        codes[codes < 0] = len(cities)
+        order = np.lexsort((data["month_dt"].to_numpy(), codes))
+        data = data.take(order).reset_index(drop=True)
+
+        return cls(
+            fingerprint=fingerprint,
+            data=data,
+            cities=cities,
+            months_sorted=tuple(sorted(data["month"].dropna().unique().tolist())),
+            nbytes=int(data.memory_usage(deep=True).sum()),
+            city_bounds=np.searchsorted(codes[order], np.arange(len(cities) + 1)),
+            month_keys=data["month_dt"].to_numpy(),
+        )
+
+    def positions(self, cities, start_dt, end_dt) -> np.ndarray:
+        """Row positions for `cities` with month_dt in [start_dt, end_dt], in (city, month) order.
+
+        Two binary searches inside each selected city's block, so the cost grows
+        with the number of matching rows rather than with the table.
+        """
+        lookup = dict(zip(self.cities, range(len(self.cities))))
+        codes = sorted({lookup[c] for c in cities if c in lookup})
+        lo_key = np.datetime64(pd.Timestamp(start_dt)).astype(self.month_keys.dtype)
+        hi_key = np.datetime64(pd.Timestamp(end_dt)).astype(self.month_keys.dtype)
+
+        ranges = []
+        for code in codes:
+            lo, hi = self.city_bounds[code], self.city_bounds[code + 1]
+            block = self.month_keys[lo:hi]
+            ranges.append(np.arange(lo + block.searchsorted(lo_key, "left"), lo + block.searchsorted(hi_key, "right")))
+        return np.concatenate(ranges) if ranges else np.zeros(0, dtype=np.int64)
+
+    def select(self, cities, start_dt, end_dt, columns) -> pd.DataFrame:
+        """Rows for `cities` with month_dt in [start_dt, end_dt], restricted to `columns`."""
+        return self.data.iloc[self.positions(cities, start_dt, end_dt), self.data.columns.get_indexer(list(columns))]
+
+
+_cache: dict[str, CostDataset] = {}
+_cache_lock = threading.Lock()
+
+
+def file_fingerprint(path: str) -> Fingerprint:
+    full = os.path.abspath(path)
+    st = os.stat(full)
+    return Fingerprint(path=full, mtime_ns=st.st_mtime_ns, size=st.st_size)
+
+
+def add_derived_columns(data: pd.DataFrame) -> pd.DataFrame:
+    missing = REQUIRED_COLUMNS - set(data.columns)
+    if missing:
+        raise DatasetError(f"Your CSV is missing these columns: {sorted(list(missing))}")
+
+    data["month_dt"] = pd.to_datetime(data["month"], format="%Y-%m", errors="coerce")
+    if data["month_dt"].isna().all():
+        raise DatasetError("Month parsing failed. Ensure month column is YYYY-MM (example: 2026-01).")
+
+    data["total_income"] = data[INCOME_COLUMNS[0]] + data[INCOME_COLUMNS[1]]
+    data["total_expenses"] = data[EXPENSE_COLUMNS].sum(axis=1)
+    data["balance"] = data["total_income"] - data["total_expenses"]
+    data["status"] = financial_status_batch(data["balance"])
+    return data
+
+
+def _build_dataset(fp: Fingerprint, read) -> CostDataset:
+    try:
+        data = read(fp.path)
+    except Exception as exc:
+        raise DatasetError(f"Could not read {fp.path}: {exc}") from exc
+
+    return CostDataset.from_frame(fp, add_derived_columns(data))
+
+
+def load_cost_dataset(path: str) -> CostDataset:
+    """Return the cached snapshot for `path`, reloading only when the file's mtime or size changes.
+
+    One snapshot per path is kept for the whole process and shared by every session;
+    slices of `data` never write through to it because pandas 3 copies on write
+    (hence the pandas>=3 requirement).
+    """
+    try:
+        fp = file_fingerprint(path)
+    except OSError as exc:
+        raise DatasetError(f"Could not read {path}. Make sure the file exists.") from exc
+
+    cached = _cache.get(fp.path)
+    if cached is not None and cached.fingerprint == fp:
+        return cached
+
+    with _cache_lock:
+        cached = _cache.get(fp.path)
+        if cached is not None and cached.fingerprint == fp:
+            return cached
+        dataset = _build_dataset(fp, pd.read_csv)
+        _cache[fp.path] = dataset
+        return dataset
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def shared_datasets() -> list[CostDataset]:
+    with _cache_lock:
+        return list(_cache.values())
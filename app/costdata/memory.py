@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pandas as pd
+
+from .loader import shared_datasets
+from .partitions import cached_partition_files
+
+SLICE_TTL_SECONDS = 30 * 60
+
+_slices: dict[str, tuple[int, int, float]] = {}
+_slices_lock = threading.Lock()
+
+
+def frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(deep=True).sum())
+
+
+def track_slice(session_key: str, frame: pd.DataFrame) -> int:
+    """Record the size of the slice a session is currently holding (replaces its previous one)."""
+    nbytes = frame_bytes(frame)
+    now = time.monotonic()
+    with _slices_lock:
+        _slices[session_key] = (nbytes, len(frame), now)
+        for key in [k for k, (_, _, ts) in _slices.items() if now - ts > SLICE_TTL_SECONDS]:
+            del _slices[key]
+    return nbytes
+
+
+def memory_report() -> dict:
+    datasets = [*shared_datasets(), *cached_partition_files()]
+    with _slices_lock:
+        slices = dict(_slices)
+
+    shared_bytes = sum(ds.nbytes for ds in datasets)
+    slice_bytes = sum(b for b, _, _ in slices.values())
+    return {
+        "shared_bytes": shared_bytes,
+        "shared_rows": sum(len(ds.data) for ds in datasets),
+        "shared_files": [ds.fingerprint.path for ds in datasets],
+        "sessions": len(slices),
+        "session_slice_bytes": slice_bytes,
+        "session_slice_rows": sum(r for _, r, _ in slices.values()),
+        "largest_slice_bytes": max((b for b, _, _ in slices.values()), default=0),
+        # what the same sessions would hold if each had loaded its own copy of the file
+        "unshared_equivalent_bytes": shared_bytes * len(slices) + slice_bytes,
+    }
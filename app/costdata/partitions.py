@@ -0,0 +1,201 @@
+"""A cost table split into a directory of partitions, one folder per city and year.
+
+    data/costs/city=Austin/year=2025/part-0.csv
+    data/costs/city=Austin/year=2026/part-0.parquet
+    data/costs/city=Boston/year=2026/part-0.csv
+
+Folder names are `key=value` (Hive style; values are percent-encoded). The city
+and month lists come from the folder names alone: a `year=` partition stands for
+its twelve months, and an optional `month=YYYY-MM` level below it narrows that
+down. A query opens only the files under partitions matching its cities and
+months, so a new city's files are never read for a query about other cities.
+Files hold the usual cost columns; `city` may be left out, it is then taken from
+the folder. Parsed files are kept in an LRU bounded by PARTITION_CACHE_BYTES, so
+memory follows the partitions in recent use rather than every one ever queried.
+Write a layout from one CSV with `python -m costdata partition`.
+"""
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from .columnar import _pyarrow
+from .loader import DERIVED_COLUMNS, REQUIRED_COLUMNS, CostDataset, DatasetError, _build_dataset, file_fingerprint
+
+DATA_SUFFIXES = (".csv", ".parquet")
+PARTITION_CACHE_BYTES = 512 * 1024 * 1024
+
+_files: OrderedDict[str, CostDataset] = OrderedDict()  # path -> parsed file, least recently used first
+_files_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Partition:
+    city: str
+    months: tuple  # YYYY-MM strings covered by this folder
+    files: tuple
+
+
+def is_partitioned(path: str) -> bool:
+    return os.path.isdir(path)
+
+
+def _key_value(name: str) -> tuple[str, str] | None:
+    key, sep, value = name.partition("=")
+    return (key, unquote(value)) if sep and value else None
+
+
+def _months(keys: dict) -> tuple | None:
+    month = keys.get("month")
+    year = keys.get("year")
+    if month is not None:
+        if len(month) <= 2 and year is not None:  # month=03 under year=2026
+            month = f"{year}-{int(month):02d}"
+        return (month,) if pd.notna(pd.to_datetime(month, format="%Y-%m", errors="coerce")) else None
+    if year is not None and year.isdigit():
+        return tuple(f"{year}-{m:02d}" for m in range(1, 13))
+    return None
+
+
+def _walk(folder: str, keys: dict, out: list) -> None:
+    files, subdirs = [], []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.startswith((".", "_")):
+                continue
+            if entry.is_dir():
+                subdirs.append(entry)
+            elif entry.name.lower().endswith(DATA_SUFFIXES):
+                files.append(entry.path)
+
+    if files and "city" in keys:
+        months = _months(keys)
+        if months is not None:
+            out.append(Partition(city=keys["city"], months=months, files=tuple(sorted(files))))
+    for entry in sorted(subdirs, key=lambda e: e.name):
+        kv = _key_value(entry.name)
+        if kv is not None:
+            _walk(entry.path, {**keys, kv[0]: kv[1]}, out)
+
+
+def list_partitions(root: str) -> list[Partition]:
+    """Every city/month partition under `root` that holds data files, from folder names only."""
+    out: list[Partition] = []
+    try:
+        _walk(root, {}, out)
+    except OSError as exc:
+        raise DatasetError(f"Could not read {root}. Make sure the folder exists.") from exc
+    return out
+
+
+def partition_index(root: str) -> tuple[tuple, tuple]:
+    """Sorted cities and YYYY-MM months available under `root`, without opening any file."""
+    partitions = list_partitions(root)
+    if not partitions:
+        raise DatasetError(f"No city=.../year=... partitions with .csv or .parquet files found in {root}.")
+    cities = tuple(sorted({p.city for p in partitions}))
+    months_sorted = tuple(sorted({m for p in partitions for m in p.months}))
+    return cities, months_sorted
+
+
+def _read_raw(path: str, city: str) -> pd.DataFrame:
+    if path.lower().endswith(".parquet"):
+        _, pq = _pyarrow()
+        data = pq.read_table(path, memory_map=True).to_pandas()
+    else:
+        data = pd.read_csv(path)
+    if "city" not in data.columns:
+        data.insert(0, "city", city)
+    data["city"] = data["city"].astype(str)
+    data["month"] = data["month"].astype(str)
+    return data
+
+
+def _load_file(path: str, city: str) -> CostDataset:
+    """Parsed partition file, reused while its fingerprint holds and it stays in the LRU."""
+    try:
+        fp = file_fingerprint(path)
+    except OSError as exc:
+        raise DatasetError(f"Could not read {path}. Make sure the file exists.") from exc
+
+    with _files_lock:
+        cached = _files.get(fp.path)
+        if cached is not None and cached.fingerprint == fp:
+            _files.move_to_end(fp.path)
+            return cached
+
+    # parse outside the lock; two sessions racing on the same file just parse it twice
+    dataset = _build_dataset(fp, partial(_read_raw, city=city))
+    with _files_lock:
+        _files[fp.path] = dataset
+        _files.move_to_end(fp.path)
+        total = sum(ds.nbytes for ds in _files.values())
+        while total > PARTITION_CACHE_BYTES and len(_files) > 1:
+            _, evicted = _files.popitem(last=False)
+            total -= evicted.nbytes
+    return dataset
+
+
+def cached_partition_files() -> list[CostDataset]:
+    with _files_lock:
+        return list(_files.values())
+
+
+def read_partitions(root: str, cities=None, start_month: str | None = None, end_month: str | None = None) -> pd.DataFrame:
+    """Rows from the partitions matching the city/month filters, with derived columns added.
+
+    Partitions are pruned on their folder names before any file is opened; the
+    rows of the files that are read still go through the caller's own filter.
+    Each file is parsed once per version and kept in the partition LRU.
+    """
+    wanted = None if cities is None else set(cities)
+    frames = []
+    for part in list_partitions(root):
+        if wanted is not None and part.city not in wanted:
+            continue
+        if start_month is not None and part.months[-1] < start_month:
+            continue
+        if end_month is not None and part.months[0] > end_month:
+            continue
+        frames.extend(_load_file(path, part.city).data for path in part.files)
+
+    if not frames:
+        return pd.DataFrame(columns=[*sorted(REQUIRED_COLUMNS), *DERIVED_COLUMNS])
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_partitions(csv_path: str, out_dir: str, file_format: str = "csv") -> tuple[int, int]:
+    """Split a cost CSV into city=.../year=... folders; returns (files written, rows skipped).
+
+    Rows with no city or a month that is not YYYY-MM have no folder to go in; the
+    loader never matches them to a city or month range either, so they are left out.
+    """
+    data = pd.read_csv(csv_path)
+    missing = REQUIRED_COLUMNS - set(data.columns)
+    if missing:
+        raise DatasetError(f"Your CSV is missing these columns: {sorted(list(missing))}")
+    years = pd.to_datetime(data["month"], format="%Y-%m", errors="coerce").dt.year
+    keep = years.notna() & data["city"].notna()
+    skipped = int((~keep).sum())
+    data, years = data[keep], years[keep]
+    if file_format == "parquet":
+        pa, pq = _pyarrow()
+
+    written = 0
+    for (city, year), part in data.groupby([data["city"].astype(str), years.astype(int)], sort=True):
+        folder = os.path.join(out_dir, f"city={quote(city, safe=' ')}", f"year={year}")
+        os.makedirs(folder, exist_ok=True)
+        part = part.sort_values("month", kind="stable")
+        path = os.path.join(folder, f"part-0.{file_format}")
+        tmp_path = path + ".tmp"
+        if file_format == "parquet":
+            pq.write_table(pa.Table.from_pandas(part, preserve_index=False), tmp_path)
+        else:
+            part.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        written += 1
+    return written, skipped
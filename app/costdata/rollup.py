@@ -0,0 +1,270 @@
+"""City x month rollup: per-cell row counts, column sums and non-null counts.
+
+Built by streaming the CSV in chunks, so memory is bounded by the number of
+(city, month) cells rather than the number of rows. The rollup is saved next to
+the CSV (`<name>.rollup.parquet`) together with how many bytes of the CSV it
+covers and a checksum of those bytes; when rows are appended to the CSV only
+the new bytes are parsed. Any other change to the file rebuilds the rollup.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .compare import add_city_health
+from .loader import EXPENSE_COLUMNS, INCOME_COLUMNS, REQUIRED_COLUMNS, Fingerprint, file_fingerprint
+
+SUM_COLUMNS = [*INCOME_COLUMNS, *EXPENSE_COLUMNS, "total_income", "total_expenses", "balance"]
+COUNT_COLUMNS = [f"{c}_count" for c in SUM_COLUMNS]  # non-null values behind each sum, so averages skip blanks
+DEFAULT_CHUNKSIZE = 250_000
+ROLLUP_FORMAT_VERSION = 3
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RollupState:
+    fingerprint: Fingerprint
+    cells: pd.DataFrame
+    consumed_bytes: int
+    header: tuple
+    prefix_hash: str  # sha1 of the first consumed_bytes bytes of the file
+
+
+_rollup_cache: dict[str, RollupState] = {}
+_rollup_lock = threading.Lock()
+
+
+def rollup_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate raw cost rows into cells indexed by (city, month_dt): a `rows` count, and a sum and non-null count per column."""
+    month_dt = pd.to_datetime(data["month"], format="%Y-%m", errors="coerce")
+    cells = data[["city", *INCOME_COLUMNS, *EXPENSE_COLUMNS]].assign(month_dt=month_dt)
+    cells["total_income"] = cells[INCOME_COLUMNS[0]] + cells[INCOME_COLUMNS[1]]
+    cells["total_expenses"] = cells[EXPENSE_COLUMNS].sum(axis=1)
+    cells["balance"] = cells["total_income"] - cells["total_expenses"]
+    cells = cells[cells["month_dt"].notna() & cells["city"].notna()]
+
+    grouped = cells.groupby(["city", "month_dt"])
+    out = grouped[SUM_COLUMNS].sum().astype(float)
+    out.insert(0, "rows", grouped.size())
+    counts = grouped[SUM_COLUMNS].count()
+    counts.columns = COUNT_COLUMNS
+    return out.join(counts)
+
+
+def merge_rollups(*parts: pd.DataFrame) -> pd.DataFrame:
+    parts = [p for p in parts if p is not None and not p.empty]
+    if not parts:
+        return empty_rollup()
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts).groupby(level=["city", "month_dt"]).sum()
+
+
+def empty_rollup() -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays([pd.Index([], dtype=object), pd.DatetimeIndex([])], names=["city", "month_dt"])
+    columns = {
+        "rows": pd.Series([], dtype="int64"),
+        **{c: pd.Series([], dtype=float) for c in SUM_COLUMNS},
+        **{c: pd.Series([], dtype="int64") for c in COUNT_COLUMNS},
+    }
+    return pd.DataFrame(columns, index=index)
+
+
+def rollup_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".rollup.parquet"
+
+
+def _hash_bytes(h, f, start: int, size: int):
+    # streamed in blocks, so checking a multi-gigabyte prefix stays flat in memory
+    f.seek(start)
+    remaining = size
+    while remaining > 0:
+        block = f.read(min(HASH_BLOCK_BYTES, remaining))
+        if not block:
+            break
+        h.update(block)
+        remaining -= len(block)
+    return h
+
+
+def _hash_prefix(f, size: int):
+    """sha1 of the first `size` bytes; the whole prefix, so an edit anywhere in it is caught."""
+    return _hash_bytes(hashlib.sha1(), f, 0, size)
+
+
+class _HashingReader:
+    """Reads `f` from its current offset up to `limit` bytes, feeding every byte read into `h`.
+
+    Rows appended while a rollup is being built lie past the limit, so they are
+    neither counted now nor folded in a second time by the next append.
+    """
+
+    def __init__(self, f, limit: int, h):
+        self.f = f
+        self.remaining = limit
+        self.h = h
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        block = self.f.read(size)
+        self.remaining -= len(block)
+        self.h.update(block)
+        return block
+
+
+def _fold_rows(cells: pd.DataFrame, source: _HashingReader, chunksize: int, **read_kwargs) -> pd.DataFrame:
+    # parsed chunk by chunk straight from the handle, so memory stays bounded by the cell count
+    with pd.read_csv(source, usecols=sorted(REQUIRED_COLUMNS), chunksize=chunksize, **read_kwargs) as reader:
+        for chunk in reader:
+            cells = merge_rollups(cells, rollup_frame(chunk))
+    return cells
+
+
+def _full_build(fp: Fingerprint, chunksize: int) -> RollupState:
+    with open(fp.path, "rb") as f:
+        header = tuple(pd.read_csv(f, nrows=0).columns)
+        f.seek(0)
+        source = _HashingReader(f, fp.size, hashlib.sha1())
+        cells = _fold_rows(empty_rollup(), source, chunksize)
+    return RollupState(fp, cells, fp.size - source.remaining, header, source.h.hexdigest())
+
+
+def _append_tail(state: RollupState, fp: Fingerprint, chunksize: int) -> RollupState | None:
+    """Fold rows added after `state.consumed_bytes` into the rollup, or None if the file was not just appended to."""
+    if fp == state.fingerprint:
+        return state
+    if fp.size <= state.consumed_bytes or state.consumed_bytes == 0:
+        return None  # same size with a new mtime is an in-place edit; smaller is a truncation
+    with open(fp.path, "rb") as f:
+        h = _hash_prefix(f, state.consumed_bytes)
+        if h.hexdigest() != state.prefix_hash:
+            return None
+        f.seek(state.consumed_bytes - 1)
+        if f.read(1) != b"\n":
+            return None
+
+        f.seek(state.consumed_bytes)
+        source = _HashingReader(f, fp.size - state.consumed_bytes, h)
+        cells = _fold_rows(state.cells, source, chunksize, header=None, names=list(state.header))
+    return RollupState(fp, cells, fp.size - source.remaining, state.header, h.hexdigest())
+
+
+def save_rollup(state: RollupState, out_path: str) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    meta = {
+        "version": ROLLUP_FORMAT_VERSION,
+        "mtime_ns": state.fingerprint.mtime_ns,
+        "size": state.fingerprint.size,
+        "consumed_bytes": state.consumed_bytes,
+        "header": list(state.header),
+        "prefix_hash": state.prefix_hash,
+    }
+    table = pa.Table.from_pandas(state.cells.reset_index(), preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"rollup": json.dumps(meta).encode()})
+    tmp_path = out_path + ".tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, out_path)
+
+
+def read_saved_rollup(path: str, fp: Fingerprint) -> RollupState | None:
+    try:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        meta = json.loads(table.schema.metadata[b"rollup"])
+    except Exception:
+        return None
+    if meta.get("version") != ROLLUP_FORMAT_VERSION:
+        return None
+    cells = table.to_pandas().set_index(["city", "month_dt"])
+    covered = Fingerprint(path=fp.path, mtime_ns=int(meta["mtime_ns"]), size=int(meta["size"]))  # the file as it was when saved
+    return RollupState(covered, cells, int(meta["consumed_bytes"]), tuple(meta["header"]), meta["prefix_hash"])
+
+
+def refresh_rollup(path: str, chunksize: int = DEFAULT_CHUNKSIZE, persist: bool = True) -> RollupState:
+    """Bring the rollup of `path` up to date: reuse it, append new rows, or rebuild it from scratch."""
+    fp = file_fingerprint(path)
+    saved_path = rollup_path_for(fp.path)
+
+    state = _rollup_cache.get(fp.path)
+    if state is None and persist:
+        state = read_saved_rollup(saved_path, fp)
+
+    updated = _append_tail(state, fp, chunksize) if state is not None else None
+    if updated is None:
+        updated = _full_build(fp, chunksize)
+
+    if persist and updated is not state:
+        try:
+            save_rollup(updated, saved_path)
+        except (OSError, ImportError):
+            pass  # read-only data dir or no pyarrow: keep the in-memory rollup only
+    return updated
+
+
+def load_rollup(path: str) -> pd.DataFrame:
+    """Process-wide rollup cells of `path`, updated incrementally when the file fingerprint changes."""
+    fp = file_fingerprint(path)
+    state = _rollup_cache.get(fp.path)
+    if state is not None and state.fingerprint == fp:
+        return state.cells
+    with _rollup_lock:
+        state = _rollup_cache.get(fp.path)
+        if state is not None and state.fingerprint == fp:
+            return state.cells
+        state = refresh_rollup(fp.path)
+        _rollup_cache[fp.path] = state
+        return state.cells
+
+
+def rollup_index(rollup: pd.DataFrame) -> tuple[list, list]:
+    cities = sorted(rollup.index.get_level_values("city").unique().tolist())
+    months = rollup.index.get_level_values("month_dt").unique().sort_values()
+    return cities, [m.strftime("%Y-%m") for m in months]
+
+
+def compare_tables_from_rollup(rollup: pd.DataFrame, cities, start_dt, end_dt) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Same (summary, trend, exp_mix) tables as `compare_tables`, combined from pre-aggregated cells.
+
+    Averages divide each sum by its own non-null count, matching the NaN-skipping
+    means of the in-memory path when a cost column has blanks.
+    """
+    city_idx = rollup.index.get_level_values("city")
+    month_idx = rollup.index.get_level_values("month_dt")
+    cells = rollup[city_idx.isin(list(cities)) & (month_idx >= start_dt) & (month_idx <= end_dt)].reset_index()
+
+    averaged = ["total_income", "total_expenses", "balance", "rent"]
+    per_city = cells.groupby("city", as_index=False).agg(
+        months=("month_dt", "size"),
+        **{c: (c, "sum") for c in averaged},
+        **{f"{c}_count": (f"{c}_count", "sum") for c in averaged},
+    )
+
+    def mean(frame: pd.DataFrame, column: str) -> pd.Series:
+        return frame[column] / frame[f"{column}_count"].where(frame[f"{column}_count"] > 0)
+
+    summary = pd.DataFrame(
+        {
+            "city": per_city["city"],
+            "avg_income": mean(per_city, "total_income"),
+            "avg_expenses": mean(per_city, "total_expenses"),
+            "avg_balance": mean(per_city, "balance"),
+            "months": per_city["months"],
+            "avg_rent": mean(per_city, "rent"),
+        }
+    )
+    summary["savings_rate"] = (summary["avg_balance"] / summary["avg_income"]).where(summary["avg_income"] != 0, 0.0)
+    summary = add_city_health(summary)
+
+    trend = pd.DataFrame(
+        {"month_dt": cells["month_dt"], "city": cells["city"], "balance": mean(cells, "balance")}
+    ).sort_values(["month_dt", "city"], ignore_index=True)
+
+    exp_mix = cells.groupby("city", as_index=False)[EXPENSE_COLUMNS].sum()
+    return summary, trend, exp_mix
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+from .columnar import parquet_index, parquet_path_for, read_costs_parquet
+from .loader import DatasetError, load_cost_dataset
+from .partitions import is_partitioned, partition_index, read_partitions
+
+
+def is_parquet(path: str) -> bool:
+    return path.lower().endswith(".parquet")
+
+
+def resolve_source(path: str) -> str:
+    """Prefer the Parquet copy of a CSV when it exists and is at least as new as the CSV."""
+    if is_parquet(path) or is_partitioned(path):
+        return path
+    pq_path = parquet_path_for(path)
+    try:
+        if os.stat(pq_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            return pq_path
+    except OSError:
+        pass
+    return path
+
+
+def cost_index(path: str) -> tuple[list, list]:
+    """Sorted cities and YYYY-MM months available in the source."""
+    if is_partitioned(path):
+        cities, months_sorted = partition_index(path)
+    elif is_parquet(path):
+        try:
+            cities, months_sorted = parquet_index(path)
+        except OSError as exc:
+            raise DatasetError(f"Could not read {path}. Make sure the file exists.") from exc
+    else:
+        dataset = load_cost_dataset(path)
+        cities, months_sorted = dataset.cities, dataset.months_sorted
+    return list(cities), list(months_sorted)
+
+
+def query_costs(path: str, cities, start_dt, end_dt, columns) -> pd.DataFrame:
+    """Rows for `cities` with month_dt in [start_dt, end_dt], restricted to `columns`."""
+    if is_partitioned(path):
+        data = read_partitions(path, cities=cities, start_month=start_dt.strftime("%Y-%m"), end_month=end_dt.strftime("%Y-%m"))
+    elif is_parquet(path):
+        data = read_costs_parquet(
+            path,
+            cities=cities,
+            start_month=start_dt.strftime("%Y-%m"),
+            end_month=end_dt.strftime("%Y-%m"),
+        )
+    else:
+        # the snapshot is sorted by (city, month): slice each city's block instead of scanning every row
+        return load_cost_dataset(path).select(cities, start_dt, end_dt, columns)
+
+    mask = (data["city"].isin(cities)) & (data["month_dt"] >= start_dt) & (data["month_dt"] <= end_dt)
+    return data.loc[mask, list(columns)]
@@ -0,0 +1,84 @@
+"""Headless financial math for the dashboard.
+
+Importing the package only loads the pure-Python modules; the NumPy/pandas
+helpers are imported the first time one of their names is used.
+"""
+import importlib
+
+from .debt import monthly_payment, years_to_pay
+from .finance import (
+    EXPENSE_KEYS,
+    calculate_budget,
+    clamp,
+    financial_health_score,
+    financial_status,
+    pressure_flag,
+    score_label,
+    weekly_job_income,
+)
+
+_LAZY = {
+    "HEALTH_COLUMNS": "health",
+    "financial_health_score_batch": "health",
+    "financial_status_batch": "health",
+    "PROFILE_DEFAULTS": "profiles",
+    "PROFILE_REQUIRED": "profiles",
+    "POINT_COLUMNS": "profiles",
+    "RESULT_COLUMNS": "profiles",
+    "score_profiles": "profiles",
+    "amortization_schedule": "amortization",
+    "grid_payments": "amortization",
+    "payoff_summary": "amortization",
+    "standard_payment": "amortization",
+    "monthly_timeline": "cashflow",
+    "phase_months": "cashflow",
+    "phase_summary": "cashflow",
+    "simulate_timeline": "montecarlo",
+    "scenario_surface": "sensitivity",
+    "cheapest_cuts": "optimize",
+    "build_expense_pressure_df": "tables",
+    "minmax_indices": "downsample",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "EXPENSE_KEYS",
+    "HEALTH_COLUMNS",
+    "PROFILE_DEFAULTS",
+    "PROFILE_REQUIRED",
+    "POINT_COLUMNS",
+    "RESULT_COLUMNS",
+    "amortization_schedule",
+    "build_expense_pressure_df",
+    "calculate_budget",
+    "cheapest_cuts",
+    "clamp",
+    "financial_health_score",
+    "financial_health_score_batch",
+    "financial_status",
+    "financial_status_batch",
+    "grid_payments",
+    "minmax_indices",
+    "monthly_payment",
+    "monthly_timeline",
+    "payoff_summary",
+    "phase_months",
+    "phase_summary",
+    "pressure_flag",
+    "score_label",
+    "scenario_surface",
+    "score_profiles",
+    "simulate_timeline",
+    "standard_payment",
+    "weekly_job_income",
+    "years_to_pay",
+]
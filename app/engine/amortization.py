@@ -0,0 +1,80 @@
+"""Vectorized loan amortization over grids of rates, payments and terms.
+
+A grid cell pays `share` of the monthly salary, but never less than the
+standard payment that clears the loan within `term_years`.
+"""
+import numpy as np
+
+
+def standard_payment(principal, rate_monthly, n_months):
+    """monthly_payment() over arrays."""
+    principal, rate_monthly, n_months = np.broadcast_arrays(
+        np.asarray(principal, dtype=float), np.asarray(rate_monthly, dtype=float), np.asarray(n_months, dtype=float)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = principal * rate_monthly / (1 - (1 + rate_monthly) ** (-n_months))
+        flat = principal / n_months
+    pmt = np.where(rate_monthly > 0, annuity, flat)
+    return np.where((principal > 0) & (n_months > 0), pmt, 0.0)
+
+
+def grid_payments(principal: float, annual_rates_pct, salary_shares_pct, terms_years, monthly_salary: float):
+    """Broadcast rates x shares x terms into (rate_monthly, payment, n_term) arrays of shape (R, S, T)."""
+    rates = np.asarray(annual_rates_pct, dtype=float)[:, None, None] / 100.0 / 12.0
+    shares = np.asarray(salary_shares_pct, dtype=float)[None, :, None] / 100.0
+    n_term = np.asarray(terms_years, dtype=float)[None, None, :] * 12
+    payment = np.maximum(shares * monthly_salary, standard_payment(principal, rates, n_term))
+    rates, payment, n_term = np.broadcast_arrays(rates, payment, n_term)
+    return rates, payment, n_term
+
+
+def payoff_summary(principal: float, rate_monthly, payment) -> dict:
+    """Months to clear, total paid and total interest for every cell, in closed form."""
+    rate_monthly, payment = np.broadcast_arrays(np.asarray(rate_monthly, dtype=float), np.asarray(payment, dtype=float))
+    if principal <= 0:
+        zeros = np.zeros(rate_monthly.shape)
+        return {"months": zeros, "total_paid": zeros, "total_interest": zeros}
+
+    growth = 1 + rate_monthly
+    clears = payment > principal * rate_monthly
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_exact = np.where(
+            rate_monthly > 0,
+            -np.log1p(-principal * rate_monthly / payment) / np.log1p(rate_monthly),
+            principal / payment,
+        )
+        n_months = np.ceil(np.round(n_exact, 9))
+        # balance before the final (partial) payment
+        before_last = np.where(
+            rate_monthly > 0,
+            principal * growth ** (n_months - 1) - payment * (growth ** (n_months - 1) - 1) / rate_monthly,
+            principal - payment * (n_months - 1),
+        )
+        total_paid = payment * (n_months - 1) + before_last * growth
+
+    n_months = np.where(clears, n_months, np.inf)
+    total_paid = np.where(clears, total_paid, np.inf)
+    return {"months": n_months, "total_paid": total_paid, "total_interest": total_paid - principal}
+
+
+def amortization_schedule(principal: float, rate_monthly, payment, n_months: int) -> dict:
+    """Month-by-month balance, interest and principal for every cell: arrays of shape cells + (n_months,)."""
+    rate_monthly, payment = np.broadcast_arrays(np.asarray(rate_monthly, dtype=float), np.asarray(payment, dtype=float))
+    k = np.arange(n_months + 1, dtype=float)
+    r = rate_monthly[..., None]
+    pmt = payment[..., None]
+    growth = (1 + r) ** k
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity_balance = principal * growth - pmt * (growth - 1) / r
+    balance = np.where(r > 0, annuity_balance, principal - pmt * k)
+    balance = np.clip(balance, 0.0, None)
+
+    interest = r * balance[..., :-1]
+    principal_paid = balance[..., :-1] - balance[..., 1:]
+    return {
+        "month": k[1:],
+        "balance": balance[..., 1:],
+        "interest": interest * (balance[..., :-1] > 0),
+        "principal": principal_paid,
+        "cumulative_interest": np.cumsum(interest * (balance[..., :-1] > 0), axis=-1),
+    }
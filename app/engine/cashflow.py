@@ -0,0 +1,84 @@
+"""Month-level cashflow for a scenario's phases.
+
+Phases are laid end to end; the balance is one cumulative sum over the months
+array, so dips inside a phase are visible (not just phase-end balances).
+"""
+import numpy as np
+import pandas as pd
+
+
+def phase_months(phases: list) -> dict:
+    """Per-month arrays for the phases laid end to end.
+
+    Each phase's one-time costs are charged in its `one_time_month`
+    (1-based month within the phase, default 1, clipped to the phase length).
+    """
+    months = np.array([max(int(ph.get("months", 0)), 0) for ph in phases], dtype=np.int64)
+    phase_of_month = np.repeat(np.arange(len(phases)), months)
+    income = np.array([float(ph.get("monthly_income", 0.0)) for ph in phases])[phase_of_month]
+    expenses = np.array([float(ph.get("monthly_expenses", 0.0)) for ph in phases])[phase_of_month]
+
+    starts = np.concatenate(([0], np.cumsum(months)[:-1])).astype(np.int64)
+    offsets = np.array([int(ph.get("one_time_month", 1) or 1) for ph in phases], dtype=np.int64)
+    offsets = np.clip(offsets, 1, np.maximum(months, 1)) - 1
+    costs = np.array([float(ph.get("one_time_costs", 0.0)) for ph in phases])
+
+    one_time = np.zeros(len(phase_of_month))
+    if len(one_time):
+        # a phase with no months charges its costs where the next phase starts
+        np.add.at(one_time, np.minimum(starts + offsets, len(one_time) - 1), costs)
+
+    return {"phase": phase_of_month, "income": income, "expenses": expenses, "one_time": one_time}
+
+
+def monthly_timeline(phases: list, starting_cash: float) -> pd.DataFrame:
+    """One row per month: phase, income, expenses, one-time costs, net and running balance."""
+    plan = phase_months(phases)
+    net = plan["income"] - plan["expenses"] - plan["one_time"]
+    balance = float(starting_cash) + np.cumsum(net)
+    names = np.array([ph.get("name", f"Phase {i}") for i, ph in enumerate(phases, start=1)], dtype=object)
+
+    return pd.DataFrame(
+        {
+            "Month": np.arange(1, len(net) + 1),
+            "Order": plan["phase"] + 1,
+            "Phase": names[plan["phase"]] if len(names) else np.array([], dtype=object),
+            "Income": plan["income"],
+            "Expenses": plan["expenses"],
+            "One-time costs": plan["one_time"],
+            "Net": net,
+            "Balance": balance,
+        }
+    )
+
+
+def phase_summary(phases: list, monthly: pd.DataFrame, starting_cash: float) -> pd.DataFrame:
+    """Per-phase rows (same columns as before plus the lowest balance inside each phase and its month)."""
+    rows = pd.DataFrame(
+        {
+            "Order": np.arange(1, len(phases) + 1),
+            "Phase": [ph.get("name", f"Phase {i}") for i, ph in enumerate(phases, start=1)],
+            "Months": [int(ph.get("months", 0)) for ph in phases],
+            "Monthly net": [float(ph.get("monthly_income", 0.0)) - float(ph.get("monthly_expenses", 0.0)) for ph in phases],
+            "One-time costs": [float(ph.get("one_time_costs", 0.0)) for ph in phases],
+        }
+    )
+    rows["Phase impact"] = rows["Monthly net"] * rows["Months"] - rows["One-time costs"]
+
+    by_phase = monthly.groupby("Order")
+    lowest_at = by_phase["Balance"].idxmin()
+    stats = pd.DataFrame(
+        {
+            "End balance": by_phase["Balance"].last(),
+            "Lowest balance": by_phase["Balance"].min(),
+            "Lowest month": monthly.loc[lowest_at.to_numpy(), "Month"].to_numpy(),
+        },
+        index=lowest_at.index,
+    )
+    rows = rows.join(stats, on="Order")
+
+    # phases with no months leave the balance where the previous phase ended
+    rows["End balance"] = rows["End balance"].ffill().fillna(float(starting_cash))
+    rows["Lowest balance"] = rows["Lowest balance"].fillna(rows["End balance"])
+    rows["Lowest month"] = rows["Lowest month"].astype("Int64")
+    return rows
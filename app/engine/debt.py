@@ -0,0 +1,20 @@
+import math
+
+
+def monthly_payment(principal: float, rate_monthly: float, years: float) -> float:
+    n = int(years * 12)
+    if principal <= 0 or n <= 0:
+        return 0.0
+    if rate_monthly <= 0:
+        return principal / n
+    return principal * rate_monthly / (1 - (1 + rate_monthly) ** (-n))
+
+def years_to_pay(principal: float, rate_monthly: float, monthly_contrib: float) -> float:
+    if principal <= 0 or monthly_contrib <= 0:
+        return 0.0
+    if rate_monthly <= 0:
+        return principal / (monthly_contrib * 12.0)
+    if monthly_contrib <= principal * rate_monthly:
+        return float("inf")
+    n_months = -math.log(1 - principal * rate_monthly / monthly_contrib) / math.log(1 + rate_monthly)
+    return n_months / 12.0
@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def minmax_indices(codes, y, max_points: int) -> np.ndarray:
+    """Positions of the rows to keep so that no series has more than `max_points` points.
+
+    Rows sharing a code form one series, taken in their current (x) order. A
+    longer series is cut into (max_points - 2) // 2 equal-count buckets and
+    keeps the lowest and highest y of every bucket plus its first and last row,
+    so peaks and dips survive. Shorter series are kept whole. Returns ascending
+    positions, so the original row order is preserved.
+    """
+    codes = np.asarray(codes)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    max_points = max(int(max_points), 4)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, n])
+    series = np.repeat(np.arange(len(starts)), sizes)
+    rank = np.arange(n) - starts[series]
+    size = sizes[series]
+
+    keep = (size <= max_points) | (rank == 0) | (rank == size - 1)
+
+    n_buckets = (max_points - 2) // 2
+    bucket = series.astype(np.int64) * n_buckets + rank * n_buckets // size
+    by_value = np.lexsort((y[order], bucket))  # within each bucket: lowest y first, highest (or NaN) last
+    ordered_buckets = bucket[by_value]
+    first = np.r_[True, ordered_buckets[1:] != ordered_buckets[:-1]]
+    last = np.r_[ordered_buckets[1:] != ordered_buckets[:-1], True]
+    keep[by_value[first | last]] = True
+
+    return np.sort(order[keep])
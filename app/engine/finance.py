@@ -0,0 +1,105 @@
+EXPENSE_KEYS = ["rent", "utilities", "food", "transport", "phone_internet", "misc_basic"]
+
+
+def financial_status(balance: float) -> str:
+    if balance > 0:
+        return "Surplus"
+    if balance == 0:
+        return "Break-even"
+    return "Deficit"
+
+def clamp(n: float, low: float, high: float) -> float:
+    return max(low, min(high, n))
+
+def score_label(score: int) -> str:
+    if score >= 80:
+        return "Excellent"
+    if score >= 60:
+        return "Good"
+    if score >= 40:
+        return "Risky"
+    return "Critical"
+
+def financial_health_score(total_income: float, total_expenses: float, rent: float, balance: float) -> tuple[int, dict]:
+    if total_income <= 0:
+        return 0, {
+            "balance_points": 0,
+            "rent_points": 0,
+            "savings_points": 0,
+            "buffer_points": 0,
+            "rent_ratio": None,
+            "savings_rate": None,
+            "buffer_months": 0.0,
+        }
+
+    rent_ratio = rent / total_income
+    savings_rate = balance / total_income
+    
+    balance_points = 40 if balance > 0 else 0
+
+    rent_points = 25 * (0.60 - rent_ratio) / (0.60 - 0.35)
+    rent_points = int(round(clamp(rent_points, 0, 25)))
+
+    savings_points = 20 * (savings_rate / 0.10)
+    savings_points = int(round(clamp(savings_points, 0, 20)))
+
+    buffer_months = (balance / total_expenses) if total_expenses > 0 else 0.0
+    buffer_points = 15 * buffer_months
+    buffer_points = int(round(clamp(buffer_points, 0, 15)))
+
+    score = int(clamp(balance_points + rent_points + savings_points + buffer_points, 0, 100))
+
+    breakdown = {
+        "balance_points": balance_points,
+        "rent_points": rent_points,
+        "savings_points": savings_points,
+        "buffer_points": buffer_points,
+        "rent_ratio": rent_ratio,
+        "savings_rate": savings_rate,
+        "buffer_months": buffer_months,
+    }
+    return score, breakdown
+    
+def pressure_flag(share: float) -> tuple[str, str]:
+    if share <= 0.25:
+        return "Healthy", "pill-green"
+    if share <= 0.35:
+        return "Risky", "pill-yellow"
+    return "Danger", "pill-red"
+
+def weekly_job_income(wage: float, hours_mon_fri: float, hours_sat: float, hours_sun: float, sunday_multiplier: float) -> float:
+    return (wage * (hours_mon_fri + hours_sat)) + (wage * hours_sun * sunday_multiplier)
+
+def calculate_budget(
+    wage: float,
+    weeks_per_month: float,
+    hours_mon_fri: float,
+    hours_sat: float,
+    hours_sun: float,
+    sunday_multiplier: float,
+    stipend: float,
+    expenses: dict,
+) -> dict:
+    """The Calculator's monthly budget: income, expenses, balance, status and health score."""
+    weekly = weekly_job_income(wage, hours_mon_fri, hours_sat, hours_sun, sunday_multiplier)
+    monthly_job_income = weekly * weeks_per_month
+
+    total_income = monthly_job_income + stipend
+    total_expenses = sum(float(expenses.get(k, 0.0)) for k in EXPENSE_KEYS)
+    balance = total_income - total_expenses
+    health_score, breakdown = financial_health_score(
+        total_income=total_income,
+        total_expenses=total_expenses,
+        rent=float(expenses.get("rent", 0.0)),
+        balance=balance,
+    )
+    return {
+        "weekly_job_income": weekly,
+        "monthly_job_income": monthly_job_income,
+        "total_income": total_income,
+        "total_expenses": total_expenses,
+        "balance": balance,
+        "status": financial_status(balance),
+        "health_score": health_score,
+        "breakdown": breakdown,
+    }
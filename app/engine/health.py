@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+HEALTH_COLUMNS = [
+    "score",
+    "balance_points",
+    "rent_points",
+    "savings_points",
+    "buffer_points",
+    "rent_ratio",
+    "savings_rate",
+    "buffer_months",
+]
+
+
+def financial_status_batch(balance) -> np.ndarray:
+    bal = np.asarray(balance, dtype=float)
+    return np.select([bal > 0, bal == 0], ["Surplus", "Break-even"], default="Deficit")
+
+
+def financial_health_score_batch(total_income, total_expenses, rent, balance) -> pd.DataFrame:
+    """Vectorized financial_health_score: one row per input, the score plus every breakdown component.
+
+    Mirrors the scalar rules operation for operation (including round-half-to-even),
+    so each row equals the scalar result; rent_ratio and savings_rate are NaN where
+    the scalar returns None.
+    """
+    index = total_income.index if isinstance(total_income, pd.Series) else None
+    income = np.asarray(total_income, dtype=float)
+    expenses = np.asarray(total_expenses, dtype=float)
+    rent = np.asarray(rent, dtype=float)
+    balance = np.asarray(balance, dtype=float)
+    income, expenses, rent, balance = np.broadcast_arrays(income, expenses, rent, balance)
+
+    has_income = income > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rent_ratio = np.where(has_income, rent / income, np.nan)
+        savings_rate = np.where(has_income, balance / income, np.nan)
+        buffer_months = np.where(expenses > 0, balance / expenses, 0.0)
+
+    balance_points = np.where(balance > 0, 40, 0)
+    rent_points = np.rint(np.clip(25 * (0.60 - rent_ratio) / (0.60 - 0.35), 0, 25))
+    savings_points = np.rint(np.clip(20 * (savings_rate / 0.10), 0, 20))
+    buffer_points = np.rint(np.clip(15 * buffer_months, 0, 15))
+
+    zero = np.zeros_like(income, dtype=np.int64)
+    balance_points = np.where(has_income, balance_points, zero).astype(np.int64)
+    rent_points = np.where(has_income, rent_points, zero).astype(np.int64)
+    savings_points = np.where(has_income, savings_points, zero).astype(np.int64)
+    buffer_points = np.where(has_income, buffer_points, zero).astype(np.int64)
+    buffer_months = np.where(has_income, buffer_months, 0.0)
+    score = np.clip(balance_points + rent_points + savings_points + buffer_points, 0, 100)
+
+    return pd.DataFrame(
+        {
+            "score": score,
+            "balance_points": balance_points,
+            "rent_points": rent_points,
+            "savings_points": savings_points,
+            "buffer_points": buffer_points,
+            "rent_ratio": rent_ratio,
+            "savings_rate": savings_rate,
+            "buffer_months": buffer_months,
+        },
+        index=index,
+    )
@@ -0,0 +1,84 @@
+"""Monte Carlo paths for a scenario timeline, vectorized over paths x months."""
+import numpy as np
+
+from .cashflow import phase_months
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def simulate_timeline(
+    phases: list,
+    starting_cash: float,
+    n_paths: int = 10_000,
+    income_vol: float = 0.10,
+    expense_vol: float = 0.05,
+    job_loss_prob: float = 0.0,
+    step_up_prob: float = 0.0,
+    step_up_pct: float = 0.15,
+    tail: float = 0.05,
+    seed: int | None = None,
+) -> dict:
+    """Simulate month-by-month balances around the deterministic phase plan.
+
+    Each month's income and expenses get independent normal noise (`income_vol`,
+    `expense_vol` as a fraction of the planned amount). With `job_loss_prob` a
+    month's income is lost entirely; with `step_up_prob` per month a path's
+    expenses step up by `step_up_pct` from that month on (a rent increase, a new
+    bill: phases carry only total expenses, so the step applies to all of them).
+    One-time costs are fixed.
+
+    Returns nearest-rank percentile bands per month, the probability that a path
+    goes below zero, and the expected shortfall: the mean lowest balance of the
+    worst `tail` share of paths.
+    """
+    plan = phase_months(phases)
+    n_months = len(plan["income"])
+    if n_months == 0:
+        raise ValueError("The scenario has no months to simulate.")
+
+    rng = np.random.default_rng(seed)
+    # months x paths, so each month's paths are contiguous for the cumulative sum and the percentiles
+    shape = (n_months, int(n_paths))
+    planned_income = plan["income"].astype(np.float32)[:, None]
+    planned_expenses = plan["expenses"].astype(np.float32)[:, None]
+
+    income = rng.standard_normal(shape, dtype=np.float32)
+    income *= np.float32(income_vol)
+    income += 1
+    income *= planned_income
+    np.maximum(income, 0, out=income)
+    if job_loss_prob > 0:
+        income[rng.random(shape, dtype=np.float32) < job_loss_prob] = 0
+
+    expenses = rng.standard_normal(shape, dtype=np.float32)
+    expenses *= np.float32(expense_vol)
+    expenses += 1
+    expenses *= planned_expenses
+    np.maximum(expenses, 0, out=expenses)
+    if step_up_prob > 0:
+        stepped = np.logical_or.accumulate(rng.random(shape, dtype=np.float32) < step_up_prob, axis=0)
+        expenses *= 1 + np.float32(step_up_pct) * stepped
+
+    net = income
+    net -= expenses
+    net -= plan["one_time"].astype(np.float32)[:, None]
+    net[0] += np.float32(starting_cash)
+    balance = np.cumsum(net, axis=0, out=net)
+
+    lowest = balance.min(axis=0)
+    n = balance.shape[1]
+    ranks = [min(int(round(p / 100 * (n - 1))), n - 1) for p in PERCENTILES]
+    ordered = np.partition(balance, ranks, axis=1)
+    tail_n = max(int(np.ceil(tail * n)), 1)
+    worst = np.partition(lowest, tail_n - 1)[:tail_n]
+
+    return {
+        "months": np.arange(1, n_months + 1),
+        "percentiles": {p: ordered[:, r].astype(float) for p, r in zip(PERCENTILES, ranks)},
+        "prob_below_zero": float((lowest < 0).mean()),
+        "expected_shortfall": float(worst.mean(dtype=np.float64)),
+        "tail": tail,
+        "lowest_median": float(np.median(lowest)),
+        "final_median": float(np.median(balance[-1])),
+        "n_paths": int(n_paths),
+    }
@@ -0,0 +1,114 @@
+"""Cheapest expense cuts that reach a target health score or monthly balance.
+
+For a fixed total cut T, every score component except rent_points depends on T
+alone (balance, savings rate and buffer all move dollar for dollar), and
+rent_points only improves as rent falls. So the best way to spend T is to cut
+rent first (down to its floor), and the best achievable score is a
+non-decreasing step function of T. Its steps sit where some component crosses
+a rounding threshold, which can be solved for in closed form; the cheapest
+plan is the smallest such breakpoint that meets the target, checked by
+scoring all breakpoints in one vectorized call.
+"""
+import numpy as np
+
+from .finance import EXPENSE_KEYS
+from .health import financial_health_score_batch
+
+
+def _cent_ceil(values: np.ndarray) -> np.ndarray:
+    return np.ceil(np.round(values * 100, 6)) / 100
+
+
+def _score_after_cuts(calc: dict, totals: np.ndarray, rent_cap: float) -> np.ndarray:
+    rent_cut = np.minimum(totals, rent_cap)
+    income = float(calc["total_income"])
+    expenses = float(calc["total_expenses"]) - totals
+    balance = float(calc["balance"]) + totals
+    rent = float(calc["rent"]) - rent_cut
+    return financial_health_score_batch(np.full(len(totals), income), expenses, rent, balance)["score"].to_numpy()
+
+
+def _score_breakpoints(calc: dict, rent_cap: float, max_total: float) -> np.ndarray:
+    income = float(calc["total_income"])
+    expenses = float(calc["total_expenses"])
+    balance = float(calc["balance"])
+    rent = float(calc["rent"])
+
+    candidates = [np.array([0.0, -balance, max_total])]
+    if income > 0:
+        half_steps = np.arange(1, 26) - 0.5
+        # rent_points reaches k once rent <= income * (0.60 - (k - 0.5) / 100)
+        candidates.append(rent - income * (0.60 - half_steps / 100))
+        # savings_points reaches k once balance / income >= (k - 0.5) / 200
+        candidates.append(income * np.arange(0.5, 20) / 200 - balance)
+        # buffer_points reaches k once balance / expenses >= (k - 0.5) / 15
+        c = np.arange(0.5, 15) / 15
+        candidates.append((c * expenses - balance) / (1 + c))
+
+    totals = np.concatenate(candidates)
+    totals = _cent_ceil(totals)
+    totals = np.concatenate([totals, totals + 0.01])
+    return np.unique(np.clip(totals, 0.0, max_total))
+
+
+def _allocate(calc: dict, total: float, floors: dict) -> list[dict]:
+    # rent first; the rest from as few categories as possible (largest headroom first)
+    cuts = []
+    remaining = total
+    order = ["rent"] + sorted(
+        [k for k in EXPENSE_KEYS if k != "rent"],
+        key=lambda k: float(calc.get(k, 0.0)) - floors.get(k, 0.0),
+        reverse=True,
+    )
+    for k in order:
+        if remaining <= 0:
+            break
+        current = float(calc.get(k, 0.0))
+        room = max(current - floors.get(k, 0.0), 0.0)
+        cut = min(room, remaining)
+        if cut > 0:
+            cuts.append({"category": k, "current": current, "cut": cut, "new": current - cut, "floor": floors.get(k, 0.0)})
+            remaining -= cut
+    return cuts
+
+
+def cheapest_cuts(calc: dict, target_score: int | None = None, target_balance: float | None = None, floors: dict | None = None) -> dict:
+    """Smallest total monthly cut (and the categories it comes from) reaching the target(s).
+
+    `floors` maps category -> the lowest amount it may be cut to (default 0).
+    If the target is out of reach, returns the plan for the deepest allowed cuts
+    with `feasible` set to False.
+    """
+    floors = {k: max(float((floors or {}).get(k, 0.0)), 0.0) for k in EXPENSE_KEYS}
+    caps = {k: max(float(calc.get(k, 0.0)) - floors[k], 0.0) for k in EXPENSE_KEYS}
+    rent_cap = caps["rent"]
+    max_total = float(sum(caps.values()))
+    balance = float(calc["balance"])
+
+    needed = 0.0
+    feasible = True
+    if target_balance is not None:
+        need_balance = max(float(target_balance) - balance, 0.0)
+        feasible &= need_balance <= max_total + 1e-9
+        needed = max(needed, min(need_balance, max_total))
+
+    if target_score is not None:
+        totals = _score_breakpoints(calc, rent_cap, max_total)
+        scores = _score_after_cuts(calc, totals, rent_cap)
+        reached = scores >= int(target_score)
+        if reached.any():
+            needed = max(needed, float(totals[np.argmax(reached)]))
+        else:
+            feasible = False
+            needed = max_total
+
+    needed = round(needed, 2)
+    final = _score_after_cuts(calc, np.array([needed]), rent_cap)[0]
+    return {
+        "feasible": bool(feasible),
+        "total_cut": needed,
+        "cuts": _allocate(calc, needed, floors),
+        "new_balance": balance + needed,
+        "new_score": int(final),
+        "max_total_cut": max_total,
+    }
@@ -0,0 +1,111 @@
+"""Calculator budget evaluated over a table of student profiles, one row per student."""
+import numpy as np
+import pandas as pd
+
+from .finance import EXPENSE_KEYS
+from .health import financial_health_score_batch, financial_status_batch
+
+PROFILE_REQUIRED = ["wage", *EXPENSE_KEYS]
+
+# Calculator form defaults, used when a profile file leaves a column out
+PROFILE_DEFAULTS = {
+    "weeks_per_month": 4.33,
+    "hours_mon_fri": 20.0,
+    "hours_sat": 0.0,
+    "hours_sun": 0.0,
+    "sunday_multiplier": 1.0,
+    "stipend": 0.0,
+}
+
+RESULT_COLUMNS = [
+    "weekly_job_income",
+    "monthly_job_income",
+    "total_income",
+    "total_expenses",
+    "balance",
+    "status",
+    "health_score",
+    "balance_points",
+    "rent_points",
+    "savings_points",
+    "buffer_points",
+    "rent_ratio",
+    "savings_rate",
+    "buffer_months",
+]
+
+
+POINT_COLUMNS = ["health_score", "balance_points", "rent_points", "savings_points", "buffer_points"]
+
+
+def _column(profiles: pd.DataFrame, name: str) -> tuple[np.ndarray, np.ndarray]:
+    """`name` as floats, plus a mask of the rows where it is unusable.
+
+    A blank optional value takes its Calculator default. Text that is not a
+    number, or a blank required value, makes the row invalid.
+    """
+    if name not in profiles.columns:
+        return np.full(len(profiles), PROFILE_DEFAULTS[name], dtype=float), np.zeros(len(profiles), dtype=bool)
+    raw = profiles[name]
+    values = pd.to_numeric(raw, errors="coerce")
+    invalid = values.isna() & raw.notna()
+    if name in PROFILE_DEFAULTS:
+        values = values.fillna(PROFILE_DEFAULTS[name])
+    else:
+        invalid |= values.isna()
+    return values.to_numpy(dtype=float), invalid.to_numpy()
+
+
+def score_profiles(profiles: pd.DataFrame) -> pd.DataFrame:
+    """Input columns plus the Calculator results for every row; each row matches calculate_budget().
+
+    Rows with a missing or non-numeric required value, or a non-numeric optional
+    one, get empty results (NaN, no status) instead of being scored.
+    """
+    missing = [c for c in PROFILE_REQUIRED if c not in profiles.columns]
+    if missing:
+        raise ValueError(f"Profile file is missing these columns: {missing}")
+
+    invalid = np.zeros(len(profiles), dtype=bool)
+
+    def column(name: str) -> np.ndarray:
+        nonlocal invalid
+        values, bad = _column(profiles, name)
+        invalid |= bad
+        return values
+
+    wage = column("wage")
+    weekly = (wage * (column("hours_mon_fri") + column("hours_sat"))) + (
+        wage * column("hours_sun") * column("sunday_multiplier")
+    )
+    monthly_job_income = weekly * column("weeks_per_month")
+    total_income = monthly_job_income + column("stipend")
+
+    expenses = {k: column(k) for k in EXPENSE_KEYS}
+    total_expenses = np.zeros(len(profiles))
+    for k in EXPENSE_KEYS:
+        total_expenses = total_expenses + expenses[k]
+    balance = total_income - total_expenses
+
+    with np.errstate(invalid="ignore"):
+        health = financial_health_score_batch(total_income, total_expenses, expenses["rent"], balance)
+    results = pd.DataFrame(
+        {
+            "weekly_job_income": weekly,
+            "monthly_job_income": monthly_job_income,
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "balance": balance,
+            "status": financial_status_batch(balance),
+        },
+        index=profiles.index,
+    )
+    health.index = profiles.index
+    results = results.join(health.rename(columns={"score": "health_score"}))
+
+    # nullable integers keep one output schema whether or not a chunk has invalid rows
+    results[POINT_COLUMNS] = results[POINT_COLUMNS].astype("Int64")
+    results["status"] = results["status"].astype(object)
+    if invalid.any():
+        results.loc[invalid, RESULT_COLUMNS] = None
+    return pd.concat([profiles.drop(columns=RESULT_COLUMNS, errors="ignore"), results[RESULT_COLUMNS]], axis=1)
@@ -0,0 +1,42 @@
+"""What-if surfaces for the Calculator's scenario simulator."""
+import numpy as np
+
+from .health import financial_health_score_batch
+
+
+def scenario_surface(
+    weekly_job_income: float,
+    wage: float,
+    weeks_per_month: float,
+    stipend: float,
+    expenses: dict,
+    extra_hours,
+    rent_change,
+    extra_income=0.0,
+) -> dict:
+    """Scenario simulator results for every combination of the inputs.
+
+    `extra_hours`, `rent_change` and `extra_income` may be scalars or 1-D grids;
+    they are broadcast to shape (len(extra_hours), len(rent_change), len(extra_income)).
+    """
+    hours = np.atleast_1d(np.asarray(extra_hours, dtype=float))[:, None, None]
+    rent_delta = np.atleast_1d(np.asarray(rent_change, dtype=float))[None, :, None]
+    income_delta = np.atleast_1d(np.asarray(extra_income, dtype=float))[None, None, :]
+
+    scenario_monthly_job_income = (weekly_job_income + (wage * hours)) * weeks_per_month
+    scenario_rent = np.maximum(expenses["rent"] + rent_delta, 0.0)
+    total_expenses = scenario_rent + expenses["utilities"] + expenses["food"] + expenses["transport"] + expenses["phone_internet"] + expenses["misc_basic"]
+    total_income = scenario_monthly_job_income + stipend + income_delta
+    total_income, total_expenses, scenario_rent = np.broadcast_arrays(total_income, total_expenses, scenario_rent)
+    balance = total_income - total_expenses
+
+    health = financial_health_score_batch(total_income.ravel(), total_expenses.ravel(), scenario_rent.ravel(), balance.ravel())
+    return {
+        "extra_hours": hours[:, 0, 0],
+        "rent_change": rent_delta[0, :, 0],
+        "extra_income": income_delta[0, 0, :],
+        "total_income": total_income,
+        "total_expenses": total_expenses,
+        "balance": balance,
+        "health_score": health["score"].to_numpy().reshape(balance.shape),
+    }
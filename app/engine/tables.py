@@ -0,0 +1,21 @@
+import pandas as pd
+
+from .finance import pressure_flag
+
+
+def build_expense_pressure_df(total_income: float, expense_dict: dict) -> pd.DataFrame:
+    rows = []
+    income = float(total_income) if total_income else 0.0
+
+    for name, amt in expense_dict.items():
+        amt_f = float(amt)
+        share = (amt_f / income) if income > 0 else 0.0
+        label, css = pressure_flag(share)
+        rows.append(
+            {"Expense": name, "Amount": amt_f, "ShareOfIncome": share, "FlagLabel": label, "FlagCss": css}
+        )
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return pd.DataFrame(columns=["Expense", "Amount", "ShareOfIncome", "FlagLabel", "FlagCss"])
+    return df.sort_values("ShareOfIncome", ascending=False, ignore_index=True)
@@ -0,0 +1,105 @@
+"""Process-wide LRU of built Plotly figures, keyed on a hash of the builder's inputs.
+
+Building a figure with plotly.express costs tens of milliseconds, far more than
+handing it to st.plotly_chart, and most reruns rebuild charts whose data has not
+changed. Decorate a builder with `cached_figure(name)`: its arguments (frames,
+arrays, scalars, layout options) are hashed by content and the finished figure
+is reused while it stays in the LRU.
+
+Figures are shared between reruns and sessions, so callers must not mutate them.
+"""
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from profiler import count_cache_call
+
+MAX_FIGURES = 64
+
+_figures: OrderedDict[bytes, object] = OrderedDict()
+_payload_sizes: dict[bytes, int] = {}  # key -> len(fig.to_json()), filled on first ask
+_lock = threading.Lock()
+
+
+def _feed(h, value) -> None:
+    if isinstance(value, pd.DataFrame):
+        h.update(repr(("frame", list(value.columns), list(value.dtypes), value.shape)).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        h.update(repr(("series", value.name, value.dtype, value.shape)).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        h.update(repr((value.dtype.str, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"seq{len(value)}(".encode())
+        for item in value:
+            _feed(h, item)
+        h.update(b")")
+    elif isinstance(value, dict):
+        h.update(f"map{len(value)}(".encode())
+        for key in sorted(value, key=repr):
+            _feed(h, key)
+            _feed(h, value[key])
+        h.update(b")")
+    else:
+        h.update(repr((type(value).__name__, value)).encode())
+
+
+def figure_key(name: str, args: tuple, kwargs: dict) -> bytes:
+    h = hashlib.blake2b(name.encode(), digest_size=16)
+    _feed(h, args)
+    _feed(h, kwargs)
+    return h.digest()
+
+
+def cached_figure(name: str):
+    def decorate(build):
+        @functools.wraps(build)
+        def wrapper(*args, **kwargs):
+            key = figure_key(name, args, kwargs)
+            with _lock:
+                fig = _figures.get(key)
+                if fig is not None:
+                    _figures.move_to_end(key)
+            count_cache_call(f"figure: {name}", miss=False)
+            if fig is not None:
+                return fig
+            count_cache_call(f"figure: {name}", miss=True)
+
+            # build outside the lock; two sessions racing on the same key just build it twice
+            fig = build(*args, **kwargs)
+            with _lock:
+                _figures[key] = fig
+                _figures.move_to_end(key)
+                while len(_figures) > MAX_FIGURES:
+                    evicted, _ = _figures.popitem(last=False)
+                    _payload_sizes.pop(evicted, None)
+            return fig
+        return wrapper
+    return decorate
+
+
+def payload_bytes(fig) -> int:
+    """Size of `fig` as JSON (what st.plotly_chart sends), serialized once per cached figure."""
+    with _lock:
+        key = next((k for k, cached in _figures.items() if cached is fig), None)
+        size = _payload_sizes.get(key) if key is not None else None
+    if size is not None:
+        return size
+    size = len(fig.to_json())
+    if key is not None:
+        with _lock:
+            if key in _figures:
+                _payload_sizes[key] = size
+    return size
+
+
+def clear_figures() -> None:
+    with _lock:
+        _figures.clear()
+        _payload_sizes.clear()
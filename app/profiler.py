@@ -0,0 +1,185 @@
+"""Lightweight timing spans for script reruns, kept per session for the Settings page.
+
+app.py opens a run at the top of every rerun and closes it in a `finally`, so a
+rerun cut short by st.stop() or st.rerun() is closed too; code in between wraps
+its sections in `span(...)`. A fragment rerun skips app.py, so a
+span entered with no open run becomes a run of its own. Finished runs go to a
+bounded deque in `st.session_state["perf_runs"]`.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+
+DEFAULT_KEEP_RUNS = 20
+RUNS_KEY = "perf_runs"
+KEEP_KEY = "perf_keep_runs"
+
+_local = threading.local()
+
+_cache_counts: dict[str, list[int]] = {}  # name -> [calls, misses], process-wide like the caches themselves
+_cache_lock = threading.Lock()
+
+
+def _run_log() -> deque:
+    runs = st.session_state.get(RUNS_KEY)
+    keep = int(st.session_state.get(KEEP_KEY, DEFAULT_KEEP_RUNS))
+    if runs is None or runs.maxlen != keep:
+        runs = deque(runs or (), maxlen=keep)
+        st.session_state[RUNS_KEY] = runs
+    return runs
+
+
+def begin_run(label: str = "rerun") -> None:
+    # grab the log up front: after st.stop() every st.* call raises, so end_run can't touch session_state
+    _local.run = {
+        "label": label,
+        "started_at": time.time(),
+        "t0": time.perf_counter_ns(),
+        "spans": [],
+        "depth": 0,
+        "log": _run_log(),
+    }
+
+
+def end_run(label: str | None = None) -> dict | None:
+    run = getattr(_local, "run", None)
+    _local.run = None
+    if run is None:
+        return None
+
+    total_ns = time.perf_counter_ns() - run["t0"]
+    record = {
+        "label": label or run["label"],
+        "started_at": run["started_at"],
+        "total_ms": total_ns / 1e6,
+        "spans": run["spans"],
+    }
+    run["log"].append(record)
+    return record
+
+
+@contextmanager
+def span(name: str):
+    run = getattr(_local, "run", None)
+    standalone = run is None
+    if standalone:
+        begin_run(name)
+        run = _local.run
+
+    depth = run["depth"]
+    run["depth"] = depth + 1
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end = time.perf_counter_ns()
+        run["depth"] = depth
+        run["spans"].append(
+            {"name": name, "start_ms": (start - run["t0"]) / 1e6, "duration_ms": (end - start) / 1e6, "depth": depth}
+        )
+        if standalone:
+            end_run()
+
+
+def timed(name: str):
+    """Decorator form of `span`; put it under @st.fragment so fragment reruns are timed too."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def recent_runs() -> list[dict]:
+    return list(st.session_state.get(RUNS_KEY) or ())
+
+
+# cache hit rates
+
+def count_cache_call(name: str, miss: bool) -> None:
+    """Count one call (miss=False) or one miss (miss=True); a miss is reported in addition to its call."""
+    with _cache_lock:
+        counts = _cache_counts.setdefault(name, [0, 0])
+        counts[1 if miss else 0] += 1
+
+
+def tracked_cache(name: str, **cache_kwargs):
+    """`st.cache_data` that also counts calls and misses (the body only runs on a miss)."""
+    def decorate(func):
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            count_cache_call(name, miss=True)
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(**cache_kwargs)(on_miss)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            count_cache_call(name, miss=False)
+            with span(f"cache: {name}"):
+                return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+def cache_stats() -> list[dict]:
+    with _cache_lock:
+        counts = {name: tuple(c) for name, c in _cache_counts.items()}
+    rows = []
+    for name, (calls, misses) in sorted(counts.items()):
+        hits = max(calls - misses, 0)
+        rows.append({"cache": name, "calls": calls, "hits": hits, "misses": misses, "hit_rate": hits / calls if calls else None})
+    return rows
+
+
+# summaries and export
+
+def slowest_sections(runs: list[dict], top: int = 10) -> list[dict]:
+    by_name: dict[str, list[float]] = {}
+    for run in runs:
+        for s in run["spans"]:
+            by_name.setdefault(s["name"], []).append(s["duration_ms"])
+    rows = [
+        {"section": name, "count": len(d), "mean_ms": sum(d) / len(d), "max_ms": max(d), "total_ms": sum(d)}
+        for name, d in by_name.items()
+    ]
+    rows.sort(key=lambda r: r["total_ms"], reverse=True)
+    return rows[:top]
+
+
+def runs_to_json(runs: list[dict]) -> str:
+    return json.dumps({"runs": runs, "caches": cache_stats()}, indent=2)
+
+
+def runs_to_chrome_trace(runs: list[dict]) -> str:
+    """Trace Event Format (chrome://tracing, Perfetto): one complete event per span, one row per rerun."""
+    pid = os.getpid()
+    events = []
+    for i, run in enumerate(runs, start=1):
+        base_us = run["started_at"] * 1e6
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": i, "args": {"name": f"#{i} {run['label']}"}})
+        events.append({"name": run["label"], "cat": "rerun", "ph": "X", "pid": pid, "tid": i, "ts": base_us, "dur": run["total_ms"] * 1e3})
+        for s in run["spans"]:
+            events.append(
+                {
+                    "name": s["name"],
+                    "cat": "span",
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": i,
+                    "ts": base_us + s["start_ms"] * 1e3,
+                    "dur": s["duration_ms"] * 1e3,
+                    "args": {"depth": s["depth"]},
+                }
+            )
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
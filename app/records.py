@@ -0,0 +1,114 @@
+from dataclasses import asdict, dataclass, field, fields
+
+
+@dataclass(slots=True)
+class SavedCalc:
+    id: str
+    label: str = "Unnamed"
+    run_date: str = ""
+    city: str = "-"
+
+    program_name: str = ""
+    program_type: str = ""
+    program_start: str = ""
+    program_end: str = ""
+    program_tuition_total: float = 0.0
+    program_loan_amount: float = 0.0
+
+    total_income: float = 0.0
+    total_expenses: float = 0.0
+    balance: float = 0.0
+
+    monthly_job_income: float = 0.0
+    stipend: float = 0.0
+
+    rent: float = 0.0
+    utilities: float = 0.0
+    food: float = 0.0
+    transport: float = 0.0
+    phone_internet: float = 0.0
+    misc_basic: float = 0.0
+
+    health_score: int = 0
+    rent_ratio: float | None = None
+    savings_rate: float | None = None
+    buffer_months: float = 0.0
+
+    @property
+    def display_label(self) -> str:
+        return f"{self.label}  |  {self.city}  |  ${float(self.balance):,.0f}/month  |  {self.run_date}"
+
+
+@dataclass(slots=True)
+class Scenario:
+    id: str
+    name: str = "Unnamed"
+    city: str = "-"
+    visa: str = "-"
+    program_start: str = ""
+    program_end: str = ""
+    phases: list = field(default_factory=list)
+
+    @property
+    def display_label(self) -> str:
+        return f"{self.name}  |  {self.city}  |  {self.visa}"
+
+
+def record_from_dict(cls, data: dict):
+    # stored payloads may come from older versions: drop unknown keys, default missing ones
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def record_to_dict(record) -> dict:
+    return asdict(record)
+
+
+class RecordTable:
+    """Records in insertion order with an id -> position index and display labels kept up to date on insert."""
+
+    __slots__ = ("records", "_pos", "_labels")
+
+    def __init__(self, records=()):
+        self.records: list = []
+        self._pos: dict[str, int] = {}
+        self._labels: dict[str, str] = {}
+        for record in records:
+            self.put(record)
+
+    @classmethod
+    def from_dicts(cls, record_cls, rows) -> "RecordTable":
+        return cls(record_from_dict(record_cls, row) for row in rows)
+
+    def put(self, record) -> None:
+        """Insert, or replace the record with the same id in place."""
+        pos = self._pos.get(record.id)
+        if pos is None:
+            self._pos[record.id] = len(self.records)
+            self.records.append(record)
+        else:
+            self.records[pos] = record
+        self._labels[record.id] = record.display_label
+
+    def get(self, record_id):
+        pos = self._pos.get(record_id)
+        return None if pos is None else self.records[pos]
+
+    def position(self, record_id, default: int | None = None) -> int | None:
+        return self._pos.get(record_id, default)
+
+    def label(self, record_id) -> str:
+        return self._labels[record_id]
+
+    @property
+    def ids(self) -> list[str]:
+        return list(self._pos)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __bool__(self) -> bool:
+        return bool(self.records)
@@ -0,0 +1,189 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+
+DEFAULT_DB_PATH = os.environ.get("STUDENT_DASHBOARD_DB", "data/dashboard.sqlite3")
+HISTORY_KEEP = 12
+WRITE_BATCH_MAX = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_calcs (
+    user_key   TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload    TEXT NOT NULL,
+    PRIMARY KEY (user_key, id)
+);
+CREATE INDEX IF NOT EXISTS saved_calcs_user_created ON saved_calcs (user_key, created_at);
+
+CREATE TABLE IF NOT EXISTS scenarios (
+    user_key   TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload    TEXT NOT NULL,
+    PRIMARY KEY (user_key, id)
+);
+CREATE INDEX IF NOT EXISTS scenarios_user_created ON scenarios (user_key, created_at);
+
+CREATE TABLE IF NOT EXISTS calc_history (
+    user_key TEXT NOT NULL,
+    seq      INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calc_history_user_seq ON calc_history (user_key, seq);
+"""
+
+logger = logging.getLogger(__name__)
+
+_UPSERT = {
+    table: (
+        f"INSERT INTO {table} (user_key, id, created_at, payload) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (user_key, id) DO UPDATE SET payload = excluded.payload"
+    )
+    for table in ("saved_calcs", "scenarios")
+}
+_APPEND_HISTORY = "INSERT INTO calc_history (user_key, payload) VALUES (?, ?)"
+_TRIM_HISTORY = (
+    "DELETE FROM calc_history WHERE user_key = ? AND seq NOT IN "
+    "(SELECT seq FROM calc_history WHERE user_key = ? ORDER BY seq DESC LIMIT ?)"
+)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+class Store:
+    """Per-user saved calculations, scenarios and calculator history in SQLite (WAL).
+
+    Reads run on a per-thread connection and never wait on writers. Writes are queued
+    and applied by one background thread, which drains whatever has piled up into a
+    single transaction, so many sessions saving at once cost one commit, not one each.
+    A write that still fails on its own is logged and counted per user (`failed_writes`).
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with closing(_connect(self.path)) as conn:
+            conn.executescript(SCHEMA)
+        self._local = threading.local()
+        self._failed: Counter[str] = Counter()
+        self._failed_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    # reads
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _connect(self.path)
+            self._local.conn = conn
+        return conn
+
+    def _payloads(self, sql: str, params: tuple) -> list[dict]:
+        return [json.loads(row[0]) for row in self._reader().execute(sql, params)]
+
+    def list_saved_calcs(self, user_key: str) -> list[dict]:
+        return self._payloads(
+            "SELECT payload FROM saved_calcs WHERE user_key = ? ORDER BY created_at, id", (user_key,)
+        )
+
+    def list_scenarios(self, user_key: str) -> list[dict]:
+        return self._payloads(
+            "SELECT payload FROM scenarios WHERE user_key = ? ORDER BY created_at, id", (user_key,)
+        )
+
+    def list_history(self, user_key: str) -> list[dict]:
+        rows = self._payloads(
+            "SELECT payload FROM calc_history WHERE user_key = ? ORDER BY seq DESC LIMIT ?",
+            (user_key, HISTORY_KEEP),
+        )
+        return rows[::-1]
+
+    # writes (queued)
+    def save_calc(self, user_key: str, entry: dict) -> None:
+        self._queue.put((_UPSERT["saved_calcs"], (user_key, entry["id"], time.time(), json.dumps(entry))))
+
+    def save_scenario(self, user_key: str, scenario: dict) -> None:
+        self._queue.put((_UPSERT["scenarios"], (user_key, scenario["id"], time.time(), json.dumps(scenario))))
+
+    def append_history(self, user_key: str, row: dict) -> None:
+        self._queue.put((_APPEND_HISTORY, (user_key, json.dumps(row))))
+        self._queue.put((_TRIM_HISTORY, (user_key, user_key, HISTORY_KEEP)))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued write is committed (or the timeout passes)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def failed_writes(self, user_key: str) -> int:
+        """How many of this user's queued writes could not be saved since the process started."""
+        with self._failed_lock:
+            return self._failed[user_key]
+
+    def _write_loop(self) -> None:
+        conn = _connect(self.path)
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for sql, params in batch:
+                    conn.execute(sql, params)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                logger.warning("Batch of %d writes to %s failed; retrying one by one", len(batch), self.path, exc_info=True)
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                # retry one by one so a single bad row doesn't drop the rest of the batch
+                for sql, params in batch:
+                    try:
+                        conn.execute(sql, params)
+                    except sqlite3.Error:
+                        logger.exception("Dropped a write to %s for user %s", self.path, params[0])
+                        with self._failed_lock:
+                            self._failed[params[0]] += 1  # every write's first parameter is the user key
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_stores: dict[str, Store] = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(path: str = DEFAULT_DB_PATH) -> Store:
+    """One Store (and one writer thread) per database file for the whole process."""
+    full = os.path.abspath(path)
+    store = _stores.get(full)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(full)
+            if store is None:
+                store = Store(full)
+                _stores[full] = store
+    return store
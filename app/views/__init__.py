@@ -0,0 +1,15 @@
+import importlib
+
+# page name -> module in this package; a page's module (and what it imports) loads on first visit
+PAGES = {
+    "Onboarding": "onboarding",
+    "Calculator": "calculator",
+    "Scenarios": "scenarios",
+    "City Compare": "city_compare",
+    "My Plan": "my_plan",
+    "Settings": "settings",
+}
+
+
+def render(page: str) -> None:
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
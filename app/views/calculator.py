@@ -0,0 +1,630 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import date, timedelta
+
+from engine import build_expense_pressure_df, calculate_budget, clamp, scenario_surface
+from figcache import cached_figure
+from profiler import span, timed, tracked_cache
+from records import SavedCalc, record_to_dict
+
+from .common import (
+    CITY_EXPENSE_PRESETS,
+    CITY_MIN_WAGE,
+    DEFAULT_CITY,
+    STORE,
+    make_saved_calc_id,
+    money,
+    risk_badge_html,
+)
+
+
+SENSITIVITY_EXTRA_HOURS = [float(h) for h in range(0, 11)]
+SENSITIVITY_RENT_CHANGE = [float(r) for r in range(-500, 525, 25)]
+SENSITIVITY_EXTRA_INCOME = [float(i) for i in range(0, 1050, 50)]
+
+
+@tracked_cache("scenario surface", max_entries=16, show_spinner=False)
+def cached_scenario_surface(weekly_job_income, wage, weeks_per_month, stipend, expense_values):
+    # the whole hours x rent x extra-income cube, so moving the extra-income slider is a lookup
+    expenses = dict(zip(["rent", "utilities", "food", "transport", "phone_internet", "misc_basic"], expense_values))
+    return scenario_surface(
+        weekly_job_income,
+        wage,
+        weeks_per_month,
+        stipend,
+        expenses,
+        SENSITIVITY_EXTRA_HOURS,
+        SENSITIVITY_RENT_CHANGE,
+        SENSITIVITY_EXTRA_INCOME,
+    )
+
+
+@cached_figure("income vs expenses")
+def income_vs_expenses_figure(total_income, total_expenses):
+    comparison_df = pd.DataFrame({"Category": ["Total income", "Total expenses"], "Amount": [total_income, total_expenses]})
+    fig = px.bar(comparison_df, x="Category", y="Amount", text="Amount", title="Income vs essential expenses")
+    fig.update_traces(texttemplate="$%{text:,.0f}", textposition="outside", cliponaxis=False)
+    fig.update_yaxes(range=[0, max(total_income, total_expenses) * 1.25])
+    fig.update_layout(yaxis_title="USD", xaxis_title="")
+    return fig
+
+
+@cached_figure("expense breakdown")
+def expense_breakdown_figure(amounts):
+    exp_all_df = pd.DataFrame(
+        {"Expense": ["Rent", "Utilities", "Food", "Transport", "Phone/Internet", "Misc basics"], "Amount": list(amounts)}
+    )
+    fig = px.bar(exp_all_df, x="Expense", y="Amount", text="Amount", title="Expense breakdown")
+    fig.update_traces(texttemplate="$%{text:,.0f}", textposition="outside", cliponaxis=False)
+    fig.update_yaxes(range=[0, max(exp_all_df["Amount"]) * 1.25])
+    fig.update_layout(yaxis_title="USD", xaxis_title="")
+    return fig
+
+
+@cached_figure("sensitivity heatmap")
+def sensitivity_figure(values, color_label, title, **color_options):
+    return px.imshow(
+        values,
+        x=SENSITIVITY_RENT_CHANGE,
+        y=SENSITIVITY_EXTRA_HOURS,
+        labels={"x": "Rent change ($/month)", "y": "Extra hours per week", "color": color_label},
+        aspect="auto",
+        origin="lower",
+        color_continuous_scale="RdYlGn",
+        title=title,
+        **color_options,
+    )
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("Personal Calculator")
+    st.markdown(
+        "<div class='small-note'>Fill the form and click Calculate. You can also save the result for My Plan.</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    with span("form"), st.form("calculator_form"):
+        top1, top2, top3 = st.columns([1.2, 1, 1])
+
+        with top1:
+            calc_city = st.selectbox("City", list(CITY_MIN_WAGE.keys()), index=list(CITY_MIN_WAGE.keys()).index(DEFAULT_CITY))
+
+        with top2:
+            min_wage = CITY_MIN_WAGE.get(calc_city, 15.0)
+            wage = st.number_input("Minimum wage ($/hour)", min_value=0.0, value=float(min_wage), step=0.25)
+
+        with top3:
+            weeks_per_month = st.number_input("Weeks per month", min_value=3.0, max_value=5.0, value=4.33, step=0.01)
+
+        st.write("")
+        st.markdown("### Work hours (weekly)")
+        h1, h2, h3, h4 = st.columns(4)
+        with h1:
+            hours_mon_fri = st.number_input("Hours Mon-Fri (total)", min_value=0.0, value=20.0, step=1.0)
+        with h2:
+            hours_sat = st.number_input("Hours Saturday", min_value=0.0, value=0.0, step=1.0)
+        with h3:
+            hours_sun = st.number_input("Hours Sunday", min_value=0.0, value=0.0, step=1.0)
+        with h4:
+            sunday_multiplier = st.number_input("Sunday pay multiplier", min_value=1.0, value=1.0, step=0.25)
+
+        st.write("")
+        st.markdown("### Other monthly income")
+        stipend = st.number_input("Monthly stipend / support ($)", min_value=0.0, value=0.0, step=50.0)
+
+        st.write("")
+        st.markdown("### Monthly expenses")
+
+        pcol, _ = st.columns([1.5, 1])
+        with pcol:
+            use_preset = st.checkbox("Use city presets for basic expenses", value=False)
+
+        preset = CITY_EXPENSE_PRESETS.get(calc_city, CITY_EXPENSE_PRESETS.get(DEFAULT_CITY, {}))
+
+        e1, e2, e3 = st.columns(3)
+        with e1:
+            rent = st.number_input(
+                "Rent ($)",
+                min_value=0.0,
+                value=float(preset.get("rent", 850)) if use_preset else 850.0,
+                step=25.0,
+            )
+            utilities = st.number_input(
+                "Utilities ($)",
+                min_value=0.0,
+                value=float(preset.get("utilities", 120)) if use_preset else 120.0,
+                step=10.0,
+            )
+        with e2:
+            food = st.number_input(
+                "Food ($)",
+                min_value=0.0,
+                value=float(preset.get("food", 350)) if use_preset else 350.0,
+                step=10.0,
+            )
+            transport = st.number_input(
+                "Transport ($)",
+                min_value=0.0,
+                value=float(preset.get("transport", 90)) if use_preset else 90.0,
+                step=10.0,
+            )
+        with e3:
+            phone_internet = st.number_input(
+                "Phone/Internet ($)",
+                min_value=0.0,
+                value=float(preset.get("phone_internet", 60)) if use_preset else 60.0,
+                step=10.0,
+            )
+            misc_basic = st.number_input(
+                "Misc basics ($)",
+                min_value=0.0,
+                value=float(preset.get("misc_basic", 130)) if use_preset else 130.0,
+                step=10.0,
+            )
+
+        st.write("")
+        st.markdown("### Program details (optional, helps naming and saving)")
+        d1, d2 = st.columns(2)
+        with d1:
+            program_name = st.text_input("Program name", value=st.session_state.get("program_name", ""))
+            program_type = st.selectbox(
+                "Scenario type",
+                ["Current offer", "Backup offer", "Dream option", "Current school"],
+                index=["Current offer", "Backup offer", "Dream option", "Current school"].index(st.session_state.get("program_type", "Current offer")),
+            )
+            program_start = st.date_input("Program start date", value=st.session_state.get("program_start", date.today()))
+        with d2:
+            program_end = st.date_input("Expected graduation date", value=st.session_state.get("program_end", date.today() + timedelta(days=365)))
+            program_tuition_total = st.number_input(
+                "Total tuition and fees for full program ($)",
+                min_value=0.0,
+                value=float(st.session_state.get("program_tuition_total", 0.0)),
+                step=1000.0,
+            )
+            program_loan_amount = st.number_input(
+                "Planned total loan amount ($)",
+                min_value=0.0,
+                value=float(st.session_state.get("program_loan_amount", 0.0)),
+                step=1000.0,
+            )
+
+        st.write("")
+        submitted = st.form_submit_button("✅ Calculate")
+
+    if not submitted and not st.session_state.get("calc_ready", False):
+        st.info("Fill the form and click Calculate. Your results stay available across pages after the first run.")
+    elif submitted:
+        budget = calculate_budget(
+            wage=wage,
+            weeks_per_month=weeks_per_month,
+            hours_mon_fri=hours_mon_fri,
+            hours_sat=hours_sat,
+            hours_sun=hours_sun,
+            sunday_multiplier=sunday_multiplier,
+            stipend=stipend,
+            expenses={
+                "rent": rent,
+                "utilities": utilities,
+                "food": food,
+                "transport": transport,
+                "phone_internet": phone_internet,
+                "misc_basic": misc_basic,
+            },
+        )
+        weekly_job_income = budget["weekly_job_income"]
+        monthly_job_income = budget["monthly_job_income"]
+        total_income = budget["total_income"]
+        total_expenses = budget["total_expenses"]
+        balance = budget["balance"]
+        status = budget["status"]
+        health_score, score_breakdown = budget["health_score"], budget["breakdown"]
+
+        # persist core
+        st.session_state["weekly_job_income"] = float(weekly_job_income)
+        st.session_state["monthly_job_income"] = float(monthly_job_income)
+        st.session_state["wage"] = float(wage)
+        st.session_state["weeks_per_month"] = float(weeks_per_month)
+        st.session_state["stipend"] = float(stipend)
+
+        st.session_state["total_income"] = float(total_income)
+        st.session_state["total_expenses"] = float(total_expenses)
+        st.session_state["balance"] = float(balance)
+        st.session_state["status"] = status
+        st.session_state["context_city"] = calc_city
+
+        st.session_state["health_score"] = int(health_score)
+        st.session_state["rent_ratio"] = float(score_breakdown["rent_ratio"]) if score_breakdown["rent_ratio"] is not None else None
+        st.session_state["savings_rate"] = float(score_breakdown["savings_rate"]) if score_breakdown["savings_rate"] is not None else None
+        st.session_state["buffer_months"] = float(score_breakdown.get("buffer_months", 0.0))
+
+        st.session_state["rent"] = float(rent)
+        st.session_state["utilities"] = float(utilities)
+        st.session_state["food"] = float(food)
+        st.session_state["transport"] = float(transport)
+        st.session_state["phone_internet"] = float(phone_internet)
+        st.session_state["misc_basic"] = float(misc_basic)
+
+        # program details 
+        st.session_state["program_name"] = program_name
+        st.session_state["program_type"] = program_type
+        st.session_state["program_start"] = program_start
+        st.session_state["program_end"] = program_end
+        st.session_state["program_tuition_total"] = float(program_tuition_total)
+        st.session_state["program_loan_amount"] = float(program_loan_amount)
+
+        st.session_state["calc_ready"] = True
+
+        # history
+        history_row = {"run_date": str(date.today()), "city": calc_city, "total_income": float(total_income), "total_expenses": float(total_expenses), "balance": float(balance)}
+        st.session_state["calc_history"].append(history_row)
+        st.session_state["calc_history"] = st.session_state["calc_history"][-12:]
+        STORE.append_history(st.session_state["store_user_key"], history_row)
+
+    # show results if ready
+    if st.session_state.get("calc_ready", False):
+        total_income = float(st.session_state["total_income"])
+        total_expenses = float(st.session_state["total_expenses"])
+        balance = float(st.session_state["balance"])
+        status = st.session_state["status"]
+        calc_city = st.session_state["context_city"]
+
+        wage = float(st.session_state["wage"])
+        monthly_job_income = float(st.session_state["monthly_job_income"])
+        stipend = float(st.session_state["stipend"])
+
+        rent = float(st.session_state["rent"])
+        utilities = float(st.session_state["utilities"])
+        food = float(st.session_state["food"])
+        transport = float(st.session_state["transport"])
+        phone_internet = float(st.session_state["phone_internet"])
+        misc_basic = float(st.session_state["misc_basic"])
+
+        program_name = st.session_state.get("program_name", "")
+        program_type = st.session_state.get("program_type", "Current offer")
+        program_start = st.session_state.get("program_start", date.today())
+        program_end = st.session_state.get("program_end", date.today() + timedelta(days=365))
+        program_tuition_total = float(st.session_state.get("program_tuition_total", 0.0))
+        program_loan_amount = float(st.session_state.get("program_loan_amount", 0.0))
+
+        # Results card
+        with span("card: results"):
+            st.markdown("<div class='card'>", unsafe_allow_html=True)
+            st.subheader("Results")
+            st.write("")
+
+            r1, r2, r3, r4 = st.columns(4)
+            r1.metric("City", calc_city)
+            r2.metric("Min wage", f"${wage:.2f}/hr")
+            r3.metric("Monthly job income (est.)", money(monthly_job_income))
+            r4.metric("Monthly stipend", money(stipend))
+
+            st.write("")
+            k1, k2, k3 = st.columns(3)
+            k1.metric("Total income", money(total_income))
+            k2.metric("Total expenses", money(total_expenses))
+            k3.metric("Balance", money(balance))
+
+            st.write("")
+            if status == "Surplus":
+                st.success("SURPLUS. You have buffer after essentials.")
+            elif status == "Break-even":
+                st.warning("BREAK-EVEN. You are surviving, but there is no buffer.")
+            else:
+                st.error("DEFICIT. You will likely need support or expense cuts.")
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # Financial health and risk zones
+        with span("card: financial health"):
+            st.markdown("<div class='card'>", unsafe_allow_html=True)
+            st.subheader("Financial Health and risk zones")
+            st.write("")
+
+            score = int(st.session_state.get("health_score", 0))
+            rent_ratio = float(st.session_state.get("rent_ratio") or 0.0)
+            savings_rate = float(st.session_state.get("savings_rate") or 0.0)
+            buffer_months = float(st.session_state.get("buffer_months", 0.0))
+
+            st.progress(int(clamp(score, 0, 100)))
+
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric(
+                "Score",
+                f"{score}/100",
+                help="Quick 0–100 view of how your month looks (income, expenses, savings, buffer)."
+            )
+            c2.metric(
+                "Rent / income",
+                f"{rent_ratio*100:.1f}%",
+                help="How much of your monthly income goes to rent."
+            )
+            c3.metric(
+                "Savings rate",
+                f"{savings_rate*100:.1f}%",
+                help="Part of your income left after core expenses. Think of it as your savings muscle."
+            )
+            c4.metric(
+                "Buffer (months)",
+                f"{buffer_months:.1f}",
+                help="Buffer months is how long you can survive if income stops and you keep spending the same."
+            )
+            st.write("")
+            rb1, rb2, rb3 = st.columns(3)
+
+            # rent badge
+            if rent_ratio <= 0.30:
+                rent_badge = risk_badge_html("Rent is light", "good")
+            elif rent_ratio <= 0.40:
+                rent_badge = risk_badge_html("Rent is heavy", "warn")
+            else:
+                rent_badge = risk_badge_html("Rent is very high", "bad")
+
+            # buffer badge
+            if buffer_months >= 2:
+                buf_badge = risk_badge_html("Buffer is ok", "good")
+            elif buffer_months >= 1:
+                buf_badge = risk_badge_html("Thin buffer", "warn")
+            else:
+                buf_badge = risk_badge_html("No buffer", "bad")
+
+            # savings badge
+            if savings_rate >= 0.10:
+                sav_badge = risk_badge_html("Strong savings", "good")
+            elif savings_rate >= 0.05:
+                sav_badge = risk_badge_html("Low savings", "warn")
+            else:
+                sav_badge = risk_badge_html("No savings", "bad")
+
+            with rb1:
+                st.markdown(f"Rent pressure: {rent_badge}", unsafe_allow_html=True)
+            with rb2:
+                st.markdown(f"Emergency cushion: {buf_badge}", unsafe_allow_html=True)
+            with rb3:
+                st.markdown(f"Savings habit: {sav_badge}", unsafe_allow_html=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # Analytics insights
+        with span("card: analytics insights"):
+            st.markdown("<div class='card'>", unsafe_allow_html=True)
+            st.subheader("Analytics insights")
+            st.write("")
+
+            expense_dict = {"Rent": rent, "Food": food, "Transport": transport}
+            exp_df = build_expense_pressure_df(total_income, expense_dict)
+
+            st.markdown("#### Expense pressure indicators")
+            st.write("")
+            for _, row in exp_df.iterrows():
+                share_pct = float(row["ShareOfIncome"]) * 100
+                st.markdown(
+                    f"- **{row['Expense']}**: {money(row['Amount'])} "
+                    f"({share_pct:.1f}% of income) "
+                    f"<span class='pill {row['FlagCss']}'>{row['FlagLabel']}</span>",
+                    unsafe_allow_html=True,
+                )
+
+            st.write("")
+            st.markdown("<hr class='soft'>", unsafe_allow_html=True)
+
+            st.markdown("#### Trend insights")
+            st.write("")
+            hist = pd.DataFrame(st.session_state.get("calc_history", []))
+            if not hist.empty:
+                hist["balance"] = pd.to_numeric(hist["balance"], errors="coerce")
+                last3 = hist["balance"].tail(3)
+                rolling3 = float(last3.mean()) if len(last3) > 0 else float(balance)
+                st.caption(f"3-run rolling average balance: {money(rolling3)}")
+
+            projected_6m = float(balance) * 6
+            st.caption(f"Simple projection: at this rate, in 6 months your net change is about {money(projected_6m)}")
+
+            st.write("")
+            st.markdown("<hr class='soft'>", unsafe_allow_html=True)
+
+            st.markdown("#### Extra risk flags")
+            st.write("")
+            flags = []
+            if total_income > 0 and (rent / total_income) > 0.40:
+                flags.append("Rent shock risk (rent is above 40 percent of income).")
+            if buffer_months <= 0:
+                flags.append("Zero buffer risk (no savings cushion).")
+            if balance < 0:
+                flags.append("Cashflow deficit risk (spending more than income).")
+
+            if hist.shape[0] >= 4:
+                vol = float(hist["balance"].tail(6).std() or 0.0)
+                if vol > 200:
+                    flags.append("Income or expense volatility across recent runs.")
+
+            if flags:
+                for f in flags:
+                    st.warning(f)
+            else:
+                st.success("No major risk flags triggered from current inputs.")
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # Charts
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.subheader("Charts")
+        st.write("")
+
+        ch1, ch2 = st.columns(2)
+        with ch1, span("chart: income vs expenses"):
+            st.plotly_chart(income_vs_expenses_figure(total_income, total_expenses), use_container_width=True)
+
+        with ch2, span("chart: expense breakdown"):
+            fig2 = expense_breakdown_figure((rent, utilities, food, transport, phone_internet, misc_basic))
+            st.plotly_chart(fig2, use_container_width=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # Scenario simulator (quick what-ifs). A fragment: its sliders rerun only this section.
+        @st.fragment
+        @timed("fragment: scenario simulator")
+        def scenario_simulator(rent, utilities, food, transport, phone_internet, misc_basic, total_income, total_expenses, balance):
+            st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+            st.subheader("Scenario simulator")
+            st.caption("Try quick what-ifs without changing the form above.")
+            st.write("")
+
+            s1, s2, s3 = st.columns(3)
+            with s1:
+                extra_hours = st.slider("Extra work hours per week", 0.0, 10.0, 0.0, 1.0)
+            with s2:
+                rent_change = st.slider("Rent change ($/month)", -500.0, 500.0, 0.0, 25.0)
+            with s3:
+                extra_income = st.slider("Extra monthly income ($)", 0.0, 1000.0, 0.0, 50.0)
+
+            base_weekly_job_income = float(st.session_state["weekly_job_income"])
+            base_wage = float(st.session_state["wage"])
+            base_weeks_per_month = float(st.session_state["weeks_per_month"])
+            base_stipend = float(st.session_state["stipend"])
+
+            scenario_weekly_job_income = base_weekly_job_income + (base_wage * extra_hours)
+            scenario_monthly_job_income = scenario_weekly_job_income * base_weeks_per_month
+
+            scenario_rent = max(rent + rent_change, 0.0)
+            scenario_total_expenses = scenario_rent + utilities + food + transport + phone_internet + misc_basic
+            scenario_total_income = scenario_monthly_job_income + base_stipend + extra_income
+            scenario_balance = scenario_total_income - scenario_total_expenses
+            delta_balance = scenario_balance - balance
+
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Scenario income / month", money(scenario_total_income), delta=money(scenario_total_income - total_income))
+            c2.metric("Scenario expenses / month", money(scenario_total_expenses), delta=money(scenario_total_expenses - total_expenses))
+            c3.metric("Scenario balance / month", money(scenario_balance), delta=money(delta_balance))
+
+            st.write("")
+            if delta_balance > 0:
+                st.success("This scenario improves your monthly balance.")
+            elif delta_balance < 0:
+                st.warning("This scenario reduces your monthly balance.")
+            else:
+                st.info("This scenario keeps your balance the same.")
+
+            st.write("")
+            if st.toggle("Sensitivity mode: see every extra-hours × rent-change combination", key="calc_sensitivity_mode"):
+                surface = cached_scenario_surface(
+                    base_weekly_job_income,
+                    base_wage,
+                    base_weeks_per_month,
+                    base_stipend,
+                    (rent, utilities, food, transport, phone_internet, misc_basic),
+                )
+                income_idx = SENSITIVITY_EXTRA_INCOME.index(extra_income) if extra_income in SENSITIVITY_EXTRA_INCOME else 0
+                st.caption(f"Each cell is one scenario, with extra monthly income fixed at {money(SENSITIVITY_EXTRA_INCOME[income_idx])} (the slider above).")
+
+                hm1, hm2 = st.columns(2)
+                with hm1, span("chart: sensitivity balance"):
+                    fig_bal = sensitivity_figure(surface["balance"][:, :, income_idx], "Balance", "Monthly balance", color_continuous_midpoint=0)
+                    st.plotly_chart(fig_bal, use_container_width=True)
+                with hm2, span("chart: sensitivity score"):
+                    fig_score = sensitivity_figure(surface["health_score"][:, :, income_idx], "Score", "Health score", range_color=[0, 100])
+                    st.plotly_chart(fig_score, use_container_width=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        scenario_simulator(rent, utilities, food, transport, phone_internet, misc_basic, total_income, total_expenses, balance)
+
+        # Save calculation for My Plan
+        with span("card: save calculation"):
+            st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+            st.subheader("Save this calculation for My Plan")
+            st.caption("Save multiple options like WashU 2025, UT Dallas backup, etc.")
+            st.write("")
+
+            default_label = f"{program_name or calc_city}  •  {money(balance)}/month"
+            label = st.text_input("Name for this saved calculation", value=default_label, key="save_calc_label")
+
+            col_save, col_clear = st.columns([1, 1.2])
+            with col_save:
+                save_clicked = st.button("💾 Save calculation")
+            with col_clear:
+                st.caption("Tip: after saving, go to My Plan to compare, plan, and run debt payback.")
+
+            if save_clicked:
+                calc_id = make_saved_calc_id()
+                saved_entry = SavedCalc(
+                    id=calc_id,
+                    label=label,
+                    run_date=str(date.today()),
+                    city=calc_city,
+
+                    program_name=program_name,
+                    program_type=program_type,
+                    program_start=str(program_start),
+                    program_end=str(program_end),
+                    program_tuition_total=float(program_tuition_total),
+                    program_loan_amount=float(program_loan_amount),
+
+                    total_income=float(total_income),
+                    total_expenses=float(total_expenses),
+                    balance=float(balance),
+
+                    monthly_job_income=float(monthly_job_income),
+                    stipend=float(stipend),
+
+                    rent=float(rent),
+                    utilities=float(utilities),
+                    food=float(food),
+                    transport=float(transport),
+                    phone_internet=float(phone_internet),
+                    misc_basic=float(misc_basic),
+
+                    health_score=int(score),
+                    rent_ratio=float(rent_ratio),
+                    savings_rate=float(savings_rate),
+                    buffer_months=float(buffer_months),
+                )
+                st.session_state["saved_calcs"].put(saved_entry)
+                STORE.save_calc(st.session_state["store_user_key"], record_to_dict(saved_entry))
+                st.session_state["active_saved_calc_id"] = calc_id
+                st.success("Saved. Open My Plan to use this calculation.")
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # Download current calc
+        with span("card: download"):
+            st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+            st.subheader("Download")
+            st.caption("Export your current calculation as CSV.")
+            st.write("")
+
+            result_row = {
+                "city": calc_city,
+                "program_name": program_name,
+                "program_type": program_type,
+                "program_start": str(program_start),
+                "program_end": str(program_end),
+                "program_tuition_total": program_tuition_total,
+                "program_loan_amount": program_loan_amount,
+                "min_wage": wage,
+                "weeks_per_month": float(st.session_state["weeks_per_month"]),
+                "monthly_job_income_est": float(st.session_state["monthly_job_income"]),
+                "stipend": float(st.session_state["stipend"]),
+                "total_income": total_income,
+                "total_expenses": total_expenses,
+                "balance": balance,
+                "status": status,
+                "rent": rent,
+                "utilities": utilities,
+                "food": food,
+                "transport": transport,
+                "phone_internet": phone_internet,
+                "misc_basic": misc_basic,
+            }
+            out_df = pd.DataFrame([result_row])
+            csv_bytes = out_df.to_csv(index=False).encode("utf-8")
+
+            st.download_button(
+                label="⬇️ Download your calculation as CSV",
+                data=csv_bytes,
+                file_name=f"{calc_city}_calculator_result.csv",
+                mime="text/csv",
+                key="calc_download_csv",
+            )
+            st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,218 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import os
+
+from engine import minmax_indices, score_label
+from costdata import (
+    EXPENSE_COLUMNS,
+    CompareQuery,
+    DatasetError,
+    compare_tables_from_rollup,
+    cost_index,
+    get_backend,
+    is_parquet,
+    is_partitioned,
+    load_rollup,
+    memory_report,
+    resolve_source,
+    rollup_index,
+    track_slice,
+)
+from figcache import cached_figure, payload_bytes
+from profiler import span, timed
+
+from .common import money
+
+
+COSTS_PATH = os.environ.get("STUDENT_DASHBOARD_COSTS", "data/student_costs.csv")  # a file, or a city=.../year=... directory
+STREAMING_MIN_BYTES = 256 * 1024 * 1024  # CSVs at least this big are aggregated in chunks
+TREND_MAX_POINTS = 400  # per city line: a low and a high point for every ~4 px of an ~800 px wide chart
+TREND_MARKERS_MAX_MONTHS = 60
+
+
+def use_streaming(path: str) -> bool:
+    if is_parquet(path) or is_partitioned(path):
+        return False
+    try:
+        return os.path.getsize(path) >= STREAMING_MIN_BYTES
+    except OSError:
+        return False
+
+
+@cached_figure("balance trend")
+def balance_trend_figure(trend, markers=True):
+    fig = px.line(trend, x="month_dt", y="balance", color="city", markers=markers)
+    fig.update_layout(xaxis_title="Month", yaxis_title="Balance (USD)")
+    return fig
+
+
+@cached_figure("expense donut")
+def expense_donut_figure(city, expenses, amounts):
+    fig = px.pie(pd.DataFrame({"Expense": expenses, "Amount": amounts}), names="Expense", values="Amount", hole=0.55)
+    fig.update_layout(title=f"{city}: total expenses by category")
+    return fig
+
+
+def kb(n_bytes: float) -> str:
+    return f"{n_bytes / 1024:,.0f} KB" if n_bytes < 1024 * 1024 else f"{n_bytes / (1024 * 1024):,.1f} MB"
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("City comparison (CSV)")
+    st.markdown(f"<div class='small-note'>Compare cities using {COSTS_PATH} (month must be YYYY-MM).</div>", unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    with span("data: index"):
+        costs_source = resolve_source(COSTS_PATH)
+        streaming = use_streaming(costs_source)
+        try:
+            if streaming:
+                rollup = load_rollup(costs_source)
+                cities, months_sorted = rollup_index(rollup)
+            else:
+                cities, months_sorted = cost_index(costs_source)
+        except (DatasetError, OSError, ValueError) as exc:
+            st.error(str(exc))
+            st.stop()
+
+    expense_columns = EXPENSE_COLUMNS
+
+    f1, f2, f3 = st.columns([1.4, 1.3, 1.3])
+    with f1:
+        compare_cities = st.multiselect("Cities to compare", cities, default=cities[:2] if len(cities) >= 2 else cities)
+    with f2:
+        start_month = st.selectbox("Start month", months_sorted, index=0)
+    with f3:
+        end_month = st.selectbox("End month", months_sorted, index=len(months_sorted) - 1)
+
+    st.write("")
+    if len(compare_cities) < 2:
+        st.info("Select at least two cities to compare trends and expense mix.")
+        st.stop()
+
+    start_dt = pd.to_datetime(start_month, format="%Y-%m", errors="coerce")
+    end_dt = pd.to_datetime(end_month, format="%Y-%m", errors="coerce")
+    if pd.isna(start_dt) or pd.isna(end_dt) or start_dt > end_dt:
+        st.error("Invalid month range. Check Start and End month.")
+        st.stop()
+
+    with span("data: load + compare tables"):
+        if streaming:
+            summary, trend, exp_mix = compare_tables_from_rollup(rollup, compare_cities, start_dt, end_dt)
+            if summary.empty:
+                st.warning("No rows found for the selected cities and month range.")
+                st.stop()
+            st.caption("Large data file: results are aggregated in streaming mode.")
+        else:
+            try:
+                result = get_backend().compare(costs_source, CompareQuery(tuple(compare_cities), start_dt, end_dt))
+            except DatasetError as exc:
+                st.error(str(exc))
+                st.stop()
+            if result.empty:
+                st.warning("No rows found for the selected cities and month range.")
+                st.stop()
+            if result.rows is not None:
+                track_slice(st.session_state["session_key"], result.rows)
+            summary, trend, exp_mix = result.summary, result.trend, result.exp_mix
+
+    with span("card: KPI tiles"):
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("#### KPI tiles (average per month)")
+        st.write("")
+
+        cols = st.columns(min(4, len(summary)))
+        for i, row in summary.iterrows():
+            col = cols[i % len(cols)]
+            with col:
+                st.markdown("<div class='kpi-card'>", unsafe_allow_html=True)
+                st.markdown(f"<div class='kpi-label'>{row['city']}</div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='kpi-value'>{money(row['avg_balance'])}</div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='kpi-sub'>Avg income {money(row['avg_income'])} • Avg expenses {money(row['avg_expenses'])}</div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='kpi-sub'>Months: {int(row['months'])} • Savings rate: {row['savings_rate']*100:.1f}%</div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='kpi-sub'>Health score: {int(row['health_score'])}/100 ({score_label(int(row['health_score']))})</div>", unsafe_allow_html=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # A fragment: moving the zoom range re-slices and re-downsamples only this chart.
+    @st.fragment
+    @timed("fragment: balance trend")
+    def balance_trend(trend):
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("#### Balance trend (by city)")
+        st.write("")
+        months = trend["month_dt"].drop_duplicates().sort_values().dt.strftime("%Y-%m").tolist()
+        window = trend
+        if len(months) > 2:
+            zoom_start, zoom_end = st.select_slider(
+                "Zoom",
+                options=months,
+                value=(months[0], months[-1]),
+                help="Narrow the range to see every data point; long ranges are thinned to the chart's width.",
+            )
+            zoom_start, zoom_end = pd.to_datetime([zoom_start, zoom_end], format="%Y-%m")
+            window = trend[(trend["month_dt"] >= zoom_start) & (trend["month_dt"] <= zoom_end)]
+
+        with span("chart: balance trend"):
+            # min/max per bucket, so spikes and dips stay visible however many months there are
+            shown = window.iloc[minmax_indices(window["city"].to_numpy(), window["balance"].to_numpy(), TREND_MAX_POINTS)]
+            fig = balance_trend_figure(shown, markers=shown["month_dt"].nunique() <= TREND_MARKERS_MAX_MONTHS)
+            st.plotly_chart(fig, use_container_width=True)
+
+        if len(shown) < len(window):
+            sent = payload_bytes(fig)
+            st.caption(
+                f"Showing {len(shown):,} of {len(window):,} points: about {kb(sent)} sent to the browser instead of "
+                f"{kb(sent * len(window) / len(shown))}. Narrow the zoom range for full detail."
+            )
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    c1, c2 = st.columns([1.6, 1.0])
+    with c1:
+        balance_trend(trend)
+
+    # A fragment: picking another donut city redraws only this chart.
+    @st.fragment
+    @timed("fragment: expense donut")
+    def expense_donut(exp_mix, compare_cities, expense_columns):
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("#### Expense mix (selected range)")
+        st.write("")
+        donut_city = st.selectbox("Donut city", compare_cities, index=0)
+        row = exp_mix[exp_mix["city"] == donut_city]
+
+        if not row.empty:
+            fig2 = expense_donut_figure(donut_city, list(expense_columns), [float(row[col].iloc[0]) for col in expense_columns])
+            st.plotly_chart(fig2, use_container_width=True)
+        else:
+            st.info("No expense data for donut chart.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with c2:
+        expense_donut(exp_mix, compare_cities, expense_columns)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("#### Compare table")
+    st.write("")
+    show = summary.sort_values("avg_balance", ascending=False).copy()
+    show["Avg income"] = show["avg_income"].round(0)
+    show["Avg expenses"] = show["avg_expenses"].round(0)
+    show["Avg balance"] = show["avg_balance"].round(0)
+    show["Savings rate (%)"] = (show["savings_rate"] * 100).round(1)
+    show_cols = ["city", "Avg income", "Avg expenses", "Avg balance", "months", "Savings rate (%)", "health_score"]
+    if "avg_row_score" in show.columns:
+        show["Avg monthly score"] = show["avg_row_score"].round(1)
+        show_cols.append("Avg monthly score")
+    show = show[show_cols].rename(columns={"city": "City", "months": "Months", "health_score": "Health score"})
+    st.dataframe(show, use_container_width=True, hide_index=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.expander("Data memory"):
+        mem = memory_report()
+        mb1, mb2, mb3 = st.columns(3)
+        mb1.metric("Shared snapshot", f"{mem['shared_bytes'] / 1e6:.2f} MB", help=f"{mem['shared_rows']:,} rows, one copy for the whole server.")
+        mb2.metric("Session slices", f"{mem['session_slice_bytes'] / 1e6:.2f} MB", help=f"{mem['sessions']} active sessions, {mem['session_slice_rows']:,} rows in total.")
+        mb3.metric("Without sharing (est.)", f"{mem['unshared_equivalent_bytes'] / 1e6:.2f} MB")
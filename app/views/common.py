@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from store import open_store
+
+# one Store (and writer thread) per process; app.py hydrates the session from it
+STORE = open_store()
+
+CITY_MIN_WAGE = {
+    "Saint Louis": 12.30,
+    "Chicago": 15.80,
+    "New York City": 16.00,
+    "Los Angeles": 16.90,
+}
+
+CITY_EXPENSE_PRESETS = {
+    "Saint Louis": {"rent": 850, "utilities": 130, "food": 350, "transport": 90, "phone_internet": 60, "misc_basic": 130},
+    "Chicago": {"rent": 1300, "utilities": 160, "food": 420, "transport": 120, "phone_internet": 70, "misc_basic": 150},
+    "New York City": {"rent": 1700, "utilities": 180, "food": 500, "transport": 140, "phone_internet": 80, "misc_basic": 170},
+    "Los Angeles": {"rent": 1600, "utilities": 170, "food": 450, "transport": 130, "phone_internet": 70, "misc_basic": 160},
+}
+
+DEFAULT_CITY = "Saint Louis" if "Saint Louis" in CITY_MIN_WAGE else list(CITY_MIN_WAGE.keys())[0]
+
+
+def money(x: float) -> str:
+    try:
+        return f"${float(x):,.0f}"
+    except Exception:
+        return "$0"
+
+
+def make_saved_calc_id() -> str:
+    return "calc_" + datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+
+def make_scenario_id() -> str:
+    return "scn_" + datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+
+def risk_badge_html(label: str, level: str) -> str:
+    css_map = {"good": "pill pill-green", "warn": "pill pill-yellow", "bad": "pill pill-red"}
+    css = css_map.get(level, "pill")
+    return f"<span class='{css}'>{label}</span>"
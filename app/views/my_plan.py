@@ -0,0 +1,386 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import date
+
+from engine import (
+    amortization_schedule,
+    cheapest_cuts,
+    clamp,
+    grid_payments,
+    monthly_payment,
+    payoff_summary,
+    years_to_pay,
+)
+from figcache import cached_figure
+from profiler import span, timed, tracked_cache
+from records import record_to_dict
+
+from .common import money
+
+
+DEBT_TERMS_YEARS = [5, 10, 15, 20, 25]
+DEBT_GRID_RATES_PCT = [i * 0.25 for i in range(0, 61)]  # 0% to 15%
+DEBT_GRID_SHARES_PCT = list(range(1, 41))
+
+
+@tracked_cache("payoff curves", max_entries=32, show_spinner=False)
+def cached_payoff_curves(principal, rate_annual_pct, monthly_salary, shares_pct, term_years):
+    rate_m, pmt, _ = grid_payments(principal, [rate_annual_pct], shares_pct, [term_years], monthly_salary)
+    schedule = amortization_schedule(principal, rate_m[0, :, 0], pmt[0, :, 0], int(term_years * 12))
+    frames = []
+    for i, share in enumerate(shares_pct):
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Month": schedule["month"],
+                    "Remaining balance": schedule["balance"][i],
+                    "Interest paid so far": schedule["cumulative_interest"][i],
+                    "Plan": f"{share:.0f}% of salary (~{money(pmt[0, i, 0])}/month)",
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+@tracked_cache("interest heatmap", max_entries=32, show_spinner=False)
+def cached_interest_heatmap(principal, monthly_salary, term_years):
+    rate_m, pmt, _ = grid_payments(principal, DEBT_GRID_RATES_PCT, DEBT_GRID_SHARES_PCT, [term_years], monthly_salary)
+    total_interest = payoff_summary(principal, rate_m, pmt)["total_interest"][:, :, 0]
+    return pd.DataFrame(total_interest, index=DEBT_GRID_RATES_PCT, columns=DEBT_GRID_SHARES_PCT)
+
+
+@cached_figure("payoff curves")
+def payoff_curves_figure(curves):
+    fig = px.line(curves, x="Month", y="Remaining balance", color="Plan", title="Remaining balance by month")
+    fig.update_layout(xaxis_title="Month after graduation", yaxis_title="USD")
+    return fig
+
+
+@cached_figure("interest heatmap")
+def interest_heatmap_figure(heat, term_years):
+    return px.imshow(
+        heat,
+        labels={"x": "Salary share (%)", "y": "Interest rate (%)", "color": "Total interest"},
+        aspect="auto",
+        origin="lower",
+        color_continuous_scale="OrRd",
+        title=f"Total interest paid ({term_years}-year minimum term)",
+    )
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("My plan")
+    st.markdown("<div class='small-note'>Pick one saved calculation and turn it into a goal plan plus a debt payback view.</div>", unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    saved = st.session_state["saved_calcs"]
+    if not saved:
+        st.info("No saved calculations yet. Go to Calculator and click Save calculation.")
+        st.stop()
+
+    # choose saved calc (defaults to the one saved or picked last)
+    selection = st.selectbox(
+        "Saved calculation",
+        saved.ids,
+        index=saved.position(st.session_state.get("active_saved_calc_id"), 0),
+        format_func=saved.label,
+    )
+    chosen = saved.get(selection)
+    st.session_state["active_saved_calc_id"] = chosen.id
+
+    st.write("")
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Selected calculation snapshot")
+    st.write("")
+    s1, s2, s3, s4 = st.columns(4)
+    s1.metric("City", chosen.city)
+    s2.metric("Income / month", money(float(chosen.total_income)))
+    s3.metric("Expenses / month", money(float(chosen.total_expenses)))
+    s4.metric("Balance / month", money(float(chosen.balance)))
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    monthly_balance = float(chosen.balance)
+
+    # Goal plan. A fragment with its own inputs: editing the goal reruns only this section.
+    @st.fragment
+    @timed("fragment: goal tracker")
+    def goal_tracker(monthly_balance):
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Goal summary")
+        st.write("")
+        gi1, gi2, gi3 = st.columns(3)
+        with gi1:
+            st.number_input("Goal amount ($)", min_value=0.0, step=50.0, key="goal_amount")
+        with gi2:
+            st.date_input("Goal deadline", key="goal_deadline")
+        with gi3:
+            st.number_input("Already saved toward goal ($)", min_value=0.0, step=50.0, key="current_saved")
+
+        goal_amount = float(st.session_state["goal_amount"])
+        deadline = st.session_state["goal_deadline"]
+        current_saved = float(st.session_state.get("current_saved", 0.0))
+
+        today = date.today()
+        days_left = max((deadline - today).days, 1)
+        weeks_left = days_left / 7.0
+        weekly_target = (goal_amount - current_saved) / weeks_left if weeks_left > 0 else goal_amount
+
+        g1, g2, g3, g4 = st.columns(4)
+        g1.metric("Goal", money(goal_amount))
+        g2.metric("Saved so far", money(current_saved))
+        g3.metric("Weeks left", f"{weeks_left:.1f}")
+        g4.metric("Target per week", money(weekly_target))
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Progress tracking")
+        st.write("")
+        remaining = max(goal_amount - current_saved, 0.0)
+        pct = 0.0 if goal_amount <= 0 else clamp(current_saved / goal_amount, 0, 1)
+        st.progress(int(pct * 100))
+        p1, p2, p3 = st.columns(3)
+        p1.metric("Progress", f"{pct*100:.1f}%")
+        p2.metric("Remaining", money(remaining))
+        p3.metric("Time left (days)", f"{days_left}")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Am I on track?")
+        st.write("")
+        weekly_from_balance = monthly_balance / 4.33 if monthly_balance else 0.0
+        delta = weekly_from_balance - weekly_target
+
+        if monthly_balance <= 0:
+            st.error("This saved calculation is not saving anything. Improve the Calculator result or save a better scenario.")
+        elif delta >= 0:
+            st.success(f"On track. Estimated weekly saving is {money(weekly_from_balance)} and your target is {money(weekly_target)}.")
+        else:
+            st.warning(f"Short by about {money(abs(delta))} per week. Reduce expenses or increase income.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    goal_tracker(monthly_balance)
+
+    # Debt at graduation and payback (PERSISTENT inputs). A fragment: its inputs rerun only this section.
+    @st.fragment
+    @timed("fragment: debt payback")
+    def debt_payback():
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Debt at graduation and payback time")
+        st.caption("These inputs stay saved even when you switch pages.")
+        st.write("")
+
+        dcol1, dcol2, dcol3 = st.columns(3)
+        with dcol1:
+            st.number_input("Total tuition and fees for program ($)", min_value=0.0, step=1000.0, key="debt_tuition_total")
+            st.number_input("Total living costs during program ($)", min_value=0.0, step=1000.0, key="debt_living_total")
+        with dcol2:
+            st.number_input("Total scholarships or grants ($)", min_value=0.0, step=1000.0, key="debt_scholarships_total")
+            st.number_input("Loan principal at graduation ($)", min_value=0.0, step=1000.0, key="debt_loan_principal")
+        with dcol3:
+            st.number_input("Loan interest rate (annual, %)", min_value=0.0, max_value=25.0, step=0.25, key="debt_loan_interest_rate")
+            st.number_input("Expected starting salary (annual, $)", min_value=0.0, step=5000.0, key="debt_expected_start_salary")
+
+        st.write("")
+        rcol1, rcol2, rcol3 = st.columns(3)
+        with rcol1:
+            st.number_input("Payoff scenario 1: salary share (%)", min_value=0.0, max_value=60.0, step=1.0, key="debt_salary_to_debt_rate_1")
+        with rcol2:
+            st.number_input("Payoff scenario 2: salary share (%)", min_value=0.0, max_value=60.0, step=1.0, key="debt_salary_to_debt_rate_2")
+        with rcol3:
+            st.number_input("Payoff scenario 3: salary share (%)", min_value=0.0, max_value=60.0, step=1.0, key="debt_salary_to_debt_rate_3")
+
+        tuition_total = float(st.session_state["debt_tuition_total"])
+        living_total = float(st.session_state["debt_living_total"])
+        scholarships_total = float(st.session_state["debt_scholarships_total"])
+        loan_principal = float(st.session_state["debt_loan_principal"])
+        loan_rate_annual = float(st.session_state["debt_loan_interest_rate"])
+        salary_annual = float(st.session_state["debt_expected_start_salary"])
+
+        total_program_cost = tuition_total + living_total
+        net_cost_after_sch = max(total_program_cost - scholarships_total, 0.0)
+        total_debt_at_grad = loan_principal if loan_principal > 0 else net_cost_after_sch
+
+        monthly_salary = salary_annual / 12.0 if salary_annual > 0 else 0.0
+        r = loan_rate_annual / 100.0 / 12.0 if loan_rate_annual > 0 else 0.0
+
+        baseline_pmt = monthly_payment(total_debt_at_grad, r, 10)
+
+        st.write("")
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Total debt at graduation (approx.)", money(total_debt_at_grad))
+        m2.metric("Standard 10-year payment", money(baseline_pmt))
+        m3.metric("Monthly salary (est.)", money(monthly_salary))
+
+        st.write("")
+        st.markdown("**Payback outcomes**")
+        rates_pct = [
+            float(st.session_state["debt_salary_to_debt_rate_1"]),
+            float(st.session_state["debt_salary_to_debt_rate_2"]),
+            float(st.session_state["debt_salary_to_debt_rate_3"]),
+        ]
+
+        for rp in rates_pct:
+            sr = max(rp, 0.0) / 100.0
+            m_contrib = monthly_salary * sr
+            yrs = years_to_pay(total_debt_at_grad, r, m_contrib)
+
+            if total_debt_at_grad <= 0:
+                st.write("- No debt estimated at graduation based on your inputs.")
+                break
+
+            if yrs == float("inf"):
+                st.warning(f"- If you pay **{rp:.0f}%** of salary (~{money(m_contrib)}/month), it will not clear (payment too low to cover interest).")
+            else:
+                st.success(f"- If you pay **{rp:.0f}%** of salary (~{money(m_contrib)}/month), you clear in about **{yrs:.1f} years**.")
+
+        if total_debt_at_grad > 0 and monthly_salary > 0:
+            st.write("")
+            st.markdown("**Payoff curves and total interest**")
+            st.caption("Each plan pays the salary share, but never less than the standard payment for the chosen term.")
+            term_years = st.selectbox("Repayment term (years)", DEBT_TERMS_YEARS, index=DEBT_TERMS_YEARS.index(10), key="debt_term_years")
+
+            curves = cached_payoff_curves(total_debt_at_grad, loan_rate_annual, monthly_salary, tuple(rates_pct), term_years)
+            pc1, pc2 = st.columns(2)
+            with pc1, span("chart: payoff curves"):
+                st.plotly_chart(payoff_curves_figure(curves), use_container_width=True)
+
+            with pc2, span("chart: interest heatmap"):
+                heat = cached_interest_heatmap(total_debt_at_grad, monthly_salary, term_years)
+                st.plotly_chart(interest_heatmap_figure(heat, term_years), use_container_width=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    debt_payback()
+
+    # Actionable cut suggestions (ranked)
+    with span("card: cut suggestions"):
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Actionable cut suggestions (ranked)")
+        st.write("")
+
+        total_income = float(chosen.total_income)
+        exp_all = {
+            "Rent": float(chosen.rent),
+            "Utilities": float(chosen.utilities),
+            "Food": float(chosen.food),
+            "Transport": float(chosen.transport),
+            "Phone/Internet": float(chosen.phone_internet),
+            "Misc basics": float(chosen.misc_basic),
+        }
+
+        rows = []
+        for k, v in exp_all.items():
+            share = (float(v) / total_income) if total_income > 0 else 0.0
+            rows.append({"Expense": k, "Amount": float(v), "ShareOfIncome": share})
+        exp_rank = pd.DataFrame(rows).sort_values("ShareOfIncome", ascending=False, ignore_index=True).head(2)
+
+        if exp_rank.empty:
+            st.info("No expenses found to rank.")
+        else:
+            st.markdown("<ul>", unsafe_allow_html=True)
+            for _, rrow in exp_rank.iterrows():
+                cut_amount = 0.10 * float(rrow["Amount"])
+                new_balance = monthly_balance + cut_amount
+                st.markdown(
+                    f"""
+                    <li>
+                        Cut <strong>{money(cut_amount)}</strong> from <strong>{rrow['Expense']}</strong>.
+                        <br>
+                        <span style="opacity:0.8;">
+                            This moves your monthly balance from <strong>{money(monthly_balance)}</strong>
+                            to <strong>{money(new_balance)}</strong>.
+                        </span>
+                    </li>
+                    """,
+                    unsafe_allow_html=True,
+                )
+            st.markdown("</ul>", unsafe_allow_html=True)
+
+        st.write("")
+        st.markdown("<hr class='soft'>", unsafe_allow_html=True)
+        st.markdown("**Reach a target with the smallest cuts**")
+        st.write("")
+
+        expense_labels = {
+            "rent": "Rent",
+            "utilities": "Utilities",
+            "food": "Food",
+            "transport": "Transport",
+            "phone_internet": "Phone/Internet",
+            "misc_basic": "Misc basics",
+        }
+        t1, t2, t3 = st.columns(3)
+        with t1:
+            target_kind = st.radio("Target", ["Health score", "Monthly balance"], horizontal=True, key="cut_target_kind")
+            if target_kind == "Health score":
+                target_value = st.slider("Target health score", 0, 100, max(int(chosen.health_score), 60), 1, key="cut_target_score")
+            else:
+                target_value = st.number_input("Target monthly balance ($)", value=max(monthly_balance, 0.0) + 200.0, step=50.0, key="cut_target_balance")
+        with t2:
+            locked = st.multiselect(
+                "Categories you can't cut",
+                list(expense_labels.keys()),
+                default=["rent"],
+                format_func=lambda k: expense_labels[k],
+                key="cut_locked",
+            )
+        with t3:
+            max_cut_pct = st.slider("Deepest cut per category (%)", 0, 100, 30, 5, key="cut_max_pct")
+
+        floors = {
+            k: float(getattr(chosen, k)) if k in locked else float(getattr(chosen, k)) * (1 - max_cut_pct / 100.0)
+            for k in expense_labels
+        }
+        plan = cheapest_cuts(
+            record_to_dict(chosen),
+            target_score=int(target_value) if target_kind == "Health score" else None,
+            target_balance=float(target_value) if target_kind == "Monthly balance" else None,
+            floors=floors,
+        )
+
+        if plan["total_cut"] <= 0 and plan["feasible"]:
+            st.success("You already meet this target. No cuts needed.")
+        else:
+            if plan["feasible"]:
+                st.success(f"Cut **{money(plan['total_cut'])}/month** in total to reach your target.")
+            else:
+                st.warning(f"Not reachable within these limits. The deepest allowed cuts ({money(plan['total_cut'])}/month) get you to:")
+            plan_df = pd.DataFrame(
+                [
+                    {"Expense": expense_labels[c["category"]], "Now": c["current"], "Cut": c["cut"], "After cut": c["new"]}
+                    for c in plan["cuts"]
+                ]
+            )
+            if not plan_df.empty:
+                st.dataframe(plan_df.round(0), use_container_width=True, hide_index=True)
+            o1, o2 = st.columns(2)
+            o1.metric("Balance after cuts", money(plan["new_balance"]), delta=money(plan["new_balance"] - monthly_balance))
+            o2.metric("Health score after cuts", f"{plan['new_score']}/100")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # All saved calculations table
+    with span("card: saved calculations"):
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### All saved calculations")
+        st.write("")
+
+        show_cols = ["label", "city", "run_date", "total_income", "total_expenses", "balance"]
+        saved_df = pd.DataFrame([[getattr(entry, c) for c in show_cols] for entry in saved], columns=show_cols)
+        if not saved_df.empty:
+            saved_df = saved_df.rename(
+                columns={
+                    "label": "Label",
+                    "city": "City",
+                    "run_date": "Run date",
+                    "total_income": "Total income",
+                    "total_expenses": "Total expenses",
+                    "balance": "Balance",
+                }
+            )
+            st.dataframe(saved_df, use_container_width=True, hide_index=True)
+        else:
+            st.caption("No saved calculations to display.")
+        st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,272 @@
+import streamlit as st
+
+from engine import calculate_budget
+
+from .common import CITY_EXPENSE_PRESETS, CITY_MIN_WAGE, DEFAULT_CITY, money
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("Quick onboarding")
+    st.markdown(
+        "<div class='small-note'>Four short steps: school and timing, income, housing and bills, then a simple result + risks. You can always fine-tune later in Calculator.</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    step = st.session_state.get("onboarding_step", 1)
+    step = int(step)
+
+    # progress / step header
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown(f"**Step {step} of 4**")
+    st.write("")
+
+    # STEP 1
+    if step == 1:
+        st.markdown("### Step 1: Where will you study and when do you arrive?")
+        st.write("")
+        col1, col2 = st.columns(2)
+        with col1:
+            city = st.selectbox(
+                "Study city",
+                list(CITY_MIN_WAGE.keys()),
+                index=list(CITY_MIN_WAGE.keys()).index(DEFAULT_CITY),
+                key="ob_city",
+            )
+        with col2:
+            arrival = st.date_input("Approx arrival date", key="ob_arrival_date")
+
+        st.caption("This helps set your city presets and gives you a rough timeline.")
+
+    # STEP 2
+    if step == 2:
+        st.markdown("### Step 2: Income sources")
+        st.write("")
+        c1, c2 = st.columns(2)
+        with c1:
+            wage = st.number_input(
+                "Campus / hourly wage ($/hour)",
+                min_value=0.0,
+                value=st.session_state.get("wage", CITY_MIN_WAGE.get(st.session_state.get('ob_city', DEFAULT_CITY), 15.0)),
+                step=0.25,
+                key="ob_wage",
+            )
+            weekly_hours = st.number_input(
+                "Total weekly work hours",
+                min_value=0.0,
+                value=20.0,
+                step=1.0,
+                key="ob_weekly_hours",
+            )
+        with c2:
+            weeks_per_month = st.number_input(
+                "Weeks per month",
+                min_value=3.0,
+                max_value=5.0,
+                value=4.33,
+                step=0.01,
+                key="ob_weeks_per_month",
+            )
+            stipend = st.number_input(
+                "Monthly stipend / family support ($)",
+                min_value=0.0,
+                value=0.0,
+                step=50.0,
+                key="ob_stipend",
+            )
+
+        st.caption("This will estimate your monthly income automatically in the background.")
+
+    # STEP 3
+    if step == 3:
+        st.markdown("### Step 3: Housing and bills")
+        st.write("")
+
+        city_for_preset = st.session_state.get("ob_city", DEFAULT_CITY)
+        preset = CITY_EXPENSE_PRESETS.get(city_for_preset, CITY_EXPENSE_PRESETS.get(DEFAULT_CITY, {}))
+
+        use_preset = st.checkbox(
+            f"Use typical {city_for_preset} presets as a starting point",
+            key="ob_use_preset",
+        )
+
+        def preset_or(name, fallback):
+            if use_preset:
+                return float(preset.get(name, fallback))
+            return float(fallback)
+
+        e1, e2, e3 = st.columns(3)
+        with e1:
+            st.number_input(
+                "Rent ($)",
+                min_value=0.0,
+                value=preset_or("rent", 900.0),
+                step=25.0,
+                key="ob_rent",
+            )
+            st.number_input(
+                "Utilities ($)",
+                min_value=0.0,
+                value=preset_or("utilities", 130.0),
+                step=10.0,
+                key="ob_utilities",
+            )
+        with e2:
+            st.number_input(
+                "Food ($)",
+                min_value=0.0,
+                value=preset_or("food", 350.0),
+                step=10.0,
+                key="ob_food",
+            )
+            st.number_input(
+                "Transport ($)",
+                min_value=0.0,
+                value=preset_or("transport", 90.0),
+                step=10.0,
+                key="ob_transport",
+            )
+        with e3:
+            st.number_input(
+                "Phone/Internet ($)",
+                min_value=0.0,
+                value=preset_or("phone_internet", 60.0),
+                step=10.0,
+                key="ob_phone_internet",
+            )
+            st.number_input(
+                "Misc basics ($)",
+                min_value=0.0,
+                value=preset_or("misc_basic", 130.0),
+                step=10.0,
+                key="ob_misc_basic",
+            )
+
+        st.caption("These are benchmarks for an off-campus student. Change them to match your actual numbers.")
+
+    # STEP 4
+    if step == 4:
+        st.markdown("### Step 4: Result + risks")
+        st.write("")
+
+        # pull onboarding values
+        city = st.session_state.get("ob_city", DEFAULT_CITY)
+        wage = float(st.session_state.get("ob_wage", CITY_MIN_WAGE.get(city, 15.0)))
+        weekly_hours = float(st.session_state.get("ob_weekly_hours", 20.0))
+        weeks_per_month = float(st.session_state.get("ob_weeks_per_month", 4.33))
+        stipend = float(st.session_state.get("ob_stipend", 0.0))
+
+        rent = float(st.session_state.get("ob_rent", 900.0))
+        utilities = float(st.session_state.get("ob_utilities", 130.0))
+        food = float(st.session_state.get("ob_food", 350.0))
+        transport = float(st.session_state.get("ob_transport", 90.0))
+        phone_internet = float(st.session_state.get("ob_phone_internet", 60.0))
+        misc_basic = float(st.session_state.get("ob_misc_basic", 130.0))
+
+        budget = calculate_budget(
+            wage=wage,
+            weeks_per_month=weeks_per_month,
+            hours_mon_fri=weekly_hours,
+            hours_sat=0.0,
+            hours_sun=0.0,
+            sunday_multiplier=1.0,
+            stipend=stipend,
+            expenses={
+                "rent": rent,
+                "utilities": utilities,
+                "food": food,
+                "transport": transport,
+                "phone_internet": phone_internet,
+                "misc_basic": misc_basic,
+            },
+        )
+        total_income = budget["total_income"]
+        total_expenses = budget["total_expenses"]
+        balance = budget["balance"]
+        status = budget["status"]
+        score, breakdown = budget["health_score"], budget["breakdown"]
+
+        rent_ratio = breakdown["rent_ratio"] or 0.0
+        savings_rate = breakdown["savings_rate"] or 0.0
+        buffer_months = float(breakdown.get("buffer_months", 0.0))
+
+        # quick summary
+        r1, r2, r3 = st.columns(3)
+        r1.metric("Income / month", money(total_income))
+        r2.metric("Expenses / month", money(total_expenses))
+        r3.metric("Balance / month", money(balance))
+
+        st.write("")
+        if status == "Surplus":
+            st.success("You are in surplus. You have some buffer after essentials.")
+        elif status == "Break-even":
+            st.warning("You are at break-even. You survive, but you have no buffer.")
+        else:
+            st.error("You are in deficit. You will need support, higher income, or lower expenses.")
+
+        st.write("")
+        st.markdown("##### Quick risk zones")
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric(
+            "Rent / income",
+            f"{rent_ratio*100:.1f}%",
+            help="How much of your income goes to rent. Above 40% is usually a red zone."
+        )
+        c2.metric(
+            "Savings rate",
+            f"{savings_rate*100:.1f}%",
+            help="What's left after core expenses. Below ~5% is fragile."
+        )
+        c3.metric(
+            "Buffer months",
+            f"{buffer_months:.1f}",
+            help="How long you can keep going if your income stops and you keep spending the same."
+        )
+
+        st.write("")
+        flags = []
+        if total_income > 0 and rent_ratio > 0.40:
+            flags.append("Rent is above 40 percent of income (red zone).")
+        if buffer_months <= 0:
+            flags.append("Zero buffer (you have no savings cushion).")
+        if savings_rate < 0.05:
+            flags.append("Savings rate is under 5 percent (yellow zone).")
+
+        if flags:
+            for f in flags:
+                st.warning(f)
+        else:
+            st.success("No major risk flags based on these numbers.")
+
+        st.write("")
+        st.caption("You can now open the Calculator page to fine-tune details and save this setup as a scenario.")
+
+    # navigation buttons
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    nav_col1, nav_col2, nav_col3 = st.columns([1, 1, 2])
+    with nav_col1:
+        if step > 1 and st.button("⬅️ Back"):
+            st.session_state["onboarding_step"] = max(1, step - 1)
+    with nav_col2:
+        if step < 4 and st.button("Next ➡️"):
+            st.session_state["onboarding_step"] = min(4, step + 1)
+    with nav_col3:
+        if step == 4 and st.button("Send to Calculator"):
+            # push onboarding values into main calculator defaults
+            st.session_state["context_city"] = st.session_state.get("ob_city", DEFAULT_CITY)
+            st.session_state["wage"] = float(st.session_state.get("ob_wage", CITY_MIN_WAGE.get(st.session_state["context_city"], 15.0)))
+            st.session_state["weeks_per_month"] = float(st.session_state.get("ob_weeks_per_month", 4.33))
+            st.session_state["stipend"] = float(st.session_state.get("ob_stipend", 0.0))
+
+            st.session_state["rent"] = float(st.session_state.get("ob_rent", 900.0))
+            st.session_state["utilities"] = float(st.session_state.get("ob_utilities", 130.0))
+            st.session_state["food"] = float(st.session_state.get("ob_food", 350.0))
+            st.session_state["transport"] = float(st.session_state.get("ob_transport", 90.0))
+            st.session_state["phone_internet"] = float(st.session_state.get("ob_phone_internet", 60.0))
+            st.session_state["misc_basic"] = float(st.session_state.get("ob_misc_basic", 130.0))
+
+            st.session_state["onboarding_step"] = 1
+            st.success("Values sent. Open the Calculator page to see and refine them.")
@@ -0,0 +1,270 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from datetime import date, timedelta
+
+from engine import monthly_timeline, phase_summary, simulate_timeline
+from figcache import cached_figure
+from profiler import span, tracked_cache
+from records import Scenario, record_to_dict
+
+from .common import STORE, make_scenario_id, money
+
+
+@tracked_cache("timeline simulation", max_entries=32, show_spinner=False)
+def cached_timeline_simulation(phases, starting_cash, n_paths, income_vol, expense_vol, job_loss_prob, step_up_prob, step_up_pct):
+    # fixed seed: moving one slider should not reshuffle the random draws
+    return simulate_timeline(
+        phases,
+        starting_cash,
+        n_paths=n_paths,
+        income_vol=income_vol,
+        expense_vol=expense_vol,
+        job_loss_prob=job_loss_prob,
+        step_up_prob=step_up_prob,
+        step_up_pct=step_up_pct,
+        seed=42,
+    )
+
+
+@cached_figure("cash balance")
+def cash_balance_figure(monthly_df):
+    fig = px.line(monthly_df, x="Month", y="Balance", color="Phase", markers=True, title="Projected cash balance, month by month")
+    fig.add_hline(y=0, line_dash="dot", line_color="#ef4444")
+    fig.update_layout(xaxis_title="Month", yaxis_title="Balance (USD)")
+    return fig
+
+
+@cached_figure("simulation bands")
+def simulation_bands_figure(band_df):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=band_df["Month"], y=band_df["p95"], line=dict(width=0), showlegend=False, hoverinfo="skip"))
+    fig.add_trace(go.Scatter(x=band_df["Month"], y=band_df["p5"], fill="tonexty", line=dict(width=0), name="5th–95th percentile", fillcolor="rgba(249,115,22,0.18)"))
+    fig.add_trace(go.Scatter(x=band_df["Month"], y=band_df["p75"], line=dict(width=0), showlegend=False, hoverinfo="skip"))
+    fig.add_trace(go.Scatter(x=band_df["Month"], y=band_df["p25"], fill="tonexty", line=dict(width=0), name="25th–75th percentile", fillcolor="rgba(249,115,22,0.35)"))
+    fig.add_trace(go.Scatter(x=band_df["Month"], y=band_df["p50"], line=dict(color="#f97316"), name="Median"))
+    fig.add_hline(y=0, line_dash="dot", line_color="#ef4444")
+    fig.update_layout(title="Simulated cash balance by month", xaxis_title="Month", yaxis_title="Balance (USD)")
+    return fig
+
+
+def get_active_scenario() -> Scenario | None:
+    return st.session_state["scenarios"].get(st.session_state.get("active_scenario_id"))
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("Scenario builder")
+    st.markdown(
+        "<div class='small-note'>Store scenarios per user: User → Scenarios → Phases. Build a timeline for pre-arrival, semesters, internships, and grace period.</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Create or select scenario
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Create or select a scenario")
+    st.write("")
+
+    scenarios = st.session_state["scenarios"]
+    left, right = st.columns(2)
+
+    with left:
+        if scenarios:
+            st.session_state["active_scenario_id"] = st.selectbox(
+                "Existing scenarios",
+                scenarios.ids,
+                index=scenarios.position(st.session_state.get("active_scenario_id"), 0),
+                format_func=scenarios.label,
+            )
+        else:
+            st.info("No scenarios yet. Add your first one on the right.")
+
+    with right:
+        with st.form("new_scenario_form"):
+            name = st.text_input("Scenario name", placeholder="WashU 2025")
+            city = st.text_input("City", placeholder="Saint Louis")
+            visa = st.text_input("Visa type", placeholder="F-1")
+            start = st.date_input("Program start", value=date.today())
+            end = st.date_input("Program end", value=date.today() + timedelta(days=365))
+            add = st.form_submit_button("Add scenario")
+
+        if add and name.strip():
+            new_sc = Scenario(
+                id=make_scenario_id(),
+                name=name.strip(),
+                city=city.strip() if city else "-",
+                visa=visa.strip() if visa else "-",
+                program_start=str(start),
+                program_end=str(end),
+            )
+            st.session_state["scenarios"].put(new_sc)
+            STORE.save_scenario(st.session_state["store_user_key"], record_to_dict(new_sc))
+            st.session_state["active_scenario_id"] = new_sc.id
+            st.success("Scenario created.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Active scenario (always from the session table)
+    active = get_active_scenario()
+
+    # Add phase
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Add timeline phase")
+    st.write("")
+
+    if active is None:
+        st.info("Select or create a scenario above, then add phases.")
+        st.markdown("</div>", unsafe_allow_html=True)
+    else:
+        with st.form("add_phase_form"):
+            pname = st.text_input("Phase name", placeholder="Pre-arrival")
+            months = st.number_input("Months in this phase", min_value=1, max_value=48, value=4)
+            income = st.number_input("Average monthly income ($)", min_value=0.0, step=50.0)
+            expenses = st.number_input("Average monthly expenses ($)", min_value=0.0, step=50.0)
+            oneoff = st.number_input("One-time costs in this phase ($)", min_value=0.0, step=50.0)
+            oneoff_month = st.number_input(
+                "Month of the one-time costs (1 = first month of the phase)",
+                min_value=1,
+                max_value=48,
+                value=1,
+                help="Deposits, flights and tuition usually land at the start of a phase.",
+            )
+            addp = st.form_submit_button("Add phase")
+
+        if addp and pname.strip():
+            active.phases.append(
+                {
+                    "name": pname.strip(),
+                    "months": int(months),
+                    "monthly_income": float(income),
+                    "monthly_expenses": float(expenses),
+                    "one_time_costs": float(oneoff),
+                    "one_time_month": min(int(oneoff_month), int(months)),
+                }
+            )
+            STORE.save_scenario(st.session_state["store_user_key"], record_to_dict(active))
+            st.success(f"Phase '{pname.strip()}' added.")
+
+        st.write("")
+        if active.phases:
+            st.markdown("**Current phases**")
+            df_ph = pd.DataFrame(active.phases)
+            st.dataframe(df_ph, use_container_width=True, hide_index=True)
+        else:
+            st.caption("No phases yet. Add pre-arrival first, then semesters, internship months, and grace period.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Timeline insights
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Balance timeline and insights")
+    st.write("")
+
+    if active is None or not active.phases:
+        st.info("Add at least one phase to see projected cash balance and warnings.")
+        st.markdown("</div>", unsafe_allow_html=True)
+    else:
+        starting_cash_key = f"scenario_start_cash__{active.id}"
+        if starting_cash_key not in st.session_state:
+            st.session_state[starting_cash_key] = 0.0
+
+        starting_cash = st.number_input(
+            "Starting cash before first phase ($)",
+            min_value=-50000.0,
+            max_value=500000.0,
+            value=float(st.session_state[starting_cash_key]),
+            step=500.0,
+            key=starting_cash_key,
+        )
+
+        with span("compute: timeline"):
+            monthly_df = monthly_timeline(active.phases, starting_cash)
+            tl_df = phase_summary(active.phases, monthly_df, starting_cash)
+
+        c1, c2 = st.columns([1.15, 1.85])
+        with c1:
+            st.markdown("**Phase summary**")
+            st.dataframe(tl_df, use_container_width=True, hide_index=True)
+
+        with c2, span("chart: cash balance"):
+            st.markdown("**Cash balance by month**")
+            st.plotly_chart(cash_balance_figure(monthly_df), use_container_width=True)
+
+        st.write("")
+        lowest_idx = monthly_df["Balance"].idxmin()
+        min_bal = float(monthly_df.loc[lowest_idx, "Balance"])
+        min_month = int(monthly_df.loc[lowest_idx, "Month"])
+        max_bal = float(monthly_df["Balance"].max())
+        final_bal = float(monthly_df["Balance"].iloc[-1])
+        worst_row = tl_df.loc[tl_df["Order"] == int(monthly_df.loc[lowest_idx, "Order"])].iloc[0]
+
+        st.markdown("**Key insights**")
+        st.write(f"- Lowest balance: **{money(min_bal)}** in month **{min_month}** (worst phase: **{worst_row['Phase']}**) ")
+        st.write(f"- Highest balance: **{money(max_bal)}** ")
+        st.write(f"- Final balance after last phase: **{money(final_bal)}** ")
+
+        if min_bal < 0:
+            extra_needed = abs(min_bal)
+            st.warning(f"You go below zero at some point. To never go negative, you need about **{money(extra_needed)}** more starting cash or funding.")
+        else:
+            st.success("You never go below zero in this scenario. Cash buffer looks feasible.")
+
+        # Practical recommendation: where to fix first
+        st.write("")
+        st.markdown("**What to change first**")
+        if float(worst_row["Monthly net"]) < 0:
+            st.write("- Your worst phase has negative monthly net. First fix is to increase income or reduce expenses during that phase.")
+        if float(worst_row["One-time costs"]) > 0:
+            st.write("- Your worst phase includes one-time costs. Consider spreading those costs earlier, saving for them, or reducing them.")
+        if min_bal < 0 and final_bal > 0:
+            st.write("- You recover later. So the gap is a timing problem. Plan a buffer before the dip phase.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # Simulation mode (Monte Carlo)
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Simulation mode")
+        st.caption("Run thousands of random futures around your plan: income and expense swings, lost job months, lasting jumps in monthly costs.")
+        st.write("")
+
+        if st.toggle("Simulate uncertainty (Monte Carlo)", key=f"scenario_sim__{active.id}"):
+            m1, m2, m3 = st.columns(3)
+            with m1:
+                n_paths = st.select_slider("Simulated paths", options=[10_000, 25_000, 50_000, 100_000], value=10_000)
+                income_vol = st.slider("Income volatility (%)", 0, 50, 10, 1)
+            with m2:
+                expense_vol = st.slider("Expense volatility (%)", 0, 30, 5, 1)
+                job_loss_prob = st.slider("Chance of losing a month of income (%)", 0, 30, 5, 1)
+            with m3:
+                step_up_help = "A lasting rise in total monthly expenses, such as a rent increase or a new bill."
+                step_up_prob = st.slider("Chance of an expense step-up each month (%)", 0.0, 10.0, 1.0, 0.5, help=step_up_help)
+                step_up_pct = st.slider("Expense step-up size (% of all expenses)", 0, 50, 15, 5, help=step_up_help)
+
+            sim = cached_timeline_simulation(
+                active.phases,
+                float(starting_cash),
+                int(n_paths),
+                income_vol / 100.0,
+                expense_vol / 100.0,
+                job_loss_prob / 100.0,
+                step_up_prob / 100.0,
+                step_up_pct / 100.0,
+            )
+
+            st.write("")
+            k1, k2, k3 = st.columns(3)
+            k1.metric("Chance of going below zero", f"{sim['prob_below_zero']*100:.1f}%")
+            k2.metric(
+                "Expected shortfall (worst 5%)",
+                money(sim["expected_shortfall"]),
+                help="Average lowest balance across the worst 5% of simulated paths.",
+            )
+            k3.metric("Median final balance", money(sim["final_median"]))
+
+            with span("chart: simulation bands"):
+                band_df = pd.DataFrame({"Month": sim["months"], **{f"p{p}": v for p, v in sim["percentiles"].items()}})
+                st.plotly_chart(simulation_bands_figure(band_df), use_container_width=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,130 @@
+import streamlit as st
+from datetime import datetime
+
+from profiler import (
+    DEFAULT_KEEP_RUNS,
+    KEEP_KEY,
+    cache_stats,
+    recent_runs,
+    runs_to_chrome_trace,
+    runs_to_json,
+    slowest_sections,
+)
+
+
+def render():
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("Settings")
+    st.markdown(
+        "<div class='small-note'>Performance console: how long each part of the app took on your last reruns. "
+        "Fragment reruns (one section redrawing on its own) show up as separate entries.</div>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.session_state.setdefault(KEEP_KEY, DEFAULT_KEEP_RUNS)
+    st.slider("Reruns to keep", 5, 200, step=5, key=KEEP_KEY)
+
+    # this page's own rerun is still open, so it is not in the list yet
+    runs = recent_runs()
+    if not runs:
+        st.info("No reruns recorded yet. Use the other pages, then come back here.")
+        return
+
+    # Recent reruns
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Recent reruns")
+    st.write("")
+    latest_first = list(reversed(runs))
+    summary_rows = []
+    for run in latest_first:
+        top = max(run["spans"], key=lambda s: (s["depth"] == 0, s["duration_ms"]), default=None)
+        summary_rows.append(
+            {
+                "Time": datetime.fromtimestamp(run["started_at"]).strftime("%H:%M:%S"),
+                "Rerun": run["label"],
+                "Total (ms)": round(run["total_ms"], 1),
+                "Slowest top-level section": f"{top['name']} ({top['duration_ms']:.1f} ms)" if top else "-",
+            }
+        )
+    st.dataframe(summary_rows, use_container_width=True, hide_index=True)
+
+    picked = st.selectbox(
+        "Breakdown of rerun",
+        range(len(latest_first)),
+        format_func=lambda i: f"{summary_rows[i]['Time']}  |  {summary_rows[i]['Rerun']}  |  {summary_rows[i]['Total (ms)']} ms",
+    )
+    run = latest_first[picked]
+    total = max(run["total_ms"], 1e-9)
+    breakdown = [
+        {
+            "Section": "    " * s["depth"] + s["name"],
+            "Start (ms)": round(s["start_ms"], 1),
+            "Duration (ms)": round(s["duration_ms"], 2),
+            "Share of rerun": s["duration_ms"] / total,
+        }
+        for s in sorted(run["spans"], key=lambda s: (s["start_ms"], s["depth"]))
+    ]
+    st.dataframe(
+        breakdown,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Share of rerun": st.column_config.ProgressColumn("Share of rerun", min_value=0.0, max_value=1.0, format="percent")},
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Slowest sections and caches
+    left, right = st.columns([1.4, 1.0])
+    with left:
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown(f"#### Slowest sections (last {len(runs)} reruns)")
+        st.write("")
+        slow = [
+            {
+                "Section": r["section"],
+                "Runs": r["count"],
+                "Mean (ms)": round(r["mean_ms"], 2),
+                "Max (ms)": round(r["max_ms"], 2),
+                "Total (ms)": round(r["total_ms"], 1),
+            }
+            for r in slowest_sections(runs, top=15)
+        ]
+        st.dataframe(slow, use_container_width=True, hide_index=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with right:
+        st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+        st.markdown("#### Cache hit rates")
+        st.caption("Counted since the server started, across all sessions.")
+        st.write("")
+        caches = cache_stats()
+        if caches:
+            st.dataframe(
+                [
+                    {
+                        "Cache": c["cache"],
+                        "Calls": c["calls"],
+                        "Hits": c["hits"],
+                        "Hit rate": c["hit_rate"] or 0.0,
+                    }
+                    for c in caches
+                ],
+                use_container_width=True,
+                hide_index=True,
+                column_config={"Hit rate": st.column_config.ProgressColumn("Hit rate", min_value=0.0, max_value=1.0, format="percent")},
+            )
+        else:
+            st.caption("No cached computations have run yet.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # Export
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    st.markdown("#### Export")
+    st.caption("Chrome trace files open in chrome://tracing or ui.perfetto.dev, one row per rerun.")
+    st.write("")
+    e1, e2 = st.columns(2)
+    with e1:
+        st.download_button("⬇️ Spans as JSON", data=runs_to_json(runs), file_name="rerun_spans.json", mime="application/json", key="perf_export_json")
+    with e2:
+        st.download_button("⬇️ Chrome trace", data=runs_to_chrome_trace(runs), file_name="rerun_trace.json", mime="application/json", key="perf_export_trace")
+    st.markdown("</div>", unsafe_allow_html=True)
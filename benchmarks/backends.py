@@ -0,0 +1,185 @@
+"""City Compare pipeline on each dataframe backend (pandas / Polars / DuckDB), emitted as JSON.
+
+    python benchmarks/backends.py --out backends.json
+    python benchmarks/backends.py --rows 1000000 --backends pandas,duckdb
+
+Writes a synthetic cost table (fixed seed, 10M rows by default) to a temporary
+Parquet file laid out like `python -m costdata convert` output: sorted by
+(city, month), dictionary-encoded keys. Each backend then runs the same filter
+-> derive -> aggregate queries through `costdata.get_backend(name).compare`.
+Before anything is timed, every backend scores a few hand-picked rows that sit
+on rounding boundaries, checked against the scalar `financial_health_score`,
+and each query's tables are checked against pandas. Backends whose library is
+not installed are reported as skipped.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from hotpaths import SEED, cost_rows, git_commit  # also puts app/ on sys.path
+
+from costdata import BACKENDS, CompareQuery, DatasetError, get_backend  # noqa: E402
+from costdata.columnar import DEFAULT_ROW_GROUP_SIZE  # noqa: E402
+from engine import financial_health_score  # noqa: E402
+
+N_CITIES = 50
+N_MONTHS = 60
+
+# (income, expenses, rent, balance) rows where float rounding decides a point:
+# savings 147 / 1680 -> 17.5 savings points, which must round to 17 like the scalar score
+BOUNDARY_ROWS = [
+    (1680, 1533, 837, 147),
+    (2000, 1900, 1000, 100),
+    (1000, 1050, 600, -50),
+    (0, 900, 500, -900),
+]
+
+
+def write_parquet(n: int, path: str) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    data = cost_rows(n, np.random.default_rng(SEED), n_cities=N_CITIES, n_months=N_MONTHS)
+    data = data.sort_values(["city", "month"], kind="stable", ignore_index=True)
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    del data
+    pq.write_table(table, path, row_group_size=DEFAULT_ROW_GROUP_SIZE, use_dictionary=["city", "month"], write_statistics=True)
+
+
+def queries() -> dict[str, CompareQuery]:
+    cities = tuple(f"City {i:02d}" for i in range(N_CITIES))
+    first, last = pd.Timestamp("2020-01"), pd.Timestamp("2020-01") + pd.DateOffset(months=N_MONTHS - 1)
+    return {
+        "2 cities, all months": CompareQuery(cities[:2], first, last),
+        "all cities, 1 year": CompareQuery(cities, pd.Timestamp("2022-01"), pd.Timestamp("2022-12")),
+        "all cities, all months": CompareQuery(cities, first, last),
+    }
+
+
+def check_boundary_rows(backends: list[str], tmp: str) -> None:
+    """Each boundary row as its own city, repeated for a year; every backend's avg_row_score must equal the scalar score."""
+    columns = cost_rows(1, np.random.default_rng(SEED)).columns
+    rows = []
+    for i, (income, expenses, rent, _) in enumerate(BOUNDARY_ROWS):
+        # a year of identical months: single-row columns can take a different arithmetic path than real data
+        for month in range(1, 13):
+            row = {"city": f"Edge {i}", "month": f"2020-{month:02d}", "campus_job_income": income, "stipend_income": 0, "rent": rent, "misc_basic": expenses - rent}
+            rows.append({c: 0 for c in columns} | row)
+    path = os.path.join(tmp, "boundary.csv")
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+    cities = [f"Edge {i}" for i in range(len(BOUNDARY_ROWS))]
+    expected = [float(financial_health_score(*row)[0]) for row in BOUNDARY_ROWS]
+    for name in backends:
+        try:
+            backend = get_backend(name)
+        except DatasetError:
+            continue
+        # one city at a time as well as all together: which rows share a batch changes the arithmetic path
+        for selected in [[city] for city in cities] + [cities]:
+            query = CompareQuery(tuple(selected), pd.Timestamp("2020-01"), pd.Timestamp("2020-12"))
+            got = backend.compare(path, query).summary["avg_row_score"].tolist()
+            want = [expected[cities.index(city)] for city in selected]
+            if got != want:
+                raise SystemExit(f"{name} scores the boundary rows of {selected} as {got}, the scalar score gives {want}")
+
+
+def same_tables(ref, result) -> bool:
+    try:
+        for table in ("summary", "trend", "exp_mix"):
+            pd.testing.assert_frame_equal(getattr(ref, table), getattr(result, table), check_dtype=False, check_index_type=False)
+    except AssertionError:
+        return False
+    return True
+
+
+def run(rows: int, backends: list[str], repeat: int, log=print) -> dict:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        check_boundary_rows(backends, tmp)
+        path = os.path.join(tmp, "costs.parquet")
+        t0 = time.perf_counter()
+        write_parquet(rows, path)
+        log(f"wrote {rows:,} rows to Parquet in {time.perf_counter() - t0:.1f} s")
+
+        for label, query in queries().items():
+            reference = get_backend("pandas").compare(path, query)
+            baseline = None
+            for name in backends:
+                record = {"backend": name, "query": label, "rows": rows}
+                try:
+                    backend = get_backend(name)
+                except DatasetError as exc:
+                    record.update(skipped=True, reason=str(exc))
+                    results.append(record)
+                    log(f"{label:24s} {name:8s} skipped ({exc})")
+                    continue
+
+                if not same_tables(reference, backend.compare(path, query)):  # also the warm-up run
+                    raise SystemExit(f"{name} returned different tables than pandas for {label!r}")
+                times = []
+                for _ in range(max(repeat, 1)):
+                    t0 = time.perf_counter()
+                    backend.compare(path, query)
+                    times.append(time.perf_counter() - t0)
+                best = min(times)
+                baseline = best if name == "pandas" else baseline
+                record.update(
+                    skipped=False,
+                    samples=len(times),
+                    best_s=best,
+                    median_s=statistics.median(times),
+                    speedup_vs_pandas=baseline / best if baseline else None,
+                )
+                results.append(record)
+                speedup = f"  {baseline / best:5.1f}x vs pandas" if baseline and name != "pandas" else ""
+                log(f"{label:24s} {name:8s} best {best * 1000:9.1f} ms{speedup}")
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "rows": rows,
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the City Compare pipeline across dataframe backends.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="rows in the synthetic cost table")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="comma-separated backends; pandas is the baseline")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per backend and query (best and median are reported)")
+    parser.add_argument("--out", default=None, help="write the JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    if "pandas" in backends:
+        backends.remove("pandas")
+    backends.insert(0, "pandas")
+    report = run(args.rows, backends, args.repeat, log=lambda msg: print(msg, file=sys.stderr))
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
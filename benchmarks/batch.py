@@ -0,0 +1,119 @@
+"""Batch profile scoring (app/batch_score.py) per output format and worker count, emitted as JSON.
+
+    python benchmarks/batch.py --out batch.json
+    python benchmarks/batch.py --rows 100000 --workers 1,2
+
+Writes a synthetic profile CSV (fixed seed, 1M rows by default) and times
+`batch_score.run` into CSV and Parquet with each worker count. Before anything
+is timed, a small file whose second chunk has text in the numeric `wage` column
+and whose first chunk leaves `stipend` blank is scored into both formats: both
+must finish, agree on the scores and count the one unscored row.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from hotpaths import SEED, budgets, git_commit  # also puts app/ on sys.path
+
+import batch_score  # noqa: E402
+
+
+def write_profiles(n: int, path: str) -> None:
+    rng = np.random.default_rng(SEED)
+    b = budgets(n, rng)
+    profiles = pd.DataFrame({"wage": rng.uniform(10, 20, n).round(2), "stipend": rng.uniform(0, 1500, n).round(2), **b["expenses"]})
+    profiles.round(2).to_csv(path, index=False)
+
+
+def check_mixed_chunks(tmp: str) -> None:
+    """A later chunk with text in a numeric column, after a first chunk with an all-blank column."""
+    path = os.path.join(tmp, "mixed.csv")
+    rows = []
+    for i in range(12):
+        rows.append({
+            "wage": "abc" if i == 7 else 12 + i,
+            "rent": 800, "utilities": 100, "food": 300, "transport": 50, "phone_internet": 40, "misc_basic": 60,
+            "stipend": None if i < 5 else 500,
+        })
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+    scores = {}
+    for ext in ("csv", "parquet"):
+        out = os.path.join(tmp, f"mixed_out.{ext}")
+        rows_done, invalid, _ = batch_score.run(path, out, workers=1, chunksize=5)
+        if (rows_done, invalid) != (12, 1):
+            raise SystemExit(f"{ext} output scored {rows_done} rows with {invalid} unscored, expected 12 with 1")
+        result = pd.read_parquet(out) if ext == "parquet" else pd.read_csv(out)
+        scores[ext] = result["health_score"].astype("Float64").tolist()
+    if scores["csv"] != scores["parquet"]:
+        raise SystemExit(f"CSV and Parquet outputs disagree: {scores['csv']} vs {scores['parquet']}")
+
+
+def run(rows: int, workers: list[int], repeat: int, chunksize: int, log=print) -> dict:
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        check_mixed_chunks(tmp)
+        path = os.path.join(tmp, "profiles.csv")
+        log(f"writing {rows:,} profiles...")
+        write_profiles(rows, path)
+
+        for ext in ("csv", "parquet"):
+            out = os.path.join(tmp, f"scored.{ext}")
+            for n in workers:
+                times = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    batch_score.run(path, out, workers=n, chunksize=chunksize)
+                    times.append(time.perf_counter() - start)
+                record = {"format": ext, "workers": n, "best_s": min(times), "median_s": statistics.median(times)}
+                record["rows_per_s"] = rows / record["best_s"]
+                log(f"{ext:8s} workers={n}  {record['best_s']:.2f}s  ({record['rows_per_s']:,.0f} rows/s)")
+                records.append(record)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "rows": rows,
+            "chunksize": chunksize,
+            "seed": SEED,
+        },
+        "results": records,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time batch profile scoring per output format and worker count.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="profiles in the synthetic input")
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--chunksize", type=int, default=batch_score.DEFAULT_CHUNKSIZE, help="rows per chunk")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per format and worker count")
+    parser.add_argument("--out", default=None, help="write the JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    workers = [int(w) for w in args.workers.split(",") if w.strip()]
+    report = run(args.rows, workers, args.repeat, args.chunksize, log=lambda msg: print(msg, file=sys.stderr))
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""Micro-benchmarks for the computational hot paths, emitted as JSON.
+
+    python benchmarks/hotpaths.py --out bench.json
+    python benchmarks/hotpaths.py --sizes 10,10000 --only city_compare
+
+Every case runs on synthetic inputs (fixed seed) at each size: 10, 10k and 1M
+rows/profiles by default. The JSON holds one record per (case, size) with the
+best and median wall time and the per-item cost, plus the commit and library
+versions, so two runs can be diffed across commits or plotted as scaling
+curves. Scalar (per-call) cases whose estimated time at a size exceeds
+--max-seconds are recorded as skipped with the estimate instead of being run.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "app"))
+
+from costdata import EXPENSE_COLUMNS, INCOME_COLUMNS, CostDataset, Fingerprint, add_derived_columns, compare_tables  # noqa: E402
+from engine import (  # noqa: E402
+    build_expense_pressure_df,
+    financial_health_score,
+    financial_health_score_batch,
+    monthly_payment,
+    monthly_timeline,
+    payoff_summary,
+    phase_summary,
+    score_profiles,
+    years_to_pay,
+)
+
+DEFAULT_SIZES = [10, 10_000, 1_000_000]
+SEED = 0
+
+CASES = []
+
+
+def case(name: str, unit: str, scalar: bool = False):
+    """Register `setup(n, rng) -> run` as a benchmark; `run()` does the timed work."""
+    def register(setup):
+        CASES.append({"name": name, "unit": unit, "scalar": scalar, "setup": setup})
+        return setup
+    return register
+
+
+# synthetic inputs
+
+def budgets(n: int, rng: np.random.Generator) -> dict:
+    expenses = {
+        "rent": rng.uniform(500, 2000, n),
+        "utilities": rng.uniform(60, 220, n),
+        "food": rng.uniform(200, 550, n),
+        "transport": rng.uniform(40, 160, n),
+        "phone_internet": rng.uniform(30, 120, n),
+        "misc_basic": rng.uniform(50, 220, n),
+    }
+    total_income = rng.uniform(0, 4000, n)
+    total_expenses = sum(expenses.values())
+    return {"expenses": expenses, "total_income": total_income, "total_expenses": total_expenses, "balance": total_income - total_expenses}
+
+
+def cost_rows(n: int, rng: np.random.Generator, n_cities: int = 50, n_months: int = 60) -> pd.DataFrame:
+    months = pd.period_range("2020-01", periods=n_months, freq="M").astype(str).to_numpy()
+    data = {
+        "city": np.array([f"City {i:02d}" for i in range(n_cities)], dtype=object)[rng.integers(0, n_cities, n)],
+        "month": months[rng.integers(0, n_months, n)],
+        INCOME_COLUMNS[0]: rng.integers(800, 1600, n),
+        INCOME_COLUMNS[1]: rng.integers(0, 2000, n),
+    }
+    for col, (lo, hi) in zip(EXPENSE_COLUMNS, [(600, 1800), (80, 200), (250, 500), (50, 150), (40, 120), (50, 200)]):
+        data[col] = rng.integers(lo, hi, n)
+    return pd.DataFrame(data)
+
+
+# cases
+
+@case("engine.financial_health_score", "profiles", scalar=True)
+def _health_scalar(n, rng):
+    b = budgets(n, rng)
+    args = list(zip(b["total_income"].tolist(), b["total_expenses"].tolist(), b["expenses"]["rent"].tolist(), b["balance"].tolist()))
+    return lambda: [financial_health_score(*a) for a in args]
+
+
+@case("engine.financial_health_score_batch", "profiles")
+def _health_batch(n, rng):
+    b = budgets(n, rng)
+    return lambda: financial_health_score_batch(b["total_income"], b["total_expenses"], b["expenses"]["rent"], b["balance"])
+
+
+@case("engine.score_profiles", "profiles")
+def _score_profiles(n, rng):
+    b = budgets(n, rng)
+    profiles = pd.DataFrame({"wage": rng.uniform(10, 20, n), "stipend": rng.uniform(0, 1500, n), **b["expenses"]})
+    return lambda: score_profiles(profiles)
+
+
+@case("engine.build_expense_pressure_df", "profiles", scalar=True)
+def _pressure(n, rng):
+    b = budgets(n, rng)
+    keys = list(b["expenses"])
+    columns = [b["expenses"][k].tolist() for k in keys]
+    calls = [(income, dict(zip(keys, values))) for income, values in zip(b["total_income"].tolist(), zip(*columns))]
+    return lambda: [build_expense_pressure_df(income, expenses) for income, expenses in calls]
+
+
+@case("engine.monthly_payment+years_to_pay", "loans", scalar=True)
+def _debt_scalar(n, rng):
+    loans = list(zip(rng.uniform(5_000, 120_000, n).tolist(), (rng.uniform(0, 12, n) / 1200).tolist(), rng.uniform(200, 3000, n).tolist()))
+
+    def run():
+        for principal, rate, contrib in loans:
+            monthly_payment(principal, rate, 10)
+            years_to_pay(principal, rate, contrib)
+    return run
+
+
+@case("engine.payoff_summary", "loans")
+def _debt_vector(n, rng):
+    rate = rng.uniform(0, 12, n) / 1200
+    payment = rng.uniform(200, 3000, n)
+    return lambda: payoff_summary(40_000.0, rate, payment)
+
+
+@case("scenarios.timeline", "phases")
+def _timeline(n, rng):
+    phases = [
+        {
+            "name": f"Phase {i}",
+            "months": int(m),
+            "monthly_income": float(inc),
+            "monthly_expenses": float(exp),
+            "one_time_costs": float(cost),
+            "one_time_month": 1,
+        }
+        for i, (m, inc, exp, cost) in enumerate(
+            zip(rng.integers(1, 7, n), rng.uniform(0, 3000, n), rng.uniform(500, 2500, n), rng.uniform(0, 3000, n))
+        )
+    ]
+
+    def run():
+        monthly = monthly_timeline(phases, 2000.0)
+        phase_summary(phases, monthly, 2000.0)
+    return run
+
+
+@case("city_compare.parse", "rows")
+def _cc_parse(n, rng):
+    csv_bytes = cost_rows(n, rng).to_csv(index=False).encode()
+    return lambda: pd.read_csv(io.BytesIO(csv_bytes))
+
+
+@case("city_compare.derived_columns", "rows")
+def _cc_derived(n, rng):
+    raw = cost_rows(n, rng)
+    return lambda: add_derived_columns(raw.copy())
+
+
+def _cc_query(data: pd.DataFrame) -> tuple:
+    # the page's default view: two cities, one year of the five
+    cities = sorted(data["city"].unique())[:2]
+    return cities, pd.Timestamp("2021-01"), pd.Timestamp("2021-12"), ["city", "month_dt", "balance", *EXPENSE_COLUMNS]
+
+
+@case("city_compare.filter_mask", "rows")
+def _cc_filter_mask(n, rng):
+    data = add_derived_columns(cost_rows(n, rng))
+    cities, start, end, columns = _cc_query(data)
+
+    def run():
+        mask = data["city"].isin(cities) & (data["month_dt"] >= start) & (data["month_dt"] <= end)
+        data.loc[mask, columns]
+    return run
+
+
+@case("city_compare.filter_index", "rows")
+def _cc_filter_index(n, rng):
+    dataset = CostDataset.from_frame(Fingerprint("<synthetic>", 0, 0), add_derived_columns(cost_rows(n, rng)))
+    cities, start, end, columns = _cc_query(dataset.data)
+    return lambda: dataset.select(cities, start, end, columns)
+
+
+@case("city_compare.groupbys", "rows")
+def _cc_groupbys(n, rng):
+    derived = add_derived_columns(cost_rows(n, rng))
+    return lambda: compare_tables(derived)
+
+
+@case("city_compare.pipeline", "rows")
+def _cc_pipeline(n, rng):
+    csv_bytes = cost_rows(n, rng).to_csv(index=False).encode()
+    return lambda: compare_tables(add_derived_columns(pd.read_csv(io.BytesIO(csv_bytes))))
+
+
+# runner
+
+def time_case(run, repeat: int, max_seconds: float) -> list[float]:
+    times = []
+    for _ in range(max(repeat, 1)):
+        t0 = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - t0)
+        if sum(times) > max_seconds / 4:
+            break  # big sizes: a couple of samples is enough
+    return times
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(sizes: list[int], only: list[str], repeat: int, max_seconds: float, log=print) -> dict:
+    results = []
+    for spec in CASES:
+        if only and not any(token in spec["name"] for token in only):
+            continue
+        per_item = None
+        for n in sizes:
+            record = {"case": spec["name"], "unit": spec["unit"], "n": n}
+            estimate = per_item * n if per_item is not None else None
+            if spec["scalar"] and estimate is not None and estimate > max_seconds:
+                record.update(skipped=True, estimated_s=round(estimate, 3))
+                results.append(record)
+                log(f"{spec['name']:40s} n={n:>9,}  skipped (estimated {estimate:,.1f} s)")
+                continue
+
+            run = spec["setup"](n, np.random.default_rng(SEED))
+            run()  # warm-up: imports, caches, allocator
+            times = time_case(run, repeat, max_seconds)
+            best, median = min(times), statistics.median(times)
+            per_item = best / n
+            record.update(
+                skipped=False,
+                samples=len(times),
+                best_s=best,
+                median_s=median,
+                per_item_us=per_item * 1e6,
+                items_per_s=n / best if best > 0 else None,
+            )
+            results.append(record)
+            log(f"{spec['name']:40s} n={n:>9,}  best {best * 1000:10.2f} ms  ({per_item * 1e6:9.3f} us/{spec['unit'][:-1]})")
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "sizes": sizes,
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's computational hot paths.")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES), help="comma-separated input sizes")
+    parser.add_argument("--only", default="", help="comma-separated substrings; run matching cases only")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case and size (best and median are reported)")
+    parser.add_argument("--max-seconds", type=float, default=60.0, help="skip scalar cases estimated to take longer than this")
+    parser.add_argument("--out", default=None, help="write the JSON here (default: stdout)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for spec in CASES:
+            print(spec["name"])
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    report = run_suite(sizes, only, args.repeat, args.max_seconds, log=lambda msg: print(msg, file=sys.stderr))
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
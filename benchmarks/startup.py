@@ -0,0 +1,188 @@
+"""Cold-start benchmark: import cost per dependency and time to first rendered page.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --page "My Plan" --budget-render-ms 1500 --json startup.json
+
+Every sample runs in a fresh interpreter so nothing is warm. Two measurements:
+
+* imports: ``python -X importtime`` over the modules app.py pulls in
+  (STARTUP_IMPORTS), reported per module (cumulative microseconds, as printed
+  by CPython). Interpreter bootstrap imports (site, encodings, ...) are left out.
+* first render: a headless ``streamlit.testing`` AppTest of app/app.py, timed
+  by the parent from spawning the interpreter to the end of the first script
+  run, and inside the child from before ``import streamlit``; plus one warm
+  rerun in the same process.
+
+The script exits with status 1 when the median import total or process start
+-> rendered time exceeds its budget, so it can gate
+a deploy. Budgets can also come from STARTUP_BUDGET_IMPORT_MS and
+STARTUP_BUDGET_RENDER_MS.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, "app")
+
+# what app.py (and its first page) imports before anything is drawn
+STARTUP_IMPORTS = ["streamlit", "streamlit_option_menu", "engine", "records", "store", "views", "views.common"]
+
+DEFAULT_BUDGET_IMPORT_MS = float(os.environ.get("STARTUP_BUDGET_IMPORT_MS", 2000))
+DEFAULT_BUDGET_RENDER_MS = float(os.environ.get("STARTUP_BUDGET_RENDER_MS", 3000))
+
+_RENDER_CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+import streamlit_option_menu
+t1 = time.perf_counter()
+if PAGE:
+    streamlit_option_menu.option_menu = lambda *a, **k: PAGE
+at = AppTest.from_file(APP, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+rendered_at = time.time()
+at.run()
+t3 = time.perf_counter()
+print(json.dumps({
+    "exceptions": [str(e.value) for e in at.exception],
+    "import_streamlit_ms": (t1 - t0) * 1000,
+    "first_render_ms": (t2 - t0) * 1000,
+    "first_run_ms": (t2 - t1) * 1000,
+    "warm_rerun_ms": (t3 - t2) * 1000,
+    "rendered_at": rendered_at,
+    "loaded": sorted(m for m in ("pandas", "plotly.express", "numpy", "pyarrow") if m in sys.modules),
+}))
+"""
+
+
+def _child_env(db_dir: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [APP_DIR, env.get("PYTHONPATH")]))
+    env["STUDENT_DASHBOARD_DB"] = os.path.join(db_dir, "startup.sqlite3")
+    return env
+
+
+def parse_importtime(stderr: str, modules: list[str]) -> dict[str, int]:
+    """Cumulative microseconds of each of `modules` from ``-X importtime`` output.
+
+    Only top-level lines count, so bootstrap imports (site, encodings, ...) and
+    modules nested under another one are not added twice or at all.
+    """
+    wanted = set(modules)
+    totals: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        stripped = name.lstrip()
+        if len(name) - len(stripped) > 1:
+            continue  # nested import, already counted in its parent's cumulative time
+        module = stripped.strip()
+        if module in wanted:
+            totals[module] = totals.get(module, 0) + int(cumulative)
+    return totals
+
+
+def measure_imports(modules: list[str], env: dict) -> dict[str, int]:
+    code = "\n".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return parse_importtime(proc.stderr, modules)
+
+
+def measure_render(page: str | None, env: dict) -> dict:
+    code = f"APP = {os.path.join(APP_DIR, 'app.py')!r}\nPAGE = {page!r}\n" + _RENDER_CHILD
+    spawned_at = time.time()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    if result["exceptions"]:
+        raise RuntimeError(f"app raised during first render: {result['exceptions'][0]}")
+    # wall clock across the two processes: includes interpreter start-up, which the child cannot time
+    result["process_to_render_ms"] = (result.pop("rendered_at") - spawned_at) * 1000
+    return result
+
+
+def run(page: str | None, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as db_dir:
+        env = _child_env(db_dir)
+        import_runs = [measure_imports(STARTUP_IMPORTS, env) for _ in range(repeat)]
+        render_runs = [measure_render(page, env) for _ in range(repeat)]
+
+    per_module_ms = {name: statistics.median(r.get(name, 0) for r in import_runs) / 1000 for name in STARTUP_IMPORTS}
+    return {
+        "python": sys.version.split()[0],
+        "page": page or "default",
+        "repeat": repeat,
+        "imports_ms": dict(sorted(per_module_ms.items(), key=lambda kv: kv[1], reverse=True)),
+        "imports_total_ms": statistics.median(sum(r.values()) for r in import_runs) / 1000,
+        "import_streamlit_ms": statistics.median(r["import_streamlit_ms"] for r in render_runs),
+        "first_run_ms": statistics.median(r["first_run_ms"] for r in render_runs),
+        "first_render_ms": statistics.median(r["first_render_ms"] for r in render_runs),
+        "process_to_render_ms": statistics.median(r["process_to_render_ms"] for r in render_runs),
+        "warm_rerun_ms": statistics.median(r["warm_rerun_ms"] for r in render_runs),
+        "loaded_after_first_render": render_runs[0]["loaded"],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure app import time and time to first render.")
+    parser.add_argument("--page", default=None, help="page to render (default: the app's landing page)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-process samples per measurement (median is reported)")
+    parser.add_argument("--budget-import-ms", type=float, default=DEFAULT_BUDGET_IMPORT_MS, help="fail above this total import time")
+    parser.add_argument("--budget-render-ms", type=float, default=DEFAULT_BUDGET_RENDER_MS, help="fail above this time from process start to first render")
+    parser.add_argument("--json", dest="json_path", default=None, help="also write the results to this file")
+    parser.add_argument("--top", type=int, default=10, help="modules to list in the import breakdown")
+    args = parser.parse_args(argv)
+
+    try:
+        result = run(args.page, max(args.repeat, 1))
+    except RuntimeError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    result["budget_import_ms"] = args.budget_import_ms
+    result["budget_render_ms"] = args.budget_render_ms
+    failures = []
+    if result["imports_total_ms"] > args.budget_import_ms:
+        failures.append(f"imports {result['imports_total_ms']:.0f} ms > budget {args.budget_import_ms:.0f} ms")
+    if result["process_to_render_ms"] > args.budget_render_ms:
+        failures.append(f"first render {result['process_to_render_ms']:.0f} ms > budget {args.budget_render_ms:.0f} ms")
+    result["passed"] = not failures
+
+    print(f"Imports (cumulative, median of {result['repeat']}):")
+    for name, ms in list(result["imports_ms"].items())[: args.top]:
+        print(f"  {name:24s} {ms:8.1f} ms")
+    print(f"  {'total':24s} {result['imports_total_ms']:8.1f} ms  (budget {args.budget_import_ms:.0f} ms)")
+    print(f"First render ({result['page']}):")
+    print(f"  import streamlit + harness {result['import_streamlit_ms']:8.1f} ms")
+    print(f"  first script run           {result['first_run_ms']:8.1f} ms")
+    print(f"  import streamlit -> rendered {result['first_render_ms']:6.1f} ms")
+    print(f"  process start -> rendered  {result['process_to_render_ms']:8.1f} ms  (budget {args.budget_render_ms:.0f} ms)")
+    print(f"  warm rerun                 {result['warm_rerun_ms']:8.1f} ms")
+    print(f"  heavy modules loaded: {', '.join(result['loaded_after_first_render']) or 'none'}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())